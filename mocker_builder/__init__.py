@@ -1,5 +1,17 @@
-from .mocker_builder import MockerBuilder
+from .mocker_builder import MockerBuilder, MockerBuilderConfig
+from .benchmark import BenchmarkResult
+from .behavior import BehaviorProfile, Fixed, LogNormal, Percentiles, Uniform
+from .virtual_time import VirtualTimeEventLoop, VirtualTimeEventLoopPolicy
 
 __all__ = [
-    "MockerBuilder"
+    "MockerBuilder",
+    "MockerBuilderConfig",
+    "BehaviorProfile",
+    "BenchmarkResult",
+    "Fixed",
+    "LogNormal",
+    "Percentiles",
+    "Uniform",
+    "VirtualTimeEventLoop",
+    "VirtualTimeEventLoopPolicy",
 ]
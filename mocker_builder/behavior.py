@@ -0,0 +1,253 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Seeded latency and fault injection profiles for patched targets.
+###################################################################################################
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import math
+import random
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+ExceptionType = Union[Type[BaseException], BaseException]
+
+
+class LatencyDistribution(ABC):
+    """Base class of the latency distributions of a ``BehaviorProfile``.
+
+    Samples are drawn in bulk so the per call cost of a profile is just reading the next
+    precomputed value.
+    """
+
+    @abstractmethod
+    def sample(self, rng: random.Random, size: int) -> List[float]:
+        """Draw ``size`` latencies in seconds from ``rng``."""
+        raise NotImplementedError("Please, implement me!")
+
+
+@dataclass(frozen=True)
+class Fixed(LatencyDistribution):
+    """Same latency for every call.
+
+    Args:
+        seconds (float):
+            Latency in seconds.
+    """
+
+    seconds: float = 0.0
+
+    def sample(self, rng: random.Random, size: int) -> List[float]:
+        return [self.seconds] * size
+
+
+@dataclass(frozen=True)
+class Uniform(LatencyDistribution):
+    """Latency uniformly distributed between ``low`` and ``high`` seconds."""
+
+    low: float = 0.0
+    high: float = 0.0
+
+    def sample(self, rng: random.Random, size: int) -> List[float]:
+        uniform = rng.uniform
+        return [uniform(self.low, self.high) for _ in range(size)]
+
+
+@dataclass(frozen=True)
+class LogNormal(LatencyDistribution):
+    """Log-normal latency, the usual shape of service response times.
+
+    Args:
+        mu (float):
+            Mean of the underlying normal distribution, so ``exp(mu)`` is the median in seconds.
+
+        sigma (float):
+            Standard deviation of the underlying normal distribution.
+    """
+
+    mu: float = 0.0
+    sigma: float = 0.0
+
+    @classmethod
+    def from_median(cls, median: float, sigma: float) -> LogNormal:
+        return cls(mu=math.log(median), sigma=sigma)
+
+    def sample(self, rng: random.Random, size: int) -> List[float]:
+        lognormvariate = rng.lognormvariate
+        return [lognormvariate(self.mu, self.sigma) for _ in range(size)]
+
+
+@dataclass(frozen=True)
+class Percentiles(LatencyDistribution):
+    """Latency following a percentile table such as ``{50: .01, 95: .2, 99: .5, 100: 1.}``.
+
+    Latencies between the given points are linearly interpolated.
+
+    Args:
+        table (Dict[float, float]):
+            Latency in seconds by percentile from 0 to 100.
+    """
+
+    table: Dict[float, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.table:
+            raise ValueError("Percentiles table can't be empty")
+        for percentile in self.table:
+            if not 0 <= percentile <= 100:
+                raise ValueError(f"Invalid percentile {percentile}")
+
+    def sample(self, rng: random.Random, size: int) -> List[float]:
+        points = sorted(self.table.items())
+        if points[0][0] > 0:
+            points.insert(0, (0, 0.0))
+        quantiles = [percentile / 100 for percentile, _ in points]
+        latencies = [latency for _, latency in points]
+        last = len(points) - 1
+        result = []
+        for _ in range(size):
+            quantile = rng.random()
+            index = bisect_right(quantiles, quantile)
+            if index > last:
+                result.append(latencies[last])
+                continue
+            low, high = quantiles[index - 1], quantiles[index]
+            ratio = (quantile - low) / (high - low)
+            result.append(latencies[index - 1] + ratio * (latencies[index] - latencies[index - 1]))
+        return result
+
+
+class BehaviorSchedule:
+    """Deterministic stream of ``(latency, fault)`` pairs of a ``BehaviorProfile``.
+
+    The stream is refilled in batches of ``batch_size`` calls.
+    """
+
+    def __init__(self, profile: BehaviorProfile) -> None:
+        self._profile = profile
+        self._rng = random.Random(profile.seed)
+        self._faults: Tuple[ExceptionType, ...] = tuple(profile.errors)
+        thresholds, total = [], 0.0
+        for rate in profile.errors.values():
+            total += rate
+            thresholds.append(total)
+        self._thresholds = thresholds
+        self._latencies: List[float] = []
+        self._outcomes: List[Optional[ExceptionType]] = []
+        self._index = 0
+        self._consumed_calls = 0
+        self._consumed_latency = 0.0
+
+    def _refill(self):
+        self._consumed_calls += len(self._latencies)
+        self._consumed_latency += sum(self._latencies)
+        size = self._profile.batch_size
+        rng = self._rng
+        self._latencies = self._profile.latency.sample(rng, size)
+        if self._faults:
+            faults, thresholds, count = self._faults, self._thresholds, len(self._faults)
+            outcomes = []
+            for _ in range(size):
+                index = bisect_right(thresholds, rng.random())
+                outcomes.append(faults[index] if index < count else None)
+            self._outcomes = outcomes
+        else:
+            self._outcomes = [None] * size
+        self._index = 0
+
+    def __iter__(self) -> BehaviorSchedule:
+        return self
+
+    def __next__(self) -> Tuple[float, Optional[ExceptionType]]:
+        index = self._index
+        if index == len(self._latencies):
+            self._refill()
+            index = 0
+        self._index = index + 1
+        return self._latencies[index], self._outcomes[index]
+
+    @property
+    def calls(self) -> int:
+        return self._consumed_calls + self._index
+
+    @property
+    def simulated_latency(self) -> float:
+        """Sum of the latencies handed out so far, in seconds."""
+        return self._consumed_latency + sum(self._latencies[:self._index])
+
+
+@dataclass
+class BehaviorProfile:
+    """Latency and error profile of a patched target, reproducible under ``seed``.
+
+    .. code-block::
+        :caption: Example
+
+            self.mock_fetch = self.patch(
+                Client.fetch,
+                return_value={'status': 'ok'},
+                behavior=BehaviorProfile(
+                    latency=Percentiles({50: .02, 95: .3, 99: 1.2}),
+                    errors={TimeoutError: .01, ConnectionResetError: .002},
+                    seed=42
+                )
+            )
+
+    Args:
+        latency (Union[LatencyDistribution, float], optional):
+            Latency distribution, or fixed seconds. Defaults to no latency.
+
+        errors (Dict[ExceptionType, float], optional):
+            Rate of calls raising each exception type or instance. Rates must sum up to 1 at most.
+
+        seed (int, optional):
+            Seed of the random schedules. Without it every run draws different schedules.
+
+        batch_size (int, optional):
+            Number of calls drawn at once.
+
+        sleep (Callable[[float], None], optional):
+            How sync targets wait their latency. Defaults to ``time.sleep``. Async targets always
+            ``await asyncio.sleep`` so a ``VirtualTimeEventLoop`` makes it instantaneous.
+    """
+
+    latency: Union[LatencyDistribution, float] = None
+    errors: Dict[ExceptionType, float] = field(default_factory=dict)
+    seed: int = None
+    batch_size: int = 4096
+    sleep: Callable[[float], None] = time.sleep
+
+    def __post_init__(self):
+        if self.latency is None:
+            self.latency = Fixed(0.0)
+        elif not isinstance(self.latency, LatencyDistribution):
+            self.latency = Fixed(float(self.latency))
+        if any(rate < 0 for rate in self.errors.values()) or sum(self.errors.values()) > 1:
+            raise ValueError("Error rates must be positive and sum up to 1 at most")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+    def schedule(self) -> BehaviorSchedule:
+        """Start a new schedule from ``seed``."""
+        return BehaviorSchedule(self)
+
+
+__all__ = [
+    "BehaviorProfile",
+    "BehaviorSchedule",
+    "LatencyDistribution",
+    "Fixed",
+    "Uniform",
+    "LogNormal",
+    "Percentiles",
+]
@@ -0,0 +1,395 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Throughput and latency harness to drive the code under test against its patched dependencies.
+###################################################################################################
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import math
+import statistics
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+from unittest.mock import MagicMock
+from mock import AsyncMock
+
+from .memory import _child_mocks
+
+_CALIBRATION_ROUNDS = 5
+# Call records reset_mock clears on each mock of a tree, and the awaits of async mocks.
+_CALL_RECORDS = ('call_count', 'call_args', 'call_args_list', 'mock_calls', 'method_calls')
+_AWAIT_RECORDS = ('await_count', 'await_args', 'await_args_list')
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _mock_calls(mock: Any) -> int:
+    # mock_calls holds the calls of the whole mock tree, children and return values included.
+    calls = getattr(mock, 'mock_calls', None)
+    return len(calls) if isinstance(calls, list) else 0
+
+
+def _call_count(mock: Any) -> int:
+    # Calls of the patched mock itself, the ones a bare mock call costs as much as.
+    count = getattr(mock, 'call_count', 0)
+    return count if isinstance(count, int) else 0
+
+
+def _call_records(mock: Any) -> List[Tuple[Any, Dict[str, Any]]]:
+    records = []
+    seen = set()
+    nodes = [mock]
+    while nodes:
+        node = nodes.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        attrs = {}
+        # Getting a missing attribute of a mock would create a child instead.
+        names = _CALL_RECORDS + (_AWAIT_RECORDS if '_mock_await_count' in vars(node) else ())
+        for name in names:
+            value = getattr(node, name)
+            attrs[name] = list(value) if isinstance(value, list) else value
+        records.append((node, attrs))
+        nodes.extend(_child_mocks(node))
+    return records
+
+
+def _restore_calls(records: List[Tuple[Any, Dict[str, Any]]]):
+    for node, attrs in records:
+        for name, value in attrs.items():
+            if isinstance(value, list):
+                getattr(node, name).extend(value)
+            else:
+                setattr(node, name, value)
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and latency of the code under test, with the harness and mocks overhead out.
+
+    Args:
+        iterations (int):
+            Times the code under test ran.
+
+        concurrency (int):
+            Threads or tasks running it at the same time.
+
+        elapsed (float):
+            Wall time of the whole run in seconds.
+
+        calls_per_sec (float):
+            Iterations per second once the measured overhead is subtracted. Infinite when the code
+            under test does nothing but calling mocks.
+
+        raw_calls_per_sec (float):
+            Iterations per second as measured.
+
+        p50, p95, p99 (float):
+            Latency percentiles of one iteration in seconds, overhead subtracted.
+
+        overhead (float):
+            Seconds subtracted from each iteration: harness loop plus estimated mock calls cost.
+
+        mock_calls (Dict[str, int]):
+            Calls of each patched mock during the run, calls of its children left out.
+    """
+
+    iterations: int = 0
+    concurrency: int = 1
+    elapsed: float = 0.0
+    calls_per_sec: float = 0.0
+    raw_calls_per_sec: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    overhead: float = 0.0
+    mock_calls: Dict[str, int] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.iterations} iterations x{self.concurrency}: "
+            f"{self.calls_per_sec:,.0f} calls/s (raw {self.raw_calls_per_sec:,.0f}), "
+            f"p50 {self.p50 * 1e6:,.1f}us p95 {self.p95 * 1e6:,.1f}us "
+            f"p99 {self.p99 * 1e6:,.1f}us, overhead {self.overhead * 1e6:,.2f}us/iteration"
+        )
+
+
+class Benchmark:
+    """Harness running a callable many times against the active patches.
+
+    Iterations run in batches and only the mocks called in a batch have their call logs reset
+    before the next one, so the mocks don't grow while running. Calls recorded before the run are
+    set aside and put back after it. Before measuring, a calibration run with an empty callable
+    and with bare mocks estimates the cost that doesn't belong to the code under test.
+
+    Args:
+        mocks (Dict[str, Any]):
+            Active mocks by target path.
+
+        batch_size (int, optional):
+            Iterations between call logs resets. Defaults to 1000.
+
+        calibration_iterations (int, optional):
+            Iterations of the calibration runs. Defaults to 1000.
+    """
+
+    def __init__(
+        self,
+        mocks: Dict[str, Any],
+        batch_size: int = 1000,
+        calibration_iterations: int = 1000
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self._mocks = mocks
+        self._batch_size = batch_size
+        self._calibration_iterations = calibration_iterations
+
+    def _collect_calls(self, totals: Dict[str, int]):
+        for target_path, mock in self._mocks.items():
+            if _mock_calls(mock):
+                calls = _call_count(mock)
+                if calls:
+                    totals[target_path] = totals.get(target_path, 0) + calls
+                mock.reset_mock()
+
+    def _set_aside_calls(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        # Calls the test recorded before the run are put back once it's done.
+        records = []
+        for mock in self._mocks.values():
+            if _mock_calls(mock):
+                records.extend(_call_records(mock))
+                mock.reset_mock()
+        return records
+
+    def _batches(self, iterations: int) -> List[int]:
+        full, rest = divmod(iterations, self._batch_size)
+        return [self._batch_size] * full + ([rest] if rest else [])
+
+    @staticmethod
+    def _split(batch: int, concurrency: int) -> List[int]:
+        share, rest = divmod(batch, concurrency)
+        return [share + (1 if worker < rest else 0) for worker in range(concurrency)]
+
+    # ---------------------------------- sync ----------------------------------
+
+    @staticmethod
+    def _sync_worker(fn: Callable[[], Any], iterations: int) -> List[float]:
+        clock = time.perf_counter
+        samples = []
+        append = samples.append
+        for _ in range(iterations):
+            started = clock()
+            fn()
+            append(clock() - started)
+        return samples
+
+    def _sync_run(
+        self,
+        fn: Callable[[], Any],
+        iterations: int,
+        concurrency: int,
+        totals: Dict[str, int]
+    ) -> Tuple[List[float], float]:
+        samples: List[float] = []
+        started = time.perf_counter()
+        if concurrency == 1:
+            for batch in self._batches(iterations):
+                samples.extend(self._sync_worker(fn, batch))
+                self._collect_calls(totals)
+            return samples, time.perf_counter() - started
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for batch in self._batches(iterations):
+                futures = [
+                    executor.submit(self._sync_worker, fn, share)
+                    for share in self._split(batch, concurrency) if share
+                ]
+                for future in futures:
+                    samples.extend(future.result())
+                self._collect_calls(totals)
+        return samples, time.perf_counter() - started
+
+    def _calibration_rounds(self) -> List[int]:
+        rounds = min(_CALIBRATION_ROUNDS, self._calibration_iterations)
+        return self._split(self._calibration_iterations, rounds)
+
+    async def _async_mock_call_cost(self) -> float:
+        costs = []
+        for iterations in self._calibration_rounds():
+            bare = AsyncMock()
+            started = time.perf_counter()
+            for _ in range(iterations):
+                await bare()
+            costs.append((time.perf_counter() - started) / iterations)
+        return min(costs)
+
+    def _sync_mock_call_cost(self) -> float:
+        costs = []
+        for iterations in self._calibration_rounds():
+            bare = MagicMock()
+            started = time.perf_counter()
+            for _ in range(iterations):
+                bare()
+            costs.append((time.perf_counter() - started) / iterations)
+        return min(costs)
+
+    def _calls_per_iteration(
+        self,
+        totals: Dict[str, int],
+        iterations: int
+    ) -> Tuple[float, float]:
+        sync_calls = async_calls = 0.0
+        for target_path, calls in totals.items():
+            if asyncio.iscoroutinefunction(self._mocks[target_path]):
+                async_calls += calls / iterations
+            else:
+                sync_calls += calls / iterations
+        return sync_calls, async_calls
+
+    def _mocks_overhead(self, totals: Dict[str, int], iterations: int) -> float:
+        # Bare mocks of the same kind tell how much of each call is just mock bookkeeping.
+        sync_calls, async_calls = self._calls_per_iteration(totals, iterations)
+        overhead = sync_calls * self._sync_mock_call_cost() if sync_calls else 0.0
+        if async_calls:
+            loop = asyncio.new_event_loop()
+            try:
+                overhead += async_calls * loop.run_until_complete(self._async_mock_call_cost())
+            finally:
+                loop.close()
+        return overhead
+
+    async def _amocks_overhead(self, totals: Dict[str, int], iterations: int) -> float:
+        sync_calls, async_calls = self._calls_per_iteration(totals, iterations)
+        overhead = sync_calls * self._sync_mock_call_cost() if sync_calls else 0.0
+        if async_calls:
+            overhead += async_calls * await self._async_mock_call_cost()
+        return overhead
+
+    def _result(
+        self,
+        samples: List[float],
+        elapsed: float,
+        overhead: float,
+        concurrency: int,
+        totals: Dict[str, int]
+    ) -> BenchmarkResult:
+        iterations = len(samples)
+        ordered = sorted(max(sample - overhead, 0.0) for sample in samples)
+        adjusted_elapsed = elapsed - overhead * iterations / concurrency
+        return BenchmarkResult(
+            iterations=iterations,
+            concurrency=concurrency,
+            elapsed=elapsed,
+            calls_per_sec=iterations / adjusted_elapsed if adjusted_elapsed > 0 else math.inf,
+            raw_calls_per_sec=iterations / elapsed if elapsed else 0.0,
+            p50=_percentile(ordered, 50),
+            p95=_percentile(ordered, 95),
+            p99=_percentile(ordered, 99),
+            overhead=overhead,
+            mock_calls=totals,
+        )
+
+    def run(
+        self,
+        fn: Callable[[], Any],
+        iterations: int = 1000,
+        concurrency: int = 1
+    ) -> BenchmarkResult:
+        """Run ``fn`` ``iterations`` times spread over ``concurrency`` threads."""
+        if iterations < 1 or concurrency < 1:
+            raise ValueError("iterations and concurrency must be positive")
+        set_aside = self._set_aside_calls()
+        try:
+            calibration, _ = self._sync_run(
+                lambda: None, min(iterations, self._calibration_iterations), concurrency, {}
+            )
+            harness = statistics.median(calibration)
+
+            totals: Dict[str, int] = {}
+            samples, elapsed = self._sync_run(fn, iterations, concurrency, totals)
+        finally:
+            self._collect_calls({})
+            _restore_calls(set_aside)
+        overhead = harness + self._mocks_overhead(totals, iterations)
+        return self._result(samples, elapsed, overhead, concurrency, totals)
+
+    # --------------------------------- asyncio --------------------------------
+
+    @staticmethod
+    async def _async_worker(fn: Callable[[], Awaitable], iterations: int) -> List[float]:
+        clock = time.perf_counter
+        samples = []
+        append = samples.append
+        for _ in range(iterations):
+            started = clock()
+            await fn()
+            append(clock() - started)
+        return samples
+
+    async def _async_run(
+        self,
+        fn: Callable[[], Awaitable],
+        iterations: int,
+        concurrency: int,
+        totals: Dict[str, int]
+    ) -> Tuple[List[float], float]:
+        samples: List[float] = []
+        started = time.perf_counter()
+        for batch in self._batches(iterations):
+            results = await asyncio.gather(*[
+                self._async_worker(fn, share)
+                for share in self._split(batch, concurrency) if share
+            ])
+            for result in results:
+                samples.extend(result)
+            self._collect_calls(totals)
+        return samples, time.perf_counter() - started
+
+    async def arun(
+        self,
+        fn: Callable[[], Awaitable],
+        iterations: int = 1000,
+        concurrency: int = 1
+    ) -> BenchmarkResult:
+        """Await ``fn()`` ``iterations`` times from ``concurrency`` tasks on the running loop."""
+        if iterations < 1 or concurrency < 1:
+            raise ValueError("iterations and concurrency must be positive")
+
+        async def noop():
+            pass
+
+        set_aside = self._set_aside_calls()
+        try:
+            calibration, _ = await self._async_run(
+                noop, min(iterations, self._calibration_iterations), concurrency, {}
+            )
+            harness = statistics.median(calibration)
+
+            totals: Dict[str, int] = {}
+            samples, elapsed = await self._async_run(fn, iterations, concurrency, totals)
+        finally:
+            self._collect_calls({})
+            _restore_calls(set_aside)
+        overhead = harness + await self._amocks_overhead(totals, iterations)
+        return self._result(samples, elapsed, overhead, concurrency, totals)
+
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+]
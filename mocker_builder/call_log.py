@@ -0,0 +1,307 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Streaming of mock calls to JSONL or binary files by a background writer, and lazy reading.
+###################################################################################################
+from __future__ import annotations
+from dataclasses import dataclass, field
+import inspect
+import json
+import marshal
+import queue
+import struct
+import threading
+import time
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+_MAGIC = b"MBCALLS1"
+_LENGTH = struct.Struct('<I')
+_MAX_DEPTH = 8
+_CLOSE = None
+
+
+def _encode(value: Any, depth: int = 0) -> Any:
+    # Plain JSON and marshal friendly copy of a call argument, taken when the call happens so later
+    # changes to the argument don't leak into the log. Anything else is logged by its repr.
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if depth < _MAX_DEPTH:
+        if isinstance(value, (list, tuple)):
+            return [_encode(item, depth + 1) for item in value]
+        if isinstance(value, dict):
+            return {
+                key if isinstance(key, str) else repr(key): _encode(item, depth + 1)
+                for key, item in value.items()
+            }
+    try:
+        return repr(value)
+    except Exception:
+        return f"<{type(value).__name__}>"
+
+
+@dataclass
+class LoggedCall:
+    """Mock call read back from a call log.
+
+    Args:
+        seq (int):
+            Order of the call in the log.
+
+        time (float):
+            ``time.time`` of the call.
+
+        target (str):
+            Patched target called.
+
+        args (List[Any]):
+            Positional arguments, lists and tuples as lists and other objects as their repr.
+
+        kwargs (Dict[str, Any]):
+            Keyword arguments, encoded like ``args``.
+    """
+
+    seq: int = 0
+    time: float = 0.0
+    target: str = None
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+class CallLogWriter:
+    """Sink streaming the calls of the mocks patched with ``call_log`` to a file.
+
+    Calls are written as JSON lines or as length prefixed ``marshal`` records. They are batched by
+    the calling threads and written by a background thread. At most ``max_batches`` batches wait
+    for it, so a slow disk blocks the calls instead of growing the memory, and written batches are
+    dropped.
+
+    .. code-block::
+        :caption: Example
+
+            writer = CallLogWriter("calls.jsonl")
+            self.patch(Client.fetch, call_log=writer)
+            ...
+            writer.close()
+            fetches = list(CallLog("calls.jsonl").where("clients.Client.fetch"))
+
+    Args:
+        path (str):
+            File the calls are appended to. A ``ValueError`` is raised if it already holds calls
+            in the other format.
+
+        binary (bool):
+            Write compact ``marshal`` records instead of JSON lines.
+
+        batch_size (int):
+            Calls handed to the writer thread at once.
+
+        max_batches (int):
+            Batches waiting to be written before calls block.
+    """
+
+    _shared: Dict[str, CallLogWriter] = {}
+
+    def __init__(
+        self,
+        path: str,
+        binary: bool = False,
+        batch_size: int = 512,
+        max_batches: int = 8
+    ) -> None:
+        self.path = path
+        self.binary = binary
+        self.batch_size = batch_size
+        self.closed = False
+        self._batch: List[Tuple] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_batches)
+        self._error: Optional[BaseException] = None
+        self._file: BinaryIO = open(path, 'ab')
+        if self._file.tell() == 0:
+            if binary:
+                self._file.write(_MAGIC)
+        elif CallLogWriter._is_binary(path) != binary:
+            self._file.close()
+            raise ValueError(
+                f"Can't append {CallLogWriter._format(binary)} calls to the "
+                f"{CallLogWriter._format(not binary)} call log {path}"
+            )
+        self._thread = threading.Thread(
+            target=self._write_batches, name=f"mocker-builder call log {path}", daemon=True
+        )
+        self._thread.start()
+
+    @staticmethod
+    def _is_binary(path: str) -> bool:
+        with open(path, 'rb') as log_file:
+            return log_file.read(len(_MAGIC)) == _MAGIC
+
+    @staticmethod
+    def _format(binary: bool) -> str:
+        return "binary" if binary else "JSON lines"
+
+    @staticmethod
+    def shared(path: str, binary: bool = False) -> CallLogWriter:
+        """Writer of ``path`` shared by every patch logging to it, closed at the test teardown."""
+        writer = CallLogWriter._shared.get(path)
+        if writer is None or writer.closed:
+            writer = CallLogWriter._shared[path] = CallLogWriter(path, binary=binary)
+        elif writer.binary != binary:
+            raise ValueError(
+                f"The call log {path} is already written as {CallLogWriter._format(writer.binary)}"
+            )
+        return writer
+
+    @staticmethod
+    def close_shared():
+        writers = list(CallLogWriter._shared.values())
+        CallLogWriter._shared.clear()
+        for writer in writers:
+            writer.close()
+
+    def _write_batches(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is _CLOSE:
+                    return
+                if self._error is None:
+                    self._write(batch)
+            except BaseException as ex:
+                self._error = ex
+            finally:
+                self._queue.task_done()
+
+    def _write(self, batch: List[Tuple]):
+        if self.binary:
+            chunks = []
+            for record in batch:
+                data = marshal.dumps(record)
+                chunks.append(_LENGTH.pack(len(data)))
+                chunks.append(data)
+            self._file.write(b"".join(chunks))
+            return
+        self._file.write("".join(
+            json.dumps({
+                'seq': seq, 'time': called, 'target': target, 'args': args, 'kwargs': kwargs
+            }) + "\n"
+            for seq, called, target, args, kwargs in batch
+        ).encode())
+
+    def record(self, target: str, args: Tuple, kwargs: Dict[str, Any]):
+        called, args, kwargs = time.time(), _encode(args), _encode(kwargs)
+        with self._lock:
+            if self.closed:
+                return
+            self._seq += 1
+            self._batch.append((self._seq, called, target, args, kwargs))
+            if len(self._batch) < self.batch_size:
+                return
+            batch, self._batch = self._batch, []
+            # Blocks while max_batches are waiting, still holding the lock to keep the order.
+            self._queue.put(batch)
+
+    def wrap(self, target: str, side_effect: Callable) -> Callable:
+        """Side effect logging the call to ``target`` before applying ``side_effect``.
+
+        ``side_effect`` must take the call arguments.
+        """
+        record = self.record
+
+        def logged(*args, **kwargs):
+            record(target, args, kwargs)
+            return side_effect(*args, **kwargs)
+
+        if inspect.iscoroutinefunction(side_effect):
+            # Async mocks await just coroutine function side effects.
+            async def async_logged(*args, **kwargs):
+                return await logged(*args, **kwargs)
+            async_logged.call_log = self
+            return async_logged
+        logged.call_log = self
+        return logged
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self):
+        """Write the pending calls and wait for the writer thread to be done with them."""
+        with self._lock:
+            if self.closed:
+                return
+            batch, self._batch = self._batch, []
+            if batch:
+                self._queue.put(batch)
+        self._queue.join()
+        self._file.flush()
+        self._raise_error()
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        with self._lock:
+            self.closed = True
+            self._queue.put(_CLOSE)
+        self._thread.join()
+        self._file.close()
+        self._raise_error()
+
+    def __enter__(self) -> CallLogWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CallLog:
+    """Lazy reader of a file written by ``CallLogWriter``, JSON lines or binary alike.
+
+    Each iteration reads the file again, a call at a time.
+
+    Args:
+        path (str):
+            Call log file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __iter__(self) -> Iterator[LoggedCall]:
+        with open(self.path, 'rb') as log_file:
+            if log_file.read(len(_MAGIC)) != _MAGIC:
+                log_file.seek(0)
+                for line in log_file:
+                    yield LoggedCall(**json.loads(line))
+                return
+            while True:
+                header = log_file.read(_LENGTH.size)
+                if len(header) < _LENGTH.size:
+                    return
+                seq, called, target, args, kwargs = marshal.loads(
+                    log_file.read(_LENGTH.unpack(header)[0])
+                )
+                yield LoggedCall(seq=seq, time=called, target=target, args=args, kwargs=kwargs)
+
+    def where(self, target: str) -> Iterator[LoggedCall]:
+        """Iterate over the calls of ``target`` only."""
+        return (call for call in self if call.target == target)
+
+
+__all__ = [
+    "CallLog",
+    "CallLogWriter",
+    "LoggedCall",
+]
@@ -0,0 +1,173 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Caps on the child mocks a patched mock creates on attribute access and calls.
+###################################################################################################
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .memory import _is_mock
+
+CHILD_LIMIT_ACTIONS = ('raise', 'sentinel')
+# Looked up by asyncio.iscoroutinefunction, like mock_add_spec does on every attribute of the spec.
+_INTROSPECTED = frozenset(['_is_coroutine'])
+
+
+def _counted(name: str) -> bool:
+    return not (name.startswith('__') and name.endswith('__')) and name not in _INTROSPECTED
+
+
+class ChildMockLimitError(AttributeError):
+    """Raised creating a child mock past the limits of its patch.
+
+    It's an ``AttributeError``, like the one raised by sealed mocks, so ``hasattr`` and
+    ``getattr`` with a default stop there.
+    """
+
+
+class _ChildLimitSentinel:
+    """Shared stand-in given back past the limits.
+
+    Any attribute, call or await gives it back, recording nothing.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> _ChildLimitSentinel:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return self
+
+    def __call__(self, *args, **kwargs) -> _ChildLimitSentinel:
+        return self
+
+    def __await__(self):
+        return self
+        yield
+
+    def __iter__(self):
+        return iter(())
+
+    def __repr__(self) -> str:
+        return "<child mock limit reached>"
+
+
+CHILD_LIMIT_SENTINEL = _ChildLimitSentinel()
+
+
+def _limited_get_child_mock(self, **kw) -> Any:
+    # Set on the class mock makes for each instance, so it applies to one mock tree only.
+    cls = type(self)
+    limits: ChildMockLimits = cls._mock_child_limits
+    depth = cls._mock_child_depth + 1
+    name = kw.get('_new_name') or ''
+    if not _counted(name):
+        # Magic methods are a fixed set per mock, and introspected names are no user children:
+        # neither counted nor refused.
+        child = super(cls, self)._get_child_mock(**kw)
+        if _is_mock(child):
+            limits._install(child, depth, counted=False)
+        return child
+    if limits._exceeded(depth):
+        limits.limited += 1
+        if limits.on_limit == 'sentinel':
+            return CHILD_LIMIT_SENTINEL
+        raise ChildMockLimitError(
+            f"{self._extract_mock_name()}.{name}: child mock past "
+            f"{limits}."
+        )
+    child = super(cls, self)._get_child_mock(**kw)
+    if _is_mock(child):
+        limits._install(child, depth)
+    return child
+
+
+@dataclass
+class ChildMockLimits:
+    """Caps on the child mocks created under a mock, with counters of what was created.
+
+    Children are created by attribute access and return values. Magic methods are a fixed set per
+    mock, so they are neither counted nor refused, though the limits still apply below them.
+
+    Args:
+        max_depth (int):
+            Levels of child mocks below the patched mock, None for no limit.
+
+        max_children (int):
+            Child mocks in the whole tree, None for no limit.
+
+        on_limit (str):
+            ``raise`` a ``ChildMockLimitError`` past the limits, or give back the shared
+            ``CHILD_LIMIT_SENTINEL``.
+
+        created (int):
+            Child mocks in the tree so far.
+
+        deepest (int):
+            Deepest level of child mocks reached.
+
+        limited (int):
+            Child mock creations refused by the limits.
+    """
+
+    max_depth: Optional[int] = None
+    max_children: Optional[int] = None
+    on_limit: str = 'raise'
+    created: int = 0
+    deepest: int = 0
+    limited: int = 0
+
+    def _exceeded(self, depth: int) -> bool:
+        return any([
+            self.max_depth is not None and depth > self.max_depth,
+            self.max_children is not None and self.created >= self.max_children,
+        ])
+
+    def _install(self, mock: Any, depth: int, counted: bool = True):
+        cls = type(mock)
+        cls._get_child_mock = _limited_get_child_mock
+        cls._mock_child_limits = self
+        cls._mock_child_depth = depth
+        if depth and counted:
+            self.created += 1
+            self.deepest = max(self.deepest, depth)
+
+    def install(self, mock: Any):
+        """Limit ``mock`` and the child mocks it already has.
+
+        Those include the ones ``mock_configure`` created. The counters start over for a new
+        ``mock``, like the one a restarted or reconfigured patch gets.
+        """
+        if '_mock_child_limits' not in vars(type(mock)):
+            self.created = self.deepest = self.limited = 0
+        nodes = [(mock, 0, True)]
+        while nodes:
+            node, depth, counted = nodes.pop()
+            if '_mock_child_limits' in vars(type(node)):
+                continue
+            self._install(node, depth, counted)
+            children = vars(node).get('_mock_children', {})
+            nodes.extend(
+                (child, depth + 1, _counted(name))
+                for name, child in children.items() if _is_mock(child)
+            )
+            return_value = vars(node).get('_mock_return_value')
+            if _is_mock(return_value):
+                nodes.append((return_value, depth + 1, True))
+
+    def __str__(self) -> str:
+        limits = [
+            f"{name} {value}" for name, value in [
+                ('max_depth', self.max_depth),
+                ('max_children', self.max_children),
+            ] if value is not None
+        ]
+        return " and ".join(limits)
+
+
+__all__ = [
+    "CHILD_LIMIT_SENTINEL",
+    "ChildMockLimitError",
+    "ChildMockLimits",
+]
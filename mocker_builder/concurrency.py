@@ -0,0 +1,165 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# In-flight await accounting of async mocks, to catch code under test awaiting serially.
+###################################################################################################
+from __future__ import annotations
+import asyncio
+import inspect
+from typing import (
+    Callable,
+    List,
+)
+
+
+class _Await:
+    __slots__ = ('overlapped',)
+
+    def __init__(self, overlapped: bool) -> None:
+        self.overlapped = overlapped
+
+
+class ConcurrencyTracker:
+    """In-flight awaits of a mock patched with ``track_concurrency=True``.
+
+    Times are taken from the running event loop clock, so the latency simulated on a
+    ``VirtualTimeEventLoop`` is accounted in virtual seconds.
+
+    .. code-block::
+        :caption: Example
+
+            mock_fetch = self.patch(Client.fetch, latency=.1, track_concurrency=True)
+            await load_league()
+            mock_fetch.concurrency.assert_max_concurrency_at_least(3)
+
+    Args:
+        awaits (int):
+            Awaits of the mock so far.
+
+        peak (int):
+            Most awaits in flight at once.
+
+        overlapped (int):
+            Awaits which were in flight together with at least another one.
+
+        serialized_seconds (float):
+            Time with a single await in flight.
+
+        busy_seconds (float):
+            Time with any await in flight.
+    """
+
+    def __init__(self) -> None:
+        self.awaits = 0
+        self.peak = 0
+        self.overlapped = 0
+        self.serialized_seconds = 0.0
+        self.busy_seconds = 0.0
+        self._in_flight: List[_Await] = []
+        self._weighted_seconds = 0.0
+        self._started_in_flight = 0
+        self._last = 0.0
+
+    def _advance(self, now: float):
+        elapsed = now - self._last
+        in_flight = len(self._in_flight)
+        if in_flight:
+            self.busy_seconds += elapsed
+            self._weighted_seconds += in_flight * elapsed
+            if in_flight == 1:
+                self.serialized_seconds += elapsed
+        self._last = now
+
+    def _enter(self, now: float) -> _Await:
+        self._advance(now)
+        current = _Await(overlapped=bool(self._in_flight))
+        for other in self._in_flight:
+            if not other.overlapped:
+                other.overlapped = True
+                self.overlapped += 1
+        if current.overlapped:
+            self.overlapped += 1
+        self._in_flight.append(current)
+        self.awaits += 1
+        self._started_in_flight += len(self._in_flight)
+        self.peak = max(self.peak, len(self._in_flight))
+        return current
+
+    def _exit(self, now: float, current: _Await):
+        self._advance(now)
+        self._in_flight.remove(current)
+
+    def wrap(self, side_effect: Callable) -> Callable:
+        """Async side effect accounting the await while applying ``side_effect``.
+
+        ``side_effect`` must take the call arguments. The await yields to the event loop once
+        before applying it, so concurrent awaits overlap even when the mock has no latency.
+        """
+        async def tracked(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            current = self._enter(loop.time())
+            try:
+                await asyncio.sleep(0)
+                result = side_effect(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            finally:
+                self._exit(loop.time(), current)
+        tracked.concurrency = self
+        return tracked
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def average(self) -> float:
+        """Awaits in flight on average while any is.
+
+        When no loop time went by, like mocks with no latency, the average of the awaits in flight
+        as each one started.
+        """
+        if self.busy_seconds:
+            return self._weighted_seconds / self.busy_seconds
+        return self._started_in_flight / self.awaits if self.awaits else 0.0
+
+    def assert_max_concurrency_at_least(self, concurrency: int):
+        """Fail when fewer than ``concurrency`` awaits were ever in flight at once.
+
+        A lower peak means the code under test went back to awaiting one call after the other.
+        """
+        if self.peak < concurrency:
+            raise AssertionError(
+                f"Expected at least {concurrency} concurrent awaits, but the peak was "
+                f"{self.peak}.\n{self}"
+            )
+
+    def assert_max_concurrency_at_most(self, concurrency: int):
+        """Fail when more than ``concurrency`` awaits were in flight at once.
+
+        A higher peak means a semaphore is not limiting the code under test anymore.
+        """
+        if self.peak > concurrency:
+            raise AssertionError(
+                f"Expected at most {concurrency} concurrent awaits, but the peak was "
+                f"{self.peak}.\n{self}"
+            )
+
+    def reset(self):
+        self.__init__()
+
+    def __str__(self) -> str:
+        return (
+            f"{self.awaits} awaits, peak concurrency {self.peak}, average {self.average:.2f}, "
+            f"{self.overlapped} overlapped, {self.serialized_seconds:.3f}s serialized of "
+            f"{self.busy_seconds:.3f}s busy"
+        )
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self}>"
+
+
+__all__ = [
+    "ConcurrencyTracker",
+]
@@ -0,0 +1,167 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Dirty marks of patched mocks, so resets touch just the mocks used since they were patched.
+###################################################################################################
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+)
+
+from .memory import _is_mock
+
+
+class _Clean:
+    # Base of the call list classes of clean mocks, one by call list class of each mock flavour,
+    # unittest.mock and the backport.
+    __slots__ = ()
+
+
+_CLEAN_CALL_LISTS: Dict[type, type] = {}
+
+
+def _mark(calls: list):
+    # Back to the plain call list class: the mock is dirty and appending costs nothing extra.
+    calls.__class__ = type(calls)._plain
+
+
+def _clean_call_list(plain: type) -> type:
+    clean = _CLEAN_CALL_LISTS.get(plain)
+    if clean is None:
+        def append(self, item):
+            # Every call in a mock tree is appended to the root mock_calls, children included.
+            _mark(self)
+            plain.append(self, item)
+
+        clean = _CLEAN_CALL_LISTS[plain] = type(
+            f"Clean{plain.__name__}",
+            (_Clean, plain),
+            {'__slots__': (), 'append': append, '_plain': plain}
+        )
+    return clean
+
+
+def _dirty_setattr(self, name: str, value: Any):
+    # Set on the class mock makes for each instance: the first attribute set marks the mock dirty
+    # and takes the hook away again.
+    cls = type(self)
+    try:
+        del cls.__setattr__
+    except AttributeError:
+        # Another thread took the hook away first.
+        pass
+    calls = self.mock_calls
+    if isinstance(calls, _Clean):
+        _mark(calls)
+    setattr(self, name, value)
+
+
+def _tracked(mock: Any) -> Optional[Any]:
+    # Autospec functions keep their mock aside.
+    if not _is_mock(mock):
+        mock = getattr(mock, 'mock', None)
+    return mock if _is_mock(mock) else None
+
+
+@dataclass
+class DirtyStats:
+    """Work done and skipped by the resets of dirty tracked mocks.
+
+    Args:
+        checked (int):
+            Mocks looked at.
+
+        reset (int):
+            Dirty mocks reset.
+
+        skipped (int):
+            Clean mocks left untouched.
+    """
+
+    checked: int = 0
+    reset: int = 0
+    skipped: int = 0
+
+    @property
+    def skipped_ratio(self) -> float:
+        return self.skipped / self.checked if self.checked else 0.0
+
+    def add(self, other: DirtyStats):
+        self.checked += other.checked
+        self.reset += other.reset
+        self.skipped += other.skipped
+
+    def __str__(self) -> str:
+        return (
+            f"{self.reset} of {self.checked} mocks reset, {self.skipped} clean ones skipped "
+            f"({self.skipped_ratio:.0%})"
+        )
+
+
+class DirtyTracker:
+    """Dirty marks of the mocks created by ``Patcher.dispatch``.
+
+    A mock is clean until a call is recorded anywhere in its tree or an attribute of it is set,
+    which marks it dirty once and for all: the hooks take themselves away, so a dirty mock costs
+    nothing more than a plain one.
+    Resetting goes through the dirty mocks only and marks them clean again.
+
+    The mark is the class of the mock ``mock_calls`` list, a ``_CallList`` subclass while clean,
+    so checking it reads no more than that list.
+
+    Args:
+        stats (DirtyStats):
+            Work done and skipped by every reset so far.
+    """
+
+    stats: DirtyStats = DirtyStats()
+
+    @staticmethod
+    def arm(mock: Any):
+        """Mark ``mock`` clean, keeping the calls it recorded so far."""
+        mock = _tracked(mock)
+        if mock is None:
+            return
+        calls = mock.mock_calls
+        if not isinstance(calls, _Clean):
+            calls.__class__ = _clean_call_list(type(calls))
+        type(mock).__setattr__ = _dirty_setattr
+
+    @staticmethod
+    def is_dirty(mock: Any) -> bool:
+        """Whether ``mock`` was used since it was armed. Mocks not tracked are always dirty."""
+        mock = _tracked(mock)
+        if mock is None:
+            return True
+        return not isinstance(mock.mock_calls, _Clean)
+
+    @staticmethod
+    def reset(mocks: Iterable[Any]) -> DirtyStats:
+        """``reset_mock`` the dirty ones of ``mocks`` and mark them clean again.
+
+        Objects which are not mocks, like ``new`` replacements, are skipped without being counted.
+        """
+        stats = DirtyStats()
+        for mock in mocks:
+            mock = _tracked(mock)
+            if mock is None:
+                continue
+            stats.checked += 1
+            if isinstance(mock.mock_calls, _Clean):
+                stats.skipped += 1
+                continue
+            mock.reset_mock()
+            DirtyTracker.arm(mock)
+            stats.reset += 1
+        DirtyTracker.stats.add(stats)
+        return stats
+
+
+__all__ = [
+    "DirtyStats",
+    "DirtyTracker",
+]
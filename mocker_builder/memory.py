@@ -0,0 +1,277 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# tracemalloc based memory accounting of patches and fixtures per test.
+###################################################################################################
+from __future__ import annotations
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import sys
+import tracemalloc
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+import unittest.mock
+
+import mock as mock_backport
+
+_MOCK_TYPES = (unittest.mock.NonCallableMock, mock_backport.NonCallableMock)
+_CALL_LISTS = ('call_args_list', 'mock_calls', 'method_calls')
+# Reports of the last finished tests kept around, older ones were printed already.
+_KEPT_REPORTS = 100
+
+
+def _is_mock(obj: Any) -> bool:
+    return isinstance(obj, _MOCK_TYPES)
+
+
+def _child_mocks(node: Any) -> Iterator[Any]:
+    # Only the children created so far: touching attributes of a mock would create new ones.
+    for child in vars(node).get('_mock_children', {}).values():
+        if _is_mock(child):
+            yield child
+    return_value = vars(node).get('_mock_return_value')
+    if _is_mock(return_value):
+        yield return_value
+
+
+def _call_list(node: Any, name: str) -> list:
+    attrs = vars(node)
+    return attrs.get(f'_mock_{name}', attrs.get(name, []))
+
+
+def _sizeof(obj: Any, seen: Set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    try:
+        return sys.getsizeof(obj)
+    except TypeError:  # objects like mocks with a faulty __sizeof__
+        return 0
+
+
+def _call_log_bytes(calls: list, seen: Set[int]) -> int:
+    # Call lists, the calls and their arguments containers plus the arguments themselves, without
+    # following what the arguments reference.
+    size = _sizeof(calls, seen)
+    for call in calls:
+        size += _sizeof(call, seen)
+        for part in tuple(call)[-2:]:
+            size += _sizeof(part, seen)
+            values = part.values() if isinstance(part, dict) else part
+            for value in values:
+                if not _is_mock(value):
+                    size += _sizeof(value, seen)
+    return size
+
+
+@dataclass
+class TargetMemory:
+    """Memory attributed to a patched target.
+
+    Args:
+        target_path (str):
+            Patched target.
+
+        setup_bytes (int):
+            Memory allocated while the patch was created.
+
+        call_log_bytes (int):
+            Estimated memory held by the call logs of the mock and its children.
+
+        calls (int):
+            Calls recorded by the mock tree.
+
+        children (int):
+            Child mocks created under the mock, return values included.
+    """
+
+    target_path: str = None
+    setup_bytes: int = 0
+    call_log_bytes: int = 0
+    calls: int = 0
+    children: int = 0
+
+    @property
+    def retained_bytes(self) -> int:
+        return self.setup_bytes + self.call_log_bytes
+
+
+@dataclass
+class TestMemoryReport:
+    """Memory accounting of a test.
+
+    Args:
+        test (str):
+            Test node id.
+
+        targets (Dict[str, TargetMemory]):
+            Memory by patched target.
+
+        fixtures (Dict[str, int]):
+            Bytes allocated setting up each ``add_fixture`` value.
+
+        retained_bytes (int):
+            Traced memory growth from the test setup until just before its teardown.
+
+        leaked_bytes (int):
+            Traced memory growth still there after the teardown.
+
+        flagged (List[str]):
+            Targets whose call logs or child mocks grew past the configured thresholds.
+    """
+
+    __test__ = False
+
+    test: str = None
+    targets: Dict[str, TargetMemory] = field(default_factory=dict)
+    fixtures: Dict[str, int] = field(default_factory=dict)
+    retained_bytes: int = 0
+    leaked_bytes: int = 0
+    flagged: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.test}: retained {self.retained_bytes:,} bytes, "
+            f"leaked {self.leaked_bytes:,} bytes"
+        ]
+        for target in sorted(self.targets.values(), key=lambda t: -t.retained_bytes):
+            lines.append(
+                f"    {target.target_path}: {target.retained_bytes:,} bytes "
+                f"({target.calls} calls, {target.children} child mocks)"
+            )
+        for name, size in self.fixtures.items():
+            lines.append(f"    fixture {name}: {size:,} bytes")
+        return "\n".join(lines)
+
+
+class MemoryTracker:
+    """Per test memory accounting with ``tracemalloc``, enabled by ``MockerBuilderConfig``.
+
+    The allocations made while creating each patch and each ``add_fixture`` value are traced, and
+    call logs and child mocks held by each mock are measured just before the test teardown.
+
+    Args:
+        reports (Deque[TestMemoryReport]):
+            Reports of the last finished tests, in running order.
+
+        _report (TestMemoryReport):
+            Report of the running test, None while memory tracking is off.
+
+        _baseline (int):
+            Traced memory when the running test started.
+
+        _started_tracing (bool):
+            ``tracemalloc`` was started by the running test, so its teardown stops it.
+    """
+
+    reports: Deque[TestMemoryReport] = deque(maxlen=_KEPT_REPORTS)
+    _report: Optional[TestMemoryReport] = None
+    _baseline: int = 0
+    _started_tracing: bool = False
+
+    @staticmethod
+    def _current() -> int:
+        return tracemalloc.get_traced_memory()[0]
+
+    @staticmethod
+    def start(test: str) -> TestMemoryReport:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            MemoryTracker._started_tracing = True
+        MemoryTracker._report = TestMemoryReport(test=test)
+        MemoryTracker._baseline = MemoryTracker._current()
+        return MemoryTracker._report
+
+    @staticmethod
+    @contextmanager
+    def measure_target(target_path: str) -> Iterator[None]:
+        report = MemoryTracker._report
+        if report is None:
+            yield
+            return
+        before = MemoryTracker._current()
+        yield
+        target = report.targets.setdefault(target_path, TargetMemory(target_path=target_path))
+        target.setup_bytes += max(MemoryTracker._current() - before, 0)
+
+    @staticmethod
+    @contextmanager
+    def measure_fixture(name: str) -> Iterator[None]:
+        report = MemoryTracker._report
+        if report is None:
+            yield
+            return
+        before = MemoryTracker._current()
+        yield
+        report.fixtures[name] = report.fixtures.get(name, 0) + max(
+            MemoryTracker._current() - before, 0
+        )
+
+    @staticmethod
+    def collect(mocks: Dict[str, Any], max_calls: int, max_children: int):
+        """Measure the mocks of the running test before its teardown.
+
+        Args:
+            mocks (Dict[str, Any]):
+                Mocks by target path.
+
+            max_calls (int):
+                Calls recorded by a mock tree to flag it.
+
+            max_children (int):
+                Child mocks under a mock to flag it.
+        """
+        report = MemoryTracker._report
+        if report is None:
+            return
+        report.retained_bytes = MemoryTracker._current() - MemoryTracker._baseline
+        report.flagged = []
+        for target_path, mock in mocks.items():
+            if not _is_mock(mock):
+                continue
+            target = report.targets.setdefault(target_path, TargetMemory(target_path=target_path))
+            seen: Set[int] = set()
+            visited: Set[int] = set()
+            nodes, calls, size = [mock], 0, 0
+            while nodes:
+                node = nodes.pop()
+                # Mocks can be their own return value or child, like mock.return_value = mock.
+                if id(node) in visited:
+                    continue
+                visited.add(id(node))
+                for name in _CALL_LISTS:
+                    size += _call_log_bytes(_call_list(node, name), seen)
+                calls += len(_call_list(node, 'call_args_list'))
+                nodes.extend(_child_mocks(node))
+            children = len(visited) - 1
+            target.call_log_bytes, target.calls, target.children = size, calls, children
+            if calls > max_calls or children > max_children:
+                report.flagged.append(target_path)
+
+    @staticmethod
+    def finish() -> Optional[TestMemoryReport]:
+        """Close the running test report once its teardown is done."""
+        report, MemoryTracker._report = MemoryTracker._report, None
+        if report is None:
+            return None
+        report.leaked_bytes = MemoryTracker._current() - MemoryTracker._baseline
+        if MemoryTracker._started_tracing:
+            MemoryTracker._started_tracing = False
+            tracemalloc.stop()
+        MemoryTracker.reports.append(report)
+        return report
+
+
+__all__ = [
+    "MemoryTracker",
+    "TargetMemory",
+    "TestMemoryReport",
+]
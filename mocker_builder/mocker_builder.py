@@ -8,15 +8,26 @@
 ###################################################################################################
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from importlib import import_module
+import builtins
+from functools import partial
+import gc
 import inspect
-from types import ModuleType
+import threading
+import time
+from types import ModuleType, SimpleNamespace
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
+    Coroutine,
     Dict,
+    Generator,
     Generic,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     NewType,
     Optional,
@@ -33,6 +44,23 @@ from mock import AsyncMock
 from pytest_mock import MockFixture
 import pytest
 import warnings
+import weakref
+
+from .behavior import BehaviorProfile, BehaviorSchedule
+from .benchmark import Benchmark, BenchmarkResult
+from .call_log import CallLogWriter
+from .child_limits import CHILD_LIMIT_ACTIONS, ChildMockLimits
+from .concurrency import ConcurrencyTracker
+from .dirty import DirtyStats, DirtyTracker
+from .memory import MemoryTracker, _is_mock
+from .reference_index import ReferenceIndex
+from .resolver import TargetResolver
+from .scoped_patch import SCOPED_DISPATCHERS, ScopedDispatcher
+from .sweep import SweepCase, SweepCases, SweepResult
+from .spy import SPY_MODES, CallSpy, MonitorSpy, WrapperSpy, _code_of
+from .timeline import CallTimeline, call_digest
+from .timing import CallTimings
+from .usage import UsageTracker
 
 MockType = NewType('MockType', MagicMock)
 AsyncMockType = NewType('AsyncMockType', AsyncMock)
@@ -68,6 +96,68 @@ class MockerBuilderException(Exception):
         super().__init__(*args)
 
 
+@dataclass
+class MockerBuilderConfig:
+    """Optional features of a ``MockerBuilder`` test class.
+
+    They are set as its ``mocker_builder_config`` class attribute.
+
+    .. code-block::
+        :caption: Example
+
+            class TestJusticeLeague(MockerBuilder):
+                mocker_builder_config = MockerBuilderConfig(track_memory=True)
+
+    Args:
+        track_memory (bool):
+            Trace with ``tracemalloc`` the memory of each patch and ``add_fixture`` value and the
+            memory retained by each test. Reports are kept in ``MemoryTracker.reports``.
+
+        max_mock_calls (int):
+            Calls recorded by a mock, children included, to warn about it when tracking memory.
+
+        max_child_mocks (int):
+            Child mocks created under a mock to warn about it when tracking memory.
+
+        leak_check (bool):
+            Stop all patches at the test teardown and fail the test if any mock created by its
+            patches is still alive afterwards.
+
+        fork_server (bool):
+            Run ``mocker_builder_setup`` once for the whole class and each test in a process
+            forked from that warmed state, so tests are isolated by the fork instead of by
+            patching again. Needs the ``mocker_builder.runners`` pytest plugin and ``os.fork``,
+            tests run as usual otherwise. See ``ForkServerRunner``.
+
+        fork_batch_size (int):
+            Tests run by each forked process. Tests of a batch share the warmed mocks, just
+            their calls are reset between tests.
+
+        track_usage (bool):
+            Report the patches of ``mocker_builder_setup`` each test never called nor accessed,
+            with the setup time patching them just where used would save. Reports are kept in
+            ``UsageTracker.reports`` and printed when the session finishes.
+
+        usage_report (str):
+            Path to export the usage reports of the session to as JSON when tracking usage.
+
+        call_timeline (bool):
+            Record the calls of every mock of each test in one ordered ``CallTimeline``, to
+            assert the order of calls across mocks with ``assert_called_in_order``. Patches can
+            opt out with ``timeline=False``.
+    """
+
+    track_memory: bool = False
+    max_mock_calls: int = 10000
+    max_child_mocks: int = 1000
+    leak_check: bool = False
+    fork_server: bool = False
+    fork_batch_size: int = 1
+    track_usage: bool = False
+    usage_report: str = None
+    call_timeline: bool = False
+
+
 @dataclass
 class TMockMetadata:
     """Mock metadata structure to keep state of created mock and patcher for easily reset mock
@@ -95,6 +185,38 @@ class TMockMetadata:
             Flag to sinalize that mock is active. When set to False mock will be cleaned up after
             tested function finished.
 
+        latency: (float):
+            Seconds awaited by async mocks before giving back their result.
+
+        behavior: (BehaviorProfile):
+            Latency and fault injection profile applied on every mock call.
+
+        everywhere: (bool):
+            Patch every module global referencing the target as well.
+
+        timed: (bool):
+            Record the timestamp and the caller of each mock call.
+
+        track_concurrency: (bool):
+            Account the awaits of the async mock in flight at once.
+
+        call_log: (CallLogWriter):
+            Sink the mock calls are streamed to.
+
+        timeline: (bool):
+            Record the mock calls in the ``CallTimeline`` of the running test.
+
+        child_limits: (ChildMockLimits):
+            Caps on the child mocks created under the mock.
+
+        aliases: (List[_SetattrPatch]):
+            Patches of the module globals referencing the target, sharing its mock.
+
+        scope: (str):
+            ``task`` to patch the target just for the current asyncio task and the ones it
+            creates, ``thread`` just for the current thread. None patches it for the whole
+            process.
+
     """
     target_path: str = None
     is_async: bool = False
@@ -102,6 +224,16 @@ class TMockMetadata:
     _patch: _Patch = None
     _mock: _TMockType = None
     is_active: bool = False
+    latency: float = None
+    behavior: BehaviorProfile = None
+    everywhere: bool = False
+    timed: bool = False
+    track_concurrency: bool = False
+    call_log: CallLogWriter = None
+    timeline: bool = False
+    child_limits: ChildMockLimits = None
+    aliases: List[_SetattrPatch] = field(default_factory=list)
+    scope: str = None
 
     @property
     def return_value(self) -> ReturnValueType:
@@ -168,6 +300,531 @@ except ImportError:
     pass
 
 
+def _unwrap_futures(value: Any) -> Any:
+    # Async return values and side effects are stored wrapped in done futures by the dispatch.
+    if isinstance(value, asyncio.Future) and value.done() and not value.cancelled():
+        return value.result()
+    if isinstance(value, list):
+        return [_unwrap_futures(item) for item in value]
+    return value
+
+
+def _is_exception(obj: Any) -> bool:
+    return isinstance(obj, BaseException) or (
+        isinstance(obj, type) and issubclass(obj, BaseException)
+    )
+
+
+def _side_effect_iterator(side_effect: SideEffectType) -> SideEffectType:
+    # Iterable side effects are consumed one item per call, like mock does.
+    if side_effect is None or callable(side_effect) or _is_exception(side_effect):
+        return side_effect
+    return iter(side_effect)
+
+
+def _call_side_effect(side_effect: SideEffectType, args: Tuple, kwargs: Dict) -> Any:
+    """Apply ``side_effect`` the same way mock does.
+
+    ``DEFAULT`` is given back when there is no side effect, so the mock ``return_value`` is used.
+    """
+    if side_effect is None:
+        return DEFAULT
+    if _is_exception(side_effect):
+        raise side_effect
+    if not callable(side_effect):
+        result = next(side_effect)
+        if _is_exception(result):
+            raise result
+        return result
+    return side_effect(*args, **kwargs)
+
+
+def _latency_side_effect(latency: float, side_effect: SideEffectType) -> Callable:
+    """Async side effect awaiting ``latency`` seconds before applying ``side_effect``.
+
+    Running on a ``VirtualTimeEventLoop`` the latency costs no real time.
+    """
+    side_effect = _side_effect_iterator(side_effect)
+
+    async def delayed(*args, **kwargs):
+        await asyncio.sleep(latency)
+        result = _call_side_effect(side_effect, args, kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    return delayed
+
+
+def _default_side_effect(*args, **kwargs) -> Any:
+    return DEFAULT
+
+
+def _applied_side_effect(side_effect: SideEffectType) -> Callable:
+    """``side_effect`` as a callable applying it the same way mock does."""
+    if side_effect is None:
+        return _default_side_effect
+    if callable(side_effect) and not _is_exception(side_effect):
+        return side_effect
+    items = _side_effect_iterator(side_effect)
+
+    def applied(*args, **kwargs):
+        return _call_side_effect(items, args, kwargs)
+    return applied
+
+
+def _wrapped_side_effect(wrapper: Callable, side_effect: SideEffectType) -> Callable:
+    # Schedules and trackers of the inner side effects stay reachable from the outer one.
+    for name in ['schedule', 'concurrency', 'call_log', 'timeline']:
+        if hasattr(side_effect, name):
+            setattr(wrapper, name, getattr(side_effect, name))
+    return wrapper
+
+
+def _concurrency_side_effect(side_effect: SideEffectType) -> Callable:
+    """Async side effect accounting the in-flight awaits in a new ``ConcurrencyTracker``.
+
+    The awaits are accounted while applying ``side_effect``.
+    """
+    return _wrapped_side_effect(
+        ConcurrencyTracker().wrap(_applied_side_effect(side_effect)),
+        side_effect
+    )
+
+
+def _logged_side_effect(
+    call_log: CallLogWriter,
+    target_path: str,
+    side_effect: SideEffectType
+) -> Callable:
+    """Side effect streaming each call to ``call_log`` before applying ``side_effect``."""
+    return _wrapped_side_effect(
+        call_log.wrap(target_path, _applied_side_effect(side_effect)),
+        side_effect
+    )
+
+
+def _timeline_side_effect(target_path: str, side_effect: SideEffectType) -> Callable:
+    """Side effect appending each call to the ``CallTimeline`` of the running test.
+
+    The call is appended before applying ``side_effect``.
+    """
+    return _wrapped_side_effect(
+        CallTimeline.current().wrap(target_path, _applied_side_effect(side_effect)),
+        side_effect
+    )
+
+
+def _timed_side_effect(side_effect: SideEffectType) -> Callable:
+    """Side effect recording each call in new ``CallTimings`` before applying ``side_effect``."""
+    return _wrapped_side_effect(CallTimings().wrap(_applied_side_effect(side_effect)), side_effect)
+
+
+def _sweep_side_effect(cases: SweepCases, future: bool) -> Callable:
+    """Side effect giving back the swept value of the case each call belongs to.
+
+    Cases sweeping side effects apply the value as the side effect instead. Results are wrapped in
+    futures when ``future``, like the results of async targets with no wrapping side effect are.
+    """
+    def case_result(*args, **kwargs):
+        case = cases.current()
+        if case is None:
+            return DEFAULT
+        case.calls += 1
+        if cases.side_effects:
+            return _call_side_effect(case.effect, args, kwargs)
+        return case.value
+
+    if future:
+        def future_result(*args, **kwargs):
+            return _asyncio_future(case_result(*args, **kwargs))
+        return future_result
+    return case_result
+
+
+def _raise_fault(fault: Any):
+    if isinstance(fault, type):
+        raise fault()
+    raise fault
+
+
+def _behavior_side_effect(
+    behavior: BehaviorProfile,
+    side_effect: SideEffectType,
+    is_async: bool
+) -> Callable:
+    """Side effect drawing the latency and the fault of each call from a ``behavior`` schedule.
+
+    They are drawn before applying ``side_effect``.
+    """
+    schedule = behavior.schedule()
+    side_effect = _side_effect_iterator(side_effect)
+
+    if is_async:
+        async def async_behave(*args, **kwargs):
+            latency, fault = next(schedule)
+            if latency:
+                await asyncio.sleep(latency)
+            if fault is not None:
+                _raise_fault(fault)
+            result = _call_side_effect(side_effect, args, kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        async_behave.schedule = schedule
+        return async_behave
+
+    sleep = behavior.sleep
+
+    def behave(*args, **kwargs):
+        latency, fault = next(schedule)
+        if latency:
+            sleep(latency)
+        if fault is not None:
+            _raise_fault(fault)
+        return _call_side_effect(side_effect, args, kwargs)
+    behave.schedule = schedule
+    return behave
+
+
+class _PatchTargetNode:
+    __slots__ = ('children', 'entries', 'size')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _PatchTargetNode] = {}
+        self.entries: List[TMockMetadata] = []
+        # Number of entries kept by this node and all nodes below it, so we can answer
+        # "is anything patched under here?" without walking the subtree.
+        self.size: int = 0
+
+
+class PatchTargetTrie:
+    """Trie of active patches keyed by the dotted ``target_path`` parts.
+
+    Finding duplicates, parents and children of a target costs as much as the target path length.
+
+    .. code-block::
+        :caption: Example
+
+            trie = PatchTargetTrie()
+            trie.insert('test_cases.my_heroes.Robin', robin_metadata)
+            trie.ancestors('test_cases.my_heroes.Robin.get_my_hero_hobby')  # [robin_metadata]
+            trie.descendants('test_cases.my_heroes')  # [robin_metadata]
+    """
+
+    def __init__(self) -> None:
+        self._root = _PatchTargetNode()
+
+    def __len__(self) -> int:
+        return self._root.size
+
+    def _walk(self, target_path: str) -> List[_PatchTargetNode]:
+        node = self._root
+        nodes = [node]
+        for part in target_path.split('.'):
+            node = node.children.get(part)
+            if node is None:
+                break
+            nodes.append(node)
+        return nodes
+
+    def insert(self, target_path: str, mock_metadata: TMockMetadata):
+        node = self._root
+        node.size += 1
+        for part in target_path.split('.'):
+            node = node.children.setdefault(part, _PatchTargetNode())
+            node.size += 1
+        node.entries.append(mock_metadata)
+
+    def remove(self, target_path: str, mock_metadata: TMockMetadata) -> bool:
+        nodes = self._walk(target_path)
+        if len(nodes) != target_path.count('.') + 2:
+            return False
+        entries = nodes[-1].entries
+        for index, entry in enumerate(entries):
+            if entry is mock_metadata:
+                del entries[index]
+                break
+        else:
+            return False
+        for node in nodes:
+            node.size -= 1
+        # Pruning empty branches keeps the trie proportional to the active patches only.
+        parts = target_path.split('.')
+        for parent, node, part in reversed(list(zip(nodes, nodes[1:], parts))):
+            if node.size:
+                break
+            del parent.children[part]
+        return True
+
+    def find(self, target_path: str) -> List[TMockMetadata]:
+        nodes = self._walk(target_path)
+        if len(nodes) != target_path.count('.') + 2:
+            return []
+        return list(nodes[-1].entries)
+
+    def ancestors(self, target_path: str) -> List[TMockMetadata]:
+        nodes = self._walk(target_path)
+        if len(nodes) == target_path.count('.') + 2:
+            nodes = nodes[:-1]
+        return [entry for node in nodes for entry in node.entries]
+
+    def has_descendants(self, target_path: str) -> bool:
+        nodes = self._walk(target_path)
+        if len(nodes) != target_path.count('.') + 2:
+            return False
+        node = nodes[-1]
+        return node.size > len(node.entries)
+
+    def overlaps(self, target_path: str) -> bool:
+        """Whether the target itself, one of its parents or one of its children is patched."""
+        nodes = self._walk(target_path)
+        if len(nodes) == target_path.count('.') + 2 and nodes[-1].size:
+            return True
+        return any(node.entries for node in nodes[1:])
+
+    def descendants(self, prefix: str = None) -> List[TMockMetadata]:
+        """Active patches whose ``target_path`` starts with the module or class ``prefix``.
+
+        The patches of the prefix itself are included.
+        """
+        if prefix:
+            nodes = self._walk(prefix)
+            if len(nodes) != prefix.count('.') + 2:
+                return []
+            stack = [nodes[-1]]
+        else:
+            stack = [self._root]
+        result = []
+        while stack:
+            node = stack.pop()
+            result.extend(node.entries)
+            stack.extend(node.children.values())
+        return result
+
+    def clear(self):
+        self._root = _PatchTargetNode()
+
+
+class _PatchRecord:
+    """Registry entry of a started patch.
+
+    It keeps just what is needed to stop the patch, while the mock metadata and the mock itself are
+    only weakly referenced so they can be collected as soon as the test and its handles are gone.
+
+    Args:
+        _patch (_Patch):
+            Mocker `_patch` wrapper to stop the patch.
+
+        target_path (str):
+            Patched target.
+    """
+
+    __slots__ = ('_patch', 'target_path', '_metadata', '_mock')
+
+    def __init__(self, mock_metadata: TMockMetadata) -> None:
+        self._patch = mock_metadata._patch
+        self.target_path = mock_metadata.target_path
+        self._metadata = weakref.ref(mock_metadata)
+        self._mock = None
+        if mock_metadata.new is None or mock_metadata.new is DEFAULT:
+            try:
+                self._mock = weakref.ref(mock_metadata._mock)
+            except TypeError:
+                pass
+
+    @property
+    def metadata(self) -> Optional[TMockMetadata]:
+        return self._metadata()
+
+    @property
+    def mock(self) -> Optional[_TMockType]:
+        """Mock created by the patch, None if it was given as ``new`` or was already collected."""
+        return self._mock() if self._mock is not None else None
+
+    @property
+    def is_active(self) -> bool:
+        # mock.patch only holds is_local between start and stop.
+        return hasattr(self._patch, 'is_local')
+
+
+class _SetattrPatch:
+    """Direct save/setattr/restore replacement of a target attribute by a plain ``new`` value.
+
+    It follows ``mock.patch`` semantics without its machinery: the original is looked up in the
+    owner ``__dict__`` first, missing attributes need ``create`` and created ones are deleted on
+    stop.
+
+    Args:
+        owner_path (str):
+            Dotted path of the module or class owning the attribute.
+
+        attribute (str):
+            Attribute to replace.
+
+        new (Any):
+            Replacement value.
+
+        create (bool):
+            Allow replacing a missing attribute, deleted again on stop.
+    """
+
+    __slots__ = ('owner_path', 'attribute', 'new', 'create', 'target', 'temp_original', 'is_local')
+
+    def __init__(self, owner_path: str, attribute: str, new: Any, create: bool = False) -> None:
+        self.owner_path = owner_path
+        self.attribute = attribute
+        self.new = new
+        self.create = create
+
+    @staticmethod
+    def _resolve(owner_path: str) -> Any:
+        # Same lookup as mock.patch: attributes first, importing submodules not loaded yet.
+        return TargetResolver.lookup(owner_path)
+
+    def start(self) -> Any:
+        if hasattr(self, 'is_local'):
+            raise RuntimeError("Patch is already started")
+        target = self._resolve(self.owner_path)
+        name = self.attribute
+        original, local = DEFAULT, False
+        try:
+            original = target.__dict__[name]
+        except (AttributeError, KeyError):
+            original = getattr(target, name, DEFAULT)
+        else:
+            local = True
+        create = self.create or (name in vars(builtins) and isinstance(target, ModuleType))
+        if not create and original is DEFAULT:
+            raise AttributeError(f"{target} does not have the attribute {name!r}")
+        setattr(target, name, self.new)
+        self.target, self.temp_original, self.is_local = target, original, local
+        return self.new
+
+    def stop(self):
+        if not hasattr(self, 'is_local'):
+            return
+        target, name = self.target, self.attribute
+        if self.is_local and self.temp_original is not DEFAULT:
+            setattr(target, name, self.temp_original)
+        else:
+            delattr(target, name)
+            if not self.create and (not hasattr(target, name) or name in (
+                '__doc__', '__module__', '__defaults__', '__annotations__', '__kwdefaults__'
+            )):
+                # Proxy objects whose attribute was found through __getattr__.
+                setattr(target, name, self.temp_original)
+        del self.target, self.temp_original, self.is_local
+
+
+class _ScopedPatch:
+    """Patch of a target shared by scopes, like asyncio tasks or threads.
+
+    The first one started on a target replaces it by a ``ScopedDispatcher`` and the last one
+    stopped, from any thread, puts the original back. Each start creates a new mock, as
+    ``mock.patch`` does, visible just to the scope which started it.
+
+    Args:
+        target_path (str):
+            Patched target.
+
+        scope (str):
+            Scope name of the ``ScopedDispatcher`` to install.
+
+        patch_kwargs (MockMetadataKwargsType):
+            ``mock.patch`` keyword arguments to create the mock.
+
+        mock_module (ModuleType):
+            Module providing ``mock.patch``.
+    """
+
+    __slots__ = ('target_path', 'scope', 'patch_kwargs', 'mock_module', '_activation', 'is_local')
+    # Installed dispatchers by target path: the owner patch, the dispatcher and its users count.
+    _installed: Dict[str, List] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        target_path: str,
+        scope: str,
+        patch_kwargs: MockMetadataKwargsType,
+        mock_module: ModuleType
+    ) -> None:
+        self.target_path = target_path
+        self.scope = scope
+        self.patch_kwargs = patch_kwargs
+        self.mock_module = mock_module
+
+    @staticmethod
+    def _original(owner: Any, attribute: str) -> Any:
+        # Raw class attributes, so staticmethods and classmethods are kept as they are.
+        if inspect.isclass(owner):
+            klass = TargetResolver.owner_of(owner, attribute)
+            if klass is not None:
+                return vars(klass)[attribute]
+        return getattr(owner, attribute)
+
+    def _install(self) -> ScopedDispatcher:
+        with _ScopedPatch._lock:
+            installed = _ScopedPatch._installed.get(self.target_path)
+            if installed is None:
+                owner_path, attribute = self.target_path.rsplit('.', 1)
+                original = self._original(_SetattrPatch._resolve(owner_path), attribute)
+                dispatcher = SCOPED_DISPATCHERS[self.scope](self.target_path, original)
+                owner_patch = _SetattrPatch(owner_path, attribute, dispatcher)
+                owner_patch.start()
+                installed = _ScopedPatch._installed[self.target_path] = [
+                    owner_patch, dispatcher, 0
+                ]
+            elif installed[1].scope != self.scope:
+                raise MockerBuilderException(
+                    f"Target {self.target_path} is already patched with scope "
+                    f"{installed[1].scope!r}."
+                )
+            installed[2] += 1
+            return installed[1]
+
+    def _uninstall(self) -> ScopedDispatcher:
+        with _ScopedPatch._lock:
+            installed = _ScopedPatch._installed[self.target_path]
+            installed[2] -= 1
+            if not installed[2]:
+                installed[0].stop()
+                del _ScopedPatch._installed[self.target_path]
+            return installed[1]
+
+    def _new_mock(self, original: Any) -> Any:
+        # mock.patch on a stand-in holder creates the mock just like patching the target would.
+        attribute = self.target_path.rsplit('.', 1)[-1]
+        holder = SimpleNamespace(**{attribute: original})
+        kwargs = dict(self.patch_kwargs)
+        kwargs.pop('create', None)
+        patcher = self.mock_module.patch.object(holder, attribute, **kwargs)
+        mock = patcher.start()
+        patcher.stop()
+        return mock
+
+    def start(self) -> Any:
+        if hasattr(self, 'is_local'):
+            raise RuntimeError("Patch is already started")
+        dispatcher = self._install()
+        try:
+            mock = self._new_mock(dispatcher.original)
+        except Exception:
+            self._uninstall()
+            raise
+        self._activation = dispatcher.activate(mock)
+        # Set while started only, like mock.patch does.
+        self.is_local = True
+        return mock
+
+    def stop(self):
+        if not hasattr(self, 'is_local'):
+            return
+        del self.is_local
+        self._uninstall().deactivate(self._activation)
+        self._activation = None
+
+
 class Patcher:
     """Patch wrapper for the mocker.patch feature.
 
@@ -175,11 +832,109 @@ class Patcher:
         _mocker (MockFixture):
             mocker fixture keeper.
 
-        _mocked_metadata (List[TMockMetadata]):
-            Instances of patched mocks.
+        _mocked_metadata (List[_PatchRecord]):
+            Records of the patches started by the running test.
+
+        _active_targets (PatchTargetTrie):
+            Active patches indexed by ``target_path`` to detect duplicated and overlapped patches.
+
+        _restore_log (List[_SetattrPatch]):
+            Direct attribute replacements and spies started by the running test, unwound at
+            teardown.
+
+        _journals (List[List[Callable]]):
+            Undo logs of the open ``PatchSet.transaction`` blocks, innermost last.
+
+        _suspended (Dict[int, Any]):
+            Values installed by the patches ``PatchSet.suspended`` took out, by patch id.
     """
     _mocker: MockFixture = None
-    _mocked_metadata: List[TMockMetadata] = []
+    _mocked_metadata: List[_PatchRecord] = []
+    _active_targets: PatchTargetTrie = PatchTargetTrie()
+    _restore_log: List[Union[_SetattrPatch, _ScopedPatch, CallSpy]] = []
+    _journals: List[List[Callable]] = []
+    _suspended: Dict[int, Any] = {}
+
+    @staticmethod
+    def _journal(undo: Callable):
+        # Only the innermost transaction records: committing it hands its log to the outer one.
+        if Patcher._journals:
+            Patcher._journals[-1].append(undo)
+
+    @staticmethod
+    def active_patches(prefix: str = None) -> List[TMockMetadata]:
+        """Active patches under a module or class ``prefix``, or all of them without prefix.
+
+        Args:
+            prefix (str, optional):
+                Dotted module or class path such as ``test_cases.my_heroes.Robin``.
+
+        Returns:
+            List[TMockMetadata]:
+                Mock metadata of the active patches found.
+        """
+        return Patcher._active_targets.descendants(prefix)
+
+    @staticmethod
+    def _patch_options(mock_metadata: TMockMetadata) -> Tuple:
+        # Options applied around the mock itself, out of the patch kwargs. Child limits count what
+        # was created, so just the limits are compared.
+        limits = mock_metadata.child_limits
+        return (
+            mock_metadata.latency,
+            mock_metadata.behavior,
+            mock_metadata.everywhere,
+            mock_metadata.scope,
+            mock_metadata.timed,
+            mock_metadata.timeline,
+            mock_metadata.track_concurrency,
+            mock_metadata.call_log.path if mock_metadata.call_log is not None else None,
+            (limits.max_depth, limits.max_children, limits.on_limit) if limits else None,
+        )
+
+    @staticmethod
+    def _unwrapped_kwargs(mock_metadata: TMockMetadata) -> MockMetadataKwargsType:
+        # Futures compare by identity, so the results the dispatch wrapped are compared unwrapped.
+        return {key: _unwrap_futures(value) for key, value in mock_metadata.patch_kwargs.items()}
+
+    @staticmethod
+    def _same_patch(mock_metadata: TMockMetadata, other: TMockMetadata) -> bool:
+        try:
+            return all([
+                mock_metadata.is_async == other.is_async,
+                Patcher._unwrapped_kwargs(mock_metadata) == Patcher._unwrapped_kwargs(other),
+                Patcher._patch_options(mock_metadata) == Patcher._patch_options(other)
+            ])
+        except Exception:
+            return False
+
+    @staticmethod
+    def _check_overlaps(mock_metadata: TMockMetadata) -> Optional[TMockMetadata]:
+        # Exact duplicates are merged onto the already active mock. Overlaps just warn users since
+        # the result depends on the order the patches are started and stopped.
+        target_path = mock_metadata.target_path
+        for active in Patcher._active_targets.find(target_path):
+            # The target now resolves to the active mock, so only the active patch knows it was async.
+            mock_metadata.is_async = mock_metadata.is_async or active.is_async
+            if Patcher._same_patch(active, mock_metadata):
+                return active
+            MockerBuilderWarning.warn(
+                f"Target {target_path} is already patched with different parameters. "
+                "The new patch will shadow the active one until it's stopped."
+            )
+        for active in Patcher._active_targets.ancestors(target_path):
+            MockerBuilderWarning.warn(
+                f"Target {target_path} overlaps the active patch of {active.target_path}."
+            )
+        if Patcher._active_targets.has_descendants(target_path):
+            MockerBuilderWarning.warn(
+                f"Target {target_path} overlaps active patches of its own attributes: " + ", ".join(
+                    active.target_path
+                    for active in Patcher._active_targets.descendants(target_path)
+                    if active.target_path != target_path
+                )
+            )
+        return None
 
     @staticmethod
     def dispatch(mock_metadata: TMockMetadata) -> TMocker.PatchType:
@@ -195,7 +950,15 @@ class Patcher:
             TMocker.PatchType:
                 Our Mock Patch Type wrapper.
         """
-        if mock_metadata.is_async:
+        if not mock_metadata.is_active:
+            duplicated = Patcher._check_overlaps(mock_metadata)
+            if duplicated:
+                return TMocker.PatchType(
+                    duplicated,
+                    shared=True
+                )
+
+        if mock_metadata.is_async and not Patcher._wraps_side_effect(mock_metadata):
             mock_metadata.return_value = _asyncio_future(
                 mock_metadata.return_value
             )
@@ -215,17 +978,36 @@ class Patcher:
         if mock_metadata.is_active:
             mock_metadata._mock.configure_mock(
                 return_value=mock_metadata.return_value,
-                side_effect=mock_metadata.side_effect
+                side_effect=Patcher._side_effect(mock_metadata)
             )
             return TMocker.PatchType(
                 mock_metadata
             )
 
-        _patch = Patcher._mocker.mock_module.patch(
-            mock_metadata.target_path,
-            **mock_metadata.patch_kwargs
-        )
-        _mocked = _patch.start()
+        alias_paths = Patcher._alias_paths(mock_metadata) if mock_metadata.everywhere else []
+        if mock_metadata.scope:
+            _patch = _ScopedPatch(
+                mock_metadata.target_path,
+                mock_metadata.scope,
+                dict(Patcher._patch_kwargs(mock_metadata)),
+                Patcher._mocker.mock_module
+            )
+            _mocked = _patch.start()
+            Patcher._restore_log.append(_patch)
+        elif Patcher._is_plain_replacement(mock_metadata):
+            owner_path, attribute = mock_metadata.target_path.rsplit('.', 1)
+            _patch = _SetattrPatch(
+                owner_path, attribute, mock_metadata.new, bool(mock_metadata.create)
+            )
+            _mocked = _patch.start()
+            Patcher._restore_log.append(_patch)
+        else:
+            _patch = Patcher._mocker.mock_module.patch(
+                mock_metadata.target_path,
+                **Patcher._patch_kwargs(mock_metadata)
+            )
+            _mocked = _patch.start()
+            Patcher._mocker._patches.append(_patch)
         if all([
             mock_metadata.new == DEFAULT,
             not mock_metadata.new_callable,
@@ -233,12 +1015,21 @@ class Patcher:
             not mock_metadata.autospec
         ]):
             _mocked.mock_add_spec(spec=_mocked)
+        Patcher._limit_children(mock_metadata, _mocked)
+        DirtyTracker.arm(_mocked)
 
         mock_metadata.is_active = True
-        Patcher._mocker._patches.append(_patch)
         mock_metadata._patch = _patch
         mock_metadata._mock = _mocked
-        Patcher._mocked_metadata.append(mock_metadata)
+        mock_metadata.aliases = [
+            _SetattrPatch(*alias_path.rsplit('.', 1), new=_mocked)
+            for alias_path in alias_paths
+        ]
+        Patcher._start_aliases(mock_metadata)
+        Patcher._mocked_metadata.append(_PatchRecord(mock_metadata))
+        if not mock_metadata.scope:
+            # Scoped patches don't shadow the target for the other scopes.
+            Patcher._active_targets.insert(mock_metadata.target_path, mock_metadata)
 
         if hasattr(_mocked, "reset_mock"):
             Patcher._mocker._mocks.append(_mocked)
@@ -249,32 +1040,255 @@ class Patcher:
         return _tmock_patch
 
     @staticmethod
-    def mock_configure(mock_metadata: TMockMetadata) -> TMocker.PatchType:
+    def _limit_children(mock_metadata: TMockMetadata, mocked: Any):
+        if mock_metadata.child_limits is None:
+            return
+        # Autospec functions keep their mock aside.
+        mock = mocked if _is_mock(mocked) else getattr(mocked, 'mock', None)
+        if _is_mock(mock):
+            mock_metadata.child_limits.install(mock)
+
+    @staticmethod
+    def _alias_paths(mock_metadata: TMockMetadata) -> List[str]:
+        # Looked up before patching, while module globals still reference the original target.
+        owner_path, attribute = mock_metadata.target_path.rsplit('.', 1)
+        try:
+            original = getattr(_SetattrPatch._resolve(owner_path), attribute)
+        except AttributeError:
+            return []
+        # The import hook of the index lives as long as the session of the test patching.
+        if FixtureCache._request is not None:
+            ReferenceIndex.uninstall_at_exit(FixtureCache._request.config)
+        return [
+            path for path in ReferenceIndex.references(original)
+            if path != mock_metadata.target_path
+        ]
+
+    @staticmethod
+    def _start_aliases(mock_metadata: TMockMetadata):
+        for alias in mock_metadata.aliases:
+            alias.new = mock_metadata._mock
+            alias.start()
+            Patcher._restore_log.append(alias)
+
+    @staticmethod
+    def _stop_aliases(mock_metadata: TMockMetadata):
+        for alias in reversed(mock_metadata.aliases):
+            alias.stop()
+
+    @staticmethod
+    def _is_plain_replacement(mock_metadata: TMockMetadata) -> bool:
+        # A plain ``new`` value needs none of mock.patch features, so it's just set and restored.
+        # Overlapped targets keep mock.patch so nested patches are unwound in the usual order.
+        if mock_metadata.new is None or mock_metadata.new is DEFAULT:
+            return False
+        if not set(mock_metadata.patch_kwargs) <= {'new', 'create'}:
+            return False
+        return not Patcher._active_targets.overlaps(mock_metadata.target_path)
+
+    @staticmethod
+    def _unwind():
+        """Restore the direct attribute replacements in one pass.
+
+        Patches started after one of them may have saved its value as their original, so every
+        registered patch is stopped in reverse order as well. ``mock.patch`` stop is a no-op for
+        patches already stopped.
+        """
+        if not Patcher._restore_log:
+            return
+        try:
+            for record in reversed(Patcher._mocked_metadata):
+                if record.is_active:
+                    record._patch.stop()
+            for _patch in reversed(Patcher._restore_log):
+                _patch.stop()
+        finally:
+            del Patcher._restore_log[:]
+
+    @staticmethod
+    def _wraps_side_effect(mock_metadata: TMockMetadata) -> bool:
+        return any([
+            mock_metadata.latency is not None,
+            mock_metadata.behavior is not None,
+            mock_metadata.track_concurrency
+        ])
+
+    @staticmethod
+    def _side_effect(mock_metadata: TMockMetadata) -> SideEffectType:
+        """User's ``side_effect`` wrapped by the mocker-builder features set on the patch.
+
+        The wrapped side effect is never stored in ``patch_kwargs`` so dispatching again doesn't
+        wrap it twice.
+        """
+        side_effect = mock_metadata.side_effect
+        if mock_metadata.latency is not None:
+            side_effect = _latency_side_effect(mock_metadata.latency, side_effect)
+        if mock_metadata.behavior is not None:
+            side_effect = _behavior_side_effect(
+                mock_metadata.behavior,
+                side_effect,
+                mock_metadata.is_async
+            )
+        if mock_metadata.track_concurrency:
+            side_effect = _concurrency_side_effect(side_effect)
+        if mock_metadata.call_log is not None:
+            side_effect = _logged_side_effect(
+                mock_metadata.call_log,
+                mock_metadata.target_path,
+                side_effect
+            )
+        if mock_metadata.timeline:
+            side_effect = _timeline_side_effect(mock_metadata.target_path, side_effect)
+        if mock_metadata.timed:
+            side_effect = _timed_side_effect(side_effect)
+        return side_effect
+
+    @staticmethod
+    def _patch_kwargs(mock_metadata: TMockMetadata) -> MockMetadataKwargsType:
+        if not any([
+            Patcher._wraps_side_effect(mock_metadata),
+            mock_metadata.timed,
+            mock_metadata.timeline,
+            mock_metadata.call_log is not None
+        ]):
+            return mock_metadata.patch_kwargs
+        patch_kwargs = dict(mock_metadata.patch_kwargs)
+        patch_kwargs['side_effect'] = Patcher._side_effect(mock_metadata)
+        # Timing and logging alone keep the mock type: their side effect is not a coroutine
+        # function.
+        if Patcher._wraps_side_effect(mock_metadata) and mock_metadata.is_async and not any([
+            mock_metadata.new_callable,
+            mock_metadata.autospec
+        ]):
+            # The wrapped side effect is a coroutine function, so it must be awaited by the mock.
+            patch_kwargs['new_callable'] = getattr(
+                Patcher._mocker.mock_module, 'AsyncMock', AsyncMock
+            )
+        return patch_kwargs
+
+    @staticmethod
+    def _unregister(mock_metadata: TMockMetadata):
+        """Stop the patch of ``mock_metadata`` and drop it from the running test registries."""
+        Patcher._stop_aliases(mock_metadata)
         mock_metadata._patch.stop()
         mock_metadata.is_active = False
+        Patcher._active_targets.remove(mock_metadata.target_path, mock_metadata)
+        if not isinstance(mock_metadata._patch, (_SetattrPatch, _ScopedPatch)):
+            try:
+                Patcher._mocker._patches.remove(mock_metadata._patch)
+            except ValueError:
+                print("Opss!", mock_metadata._patch, "Not found!")
+        Patcher._mocked_metadata[:] = [
+            record for record in Patcher._mocked_metadata
+            if record._patch is not mock_metadata._patch
+        ]
+
+    @staticmethod
+    def mock_configure(mock_metadata: TMockMetadata) -> TMocker.PatchType:
+        Patcher._unregister(mock_metadata)
         mock_configure = mock_metadata.patch_kwargs.pop('mock_configure')
         mock_metadata.patch_kwargs.update(mock_configure)
-        try:
-            Patcher._mocker._patches.remove(mock_metadata._patch)
-        except ValueError:
-            print("Opss!", mock_metadata._patch, "Not found!")
 
         return Patcher.dispatch(
             mock_metadata
         )
 
+    @staticmethod
+    def _restore_results(mock_metadata: TMockMetadata, patch_kwargs: MockMetadataKwargsType):
+        # Undo of set_result: the saved kwargs hold the results as dispatched, futures included.
+        mock_metadata.patch_kwargs = patch_kwargs
+        if mock_metadata.is_active:
+            mock_metadata._mock.configure_mock(
+                return_value=mock_metadata.return_value,
+                side_effect=Patcher._side_effect(mock_metadata)
+            )
+
+    @staticmethod
+    def _restore_configuration(
+        mock_metadata: TMockMetadata,
+        patch_kwargs: MockMetadataKwargsType
+    ):
+        # Undo of configure_mock, which patched the target again with a new mock.
+        was_active = mock_metadata.is_active
+        if was_active:
+            Patcher._unregister(mock_metadata)
+        mock_metadata.patch_kwargs = patch_kwargs
+        if was_active:
+            Patcher.dispatch(mock_metadata)
+
+    @staticmethod
+    def mocks() -> Dict[str, Any]:
+        """Map the mocks of the patches started by the running test, still alive, by target."""
+        return {
+            mock_metadata.target_path: mock_metadata._mock
+            for mock_metadata in Patcher.mocked_metadata()
+        }
+
+    @staticmethod
+    def reset_mocks() -> DirtyStats:
+        """Reset the call records of the mocks of the running test used since the last reset.
+
+        Mocks not used since they were patched or last reset are left untouched.
+        """
+        return DirtyTracker.reset(
+            mock_metadata._mock for mock_metadata in Patcher.mocked_metadata()
+        )
+
+    @staticmethod
+    def mocked_metadata() -> List[TMockMetadata]:
+        """Mock metadata of the patches started by the running test which are still alive."""
+        return [
+            record.metadata for record in Patcher._mocked_metadata
+            if record.metadata is not None
+        ]
+
     @staticmethod
     def _clean_up():
-        """Our way to clean up patched data from mocker fixture."""
+        """Our way to clean up patched data from mocker fixture.
+
+        Mocks are released from their metadata as well, so handles kept by the test instance don't
+        keep them alive.
+        """
         print("\n######################## cleaning up ########################")
-        for mock_metadata in Patcher._mocked_metadata:
-            if not mock_metadata.is_active:
-                try:
-                    Patcher._mocker._patches.remove(mock_metadata._patch)
-                except ValueError:
-                    print("Opss!", mock_metadata._patch, "Not found!")
-                    pass
-        del Patcher._mocked_metadata[:]
+        try:
+            Patcher._unwind()
+            for record in Patcher._mocked_metadata:
+                if all([
+                    not record.is_active,
+                    not isinstance(record._patch, (_SetattrPatch, _ScopedPatch)),
+                    Patcher._mocker is not None
+                ]):
+                    try:
+                        Patcher._mocker._patches.remove(record._patch)
+                    except ValueError:
+                        print("Opss!", record._patch, "Not found!")
+                mock_metadata = record.metadata
+                if mock_metadata is not None:
+                    mock_metadata._mock = None
+        finally:
+            del Patcher._mocked_metadata[:]
+            Patcher._active_targets.clear()
+            del Patcher._journals[:]
+            Patcher._suspended.clear()
+            CallLogWriter.close_shared()
+            CallTimeline.finish()
+
+    @staticmethod
+    def _check_leaks(records: List[_PatchRecord]):
+        """Stop every patch and fail if any mock created by the test is still alive afterwards.
+
+        Raises:
+            MockerBuilderException:
+                Raised with the targets whose mocks survived the test teardown.
+        """
+        Patcher._mocker.stopall()
+        gc.collect()
+        leaked = [record.target_path for record in records if record.mock is not None]
+        if leaked:
+            raise MockerBuilderException(
+                f"Mocks survived the test teardown: {', '.join(leaked)}. Something outside the "
+                "test still references them, like a module global, a cache or a class attribute."
+            )
 
 
 @dataclass
@@ -336,6 +1350,128 @@ class TMockMetadataBuilder:
         if self._mock_metadata.target_path.rsplit('.', 1)[-1] in self._bypass_methods:
             self._mock_metadata.return_value = None
 
+    def __apply_latency(self, latency: Optional[float]):
+        if latency is None:
+            return
+        if not self._mock_metadata.is_async:
+            raise MockerBuilderException(
+                f"The latency option is only available for async targets and "
+                f"{self._mock_metadata.target_path} is not async."
+            )
+        if self._mock_metadata.new not in [None, DEFAULT]:
+            raise MockerBuilderException(
+                "The latency option can't be used together with the new option."
+            )
+        self._mock_metadata.latency = latency
+
+    def __apply_behavior(self, behavior: Optional[BehaviorProfile]):
+        if behavior is None:
+            return
+        if not isinstance(behavior, BehaviorProfile):
+            raise MockerBuilderException(
+                f"The behavior option must be a BehaviorProfile, not {type(behavior).__name__}."
+            )
+        if self._mock_metadata.new not in [None, DEFAULT]:
+            raise MockerBuilderException(
+                "The behavior option can't be used together with the new option."
+            )
+        self._mock_metadata.behavior = behavior
+
+    def __apply_timed(self, timed: bool):
+        if not timed:
+            return
+        if self._mock_metadata.new not in [None, DEFAULT]:
+            raise MockerBuilderException(
+                "The timed option can't be used together with the new option."
+            )
+        self._mock_metadata.timed = True
+
+    def __apply_timeline(self, timeline: Optional[bool]):
+        plain_mock = self._mock_metadata.new in [None, DEFAULT]
+        if timeline is None:
+            # Classes configured with call_timeline record every mock, plain values aside.
+            timeline = CallTimeline._every_patch and plain_mock
+        if not timeline:
+            return
+        if not plain_mock:
+            raise MockerBuilderException(
+                "The timeline option can't be used together with the new option."
+            )
+        self._mock_metadata.timeline = True
+
+    def __apply_track_concurrency(self, track_concurrency: bool):
+        if not track_concurrency:
+            return
+        if not self._mock_metadata.is_async:
+            raise MockerBuilderException(
+                f"The track_concurrency option is only available for async targets and "
+                f"{self._mock_metadata.target_path} is not async."
+            )
+        if self._mock_metadata.new not in [None, DEFAULT]:
+            raise MockerBuilderException(
+                "The track_concurrency option can't be used together with the new option."
+            )
+        self._mock_metadata.track_concurrency = True
+
+    def __apply_call_log(self, call_log: Optional[Union[str, CallLogWriter]]):
+        if call_log is None:
+            return
+        if self._mock_metadata.new not in [None, DEFAULT]:
+            raise MockerBuilderException(
+                "The call_log option can't be used together with the new option."
+            )
+        if isinstance(call_log, str):
+            call_log = CallLogWriter.shared(call_log)
+        if not isinstance(call_log, CallLogWriter):
+            raise MockerBuilderException(
+                f"The call_log option must be a path or a CallLogWriter, "
+                f"not {type(call_log).__name__}."
+            )
+        self._mock_metadata.call_log = call_log
+
+    def __apply_child_limits(
+        self,
+        max_depth: Optional[int],
+        max_children: Optional[int],
+        on_child_limit: str
+    ):
+        if max_depth is None and max_children is None:
+            return
+        for name, value in [('max_depth', max_depth), ('max_children', max_children)]:
+            if value is not None and (not isinstance(value, int) or value < 0):
+                raise MockerBuilderException(
+                    f"The {name} option must be a non negative int, not {value!r}."
+                )
+        if on_child_limit not in CHILD_LIMIT_ACTIONS:
+            raise MockerBuilderException(
+                f"Unknown on_child_limit {on_child_limit!r}. Available actions: "
+                f"{', '.join(CHILD_LIMIT_ACTIONS)}."
+            )
+        if self._mock_metadata.new not in [None, DEFAULT]:
+            raise MockerBuilderException(
+                "The max_depth and max_children options can't be used together with the new "
+                "option."
+            )
+        self._mock_metadata.child_limits = ChildMockLimits(
+            max_depth=max_depth,
+            max_children=max_children,
+            on_limit=on_child_limit
+        )
+
+    def __apply_scope(self, scope: Optional[str]):
+        if scope is None:
+            return
+        if scope not in SCOPED_DISPATCHERS:
+            raise MockerBuilderException(
+                f"Unknown patch scope {scope!r}. Available scopes: "
+                f"{', '.join(SCOPED_DISPATCHERS)}."
+            )
+        if self._mock_metadata.everywhere:
+            raise MockerBuilderException(
+                "The scope option can't be used together with the everywhere option."
+            )
+        self._mock_metadata.scope = scope
+
     def __unpack_params(self, mock_metadata_kwargs: MockMetadataKwargsType) -> Tuple:
         wanted_params = [
             'target', 'method', 'attribute', 'return_value', 'side_effect'
@@ -382,24 +1518,17 @@ class TMockMetadataBuilder:
             if inspect.isclass(target):
                 _target_path = tuple(filter(None, [
                     target.__module__,
-                    target.__name__,
+                    *target.__qualname__.split('.'),
                     attr
                 ]))
             elif inspect.isroutine(target):
-                try:
-                    klass, attr = target.__qualname__.rsplit('.', 1)
-                    _target_path = (target.__module__, klass, attr)
-                except ValueError:
-                    _target_path = (target.__module__, target.__name__)
+                # Qualified names keep the nesting of methods of nested classes.
+                _target_path = (target.__module__, *target.__qualname__.split('.'))
             elif inspect.ismodule(target):
                 _target_path = (target.__name__, attr)
             elif isinstance(target, str):
-                try:
-                    module, module_or_klass, attr = target.rsplit('.', 1)
-                    _target_path = (module, module_or_klass, attr)
-                except ValueError:
-                    module, attr = target.rsplit('.', 1)
-                    _target_path = (module, attr)
+                # Any depth, like package.module.Outer.Inner.method, resolved by TargetResolver.
+                _target_path = tuple(filter(None, [*target.split('.'), attr]))
             elif inspect.isdatadescriptor(target):
                 raise MockerBuilderException(
                     "### Sorry, but in the moment we are not prepared "
@@ -408,7 +1537,7 @@ class TMockMetadataBuilder:
             elif isinstance(target, object):
                 _target_path = tuple(filter(None, [
                     target.__module__,
-                    type(target).__name__,
+                    *type(target).__qualname__.split('.'),
                     attr
                 ]))
             else:
@@ -427,57 +1556,39 @@ class TMockMetadataBuilder:
             self._mock_metadata.target_path = mock_target_path
             self.__mock_kwargs_builder(kwargs)
             self.__apply_bypass_methods_return_value()
-            check_mock_target = self.__load_safe_mock_target_path_from_module(_target_path)
+            check_mock_target = self.__load_safe_mock_target_path_from_module(mock_target_path)
             if inspect.iscoroutinefunction(check_mock_target):
                 self._mock_metadata.is_async = True
+            self.__apply_latency(kwargs.get('latency'))
+            self.__apply_behavior(kwargs.get('behavior'))
+            self._mock_metadata.everywhere = bool(kwargs.get('everywhere'))
+            self.__apply_timed(kwargs.get('timed'))
+            self.__apply_timeline(kwargs.get('timeline'))
+            self.__apply_track_concurrency(kwargs.get('track_concurrency'))
+            self.__apply_call_log(kwargs.get('call_log'))
+            self.__apply_child_limits(
+                kwargs.get('max_depth'),
+                kwargs.get('max_children'),
+                kwargs.get('on_child_limit', 'raise')
+            )
+            self.__apply_scope(kwargs.get('scope'))
 
             return self._mock_metadata
         except Exception as ex:
             raise MockerBuilderException(ex)
 
-    def __load_safe_mock_target_path_from_module(self, safe_target_path: Tuple[str]):
-        # Here we just validate if our parsed target args are importable to be able to check in
+    def __load_safe_mock_target_path_from_module(self, safe_target_path: str):
+        # Here we just validate if our parsed target path is importable to be able to check in
         # the future if a method is async or not.
+        if '.' not in safe_target_path:
+            raise MockerBuilderException(
+                f"Target path {safe_target_path} must be a module attribute, like module.attribute."
+            )
         try:
-            try:
-                module_path, klass_or_module, attr = safe_target_path
-            except ValueError:
-                module_path, attr = safe_target_path
-                module = import_module(module_path)
-                try:
-                    module_attr = getattr(module, attr)
-                    if module_attr:
-                        return module_attr
-                    return module
-                except AttributeError as ex:
-                    if self._mock_metadata.create:
-                        return module
-                    raise MockerBuilderException(ex)
-
-            module = import_module(module_path)
-            is_klass = getattr(module, klass_or_module)
-            if inspect.isclass(is_klass):
-                try:
-                    klass_attr = getattr(is_klass, attr)
-                    if klass_attr:
-                        return klass_attr
-                    return is_klass
-                except AttributeError as ex:
-                    if self._mock_metadata.create:
-                        return is_klass
-                    raise MockerBuilderException(ex)
-
-            is_module = getattr(module, klass_or_module)
-            if inspect.ismodule(is_module):
-                try:
-                    module_attr = getattr(is_module, attr)
-                    if module_attr:
-                        return module_attr
-                    return is_module
-                except AttributeError as ex:
-                    if self._mock_metadata.create:
-                        return is_module
-                    raise MockerBuilderException(ex)
+            return TargetResolver.resolve(
+                safe_target_path,
+                create=bool(self._mock_metadata.create)
+            ).value
         except Exception as ex:
             raise MockerBuilderException(ex)
 
@@ -489,7 +1600,12 @@ class TMocker:
     def _patch(
         mock_metadata: TMockMetadata
     ) -> TMocker.PatchType:
-        return Patcher.dispatch(mock_metadata)
+        with MemoryTracker.measure_target(mock_metadata.target_path):
+            _tpatch = Patcher.dispatch(mock_metadata)
+        # Duplicated patches give back the active one, which was not started here.
+        if mock_metadata.is_active:
+            Patcher._journal(partial(Patcher._unregister, mock_metadata))
+        return _tpatch
 
     @dataclass(init=False)
     class _TPatch(Generic[_TMockType]):
@@ -501,11 +1617,17 @@ class TMocker:
 
             mock_metadata (TMockMetadata):
                 Mock metadata instance given from `TMockMetadataBuilder`.
+
+            shared (bool):
+                Handle of a duplicated patch merged onto an active one. Stopping it only releases
+                its own reference, the patch keeps running for its owner.
         """
         __mock_metadata: TMockMetadata = None
 
-        def __init__(self, mock_metadata: TMockMetadata) -> None:
+        def __init__(self, mock_metadata: TMockMetadata, shared: bool = False) -> None:
             self.__mock_metadata = mock_metadata
+            self.__shared = shared
+            self.__released = False
 
         @property
         def mock(self) -> MockType:
@@ -520,32 +1642,246 @@ class TMocker:
         def __exit__(self, exc_type, exc_val, exc_tb):
             self.stop()
 
-        def __get_mock(self) -> _TMockType:
-            return self.__mock_metadata._mock
+        def __get_mock(self) -> _TMockType:
+            return self.__mock_metadata._mock
+
+        @property
+        def behavior_schedule(self) -> Optional[BehaviorSchedule]:
+            """Schedule of the ``behavior`` profile, to check calls and simulated latency."""
+            return getattr(self.__get_mock().side_effect, 'schedule', None)
+
+        @property
+        def concurrency(self) -> Optional[ConcurrencyTracker]:
+            """In-flight awaits of the mock when patched with ``track_concurrency=True``."""
+            return getattr(self.__get_mock().side_effect, 'concurrency', None)
+
+        @property
+        def child_limits(self) -> Optional[ChildMockLimits]:
+            """Limits and counters of the child mocks.
+
+            They are set when patched with ``max_depth`` or ``max_children``.
+            """
+            return self.__mock_metadata.child_limits
+
+        @property
+        def call_log(self) -> Optional[CallLogWriter]:
+            """Sink the mock calls are streamed to when patched with ``call_log``."""
+            return getattr(self.__get_mock().side_effect, 'call_log', None)
+
+        @property
+        def target_path(self) -> str:
+            return self.__mock_metadata.target_path
+
+        @property
+        def timings(self) -> Optional[CallTimings]:
+            """Timestamps and callers of the mock calls when patched with ``timed=True``."""
+            return getattr(self.__get_mock().side_effect, 'timings', None)
+
+        def set_result(
+            self,
+            return_value: ReturnValueType = None,
+            side_effect: SideEffectType = None
+        ):
+            patch_kwargs = dict(self.__mock_metadata.patch_kwargs)
+            self.__mock_metadata.return_value = return_value
+            self.__mock_metadata.side_effect = side_effect
+            _tpath = Patcher.dispatch(
+                self.__mock_metadata
+            )
+            self.__mock_metadata = _tpath.__mock_metadata
+            Patcher._journal(partial(Patcher._restore_results, self.__mock_metadata, patch_kwargs))
+
+        def __start_sweep(self, side_effect: bool) -> Tuple[SweepCases, SweepResult, Dict]:
+            mock_metadata = self.__mock_metadata
+            if not mock_metadata.is_active:
+                raise MockerBuilderException(
+                    f"Can't sweep {mock_metadata.target_path}: its patch is not started."
+                )
+            if not _is_mock(self.__get_mock()) and not hasattr(self.__get_mock(), 'mock'):
+                raise MockerBuilderException(
+                    f"Can't sweep {mock_metadata.target_path}: it's patched with a plain new "
+                    "value, not a mock."
+                )
+            cases = SweepCases(side_effects=side_effect)
+            patch_kwargs = dict(mock_metadata.patch_kwargs)
+            mock_metadata.side_effect = _sweep_side_effect(cases, all([
+                mock_metadata.is_async,
+                not Patcher._wraps_side_effect(mock_metadata)
+            ]))
+            self.__get_mock().configure_mock(side_effect=Patcher._side_effect(mock_metadata))
+            return cases, SweepResult(target_path=mock_metadata.target_path), patch_kwargs
+
+        def __sweep_case(self, cases: SweepCases, index: int, value: Any) -> SweepCase:
+            return SweepCase(
+                index=index,
+                value=value,
+                effect=_side_effect_iterator(value) if cases.side_effects else None
+            )
+
+        def sweep(
+            self,
+            values: Iterable[Any],
+            body: Callable[[Any], Any],
+            side_effect: bool = False
+        ) -> SweepResult:
+            """Run ``body`` once for each of ``values`` as the ``return_value`` of this live patch.
+
+            With ``side_effect`` the values are its ``side_effect`` instead. Cases run without
+            patching again or running ``mocker_builder_setup`` for each case, like parametrizing
+            would. The mock alone is reset before each case and the failures of ``body`` are
+            collected, so every case runs. The patch results are restored afterwards, with new
+            ``timed``, ``track_concurrency`` and ``behavior`` trackers.
+
+            .. code-block::
+                :caption: Example
+
+                    def test_heroes_eating_anything(self):
+                        def eats(food):
+                            assert self.my_heroes.is_eating_banana() == food
+
+                        result = self.mock_eating_banana.sweep(["banana", "apple", None], eats)
+                        result.assert_passed()
+
+            Args:
+                values (Iterable[Any]):
+                    Return values, or side effects, one for each case.
+
+                body (Callable[[Any], Any]):
+                    Test body, called with the value of the case. Async targets need
+                    ``asweep``.
+
+                side_effect (bool, optional):
+                    Sweep side effects: exceptions, iterables and callables applied like mock
+                    does. Defaults to False.
+
+            Returns:
+                SweepResult:
+                    Each case with the calls of the mock it made and its error, if any.
+            """
+            if inspect.iscoroutinefunction(body):
+                raise MockerBuilderException(
+                    "Async sweep body. Please, use `await handle.asweep(...)` instead."
+                )
+            cases, result, patch_kwargs = self.__start_sweep(side_effect)
+            try:
+                for index, value in enumerate(values):
+                    case = self.__sweep_case(cases, index, value)
+                    DirtyTracker.reset([self.__get_mock()])
+                    cases.enter(case)
+                    try:
+                        body(value)
+                    except Exception as ex:
+                        case.error = ex
+                    result.cases.append(case)
+            finally:
+                cases.enter(None)
+                Patcher._restore_results(self.__mock_metadata, patch_kwargs)
+            return result
+
+        async def asweep(
+            self,
+            values: Iterable[Any],
+            body: Callable[[Any], Any],
+            side_effect: bool = False,
+            concurrency: int = 1
+        ) -> SweepResult:
+            """Async version of ``sweep``, awaiting ``body`` when it gives back an awaitable.
+
+            With ``concurrency`` above 1 up to that many cases run at once, each in its own task
+            which gets the value of its own case. The mock is then shared by the running cases, so
+            it's not reset between them, but each case still counts its own calls.
+
+            .. code-block::
+                :caption: Example
+
+                    @pytest.mark.asyncio
+                    async def test_hobbies(self):
+                        result = await self.mock_what_i_do.asweep(
+                            [HobbyHero("sing"), HobbyHero("dance")],
+                            self.check_hobby,
+                            concurrency=2
+                        )
+                        result.assert_passed()
+
+            Args:
+                concurrency (int, optional):
+                    Cases running at the same time. Defaults to 1.
+            """
+            if concurrency < 1:
+                raise MockerBuilderException("The sweep concurrency must be positive.")
+            cases, result, patch_kwargs = self.__start_sweep(side_effect)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def run(case: SweepCase):
+                async with semaphore:
+                    if concurrency == 1:
+                        DirtyTracker.reset([self.__get_mock()])
+                    cases.enter(case, task_local=concurrency > 1)
+                    try:
+                        outcome = body(case.value)
+                        if inspect.isawaitable(outcome):
+                            await outcome
+                    except Exception as ex:
+                        case.error = ex
 
-        def set_result(
-            self,
-            return_value: ReturnValueType = None,
-            side_effect: SideEffectType = None
-        ):
-            self.__mock_metadata.return_value = return_value
-            self.__mock_metadata.side_effect = side_effect
-            _tpath = Patcher.dispatch(
-                self.__mock_metadata
-            )
-            self.__mock_metadata = _tpath.__mock_metadata
+            try:
+                result.cases.extend(
+                    self.__sweep_case(cases, index, value) for index, value in enumerate(values)
+                )
+                if concurrency == 1:
+                    for case in result.cases:
+                        await run(case)
+                else:
+                    await asyncio.gather(*(run(case) for case in result.cases))
+            finally:
+                cases.enter(None)
+                Patcher._restore_results(self.__mock_metadata, patch_kwargs)
+            return result
 
         def start(self):
+            if self.__shared and self.__mock_metadata.is_active:
+                if self.__released:
+                    self.__released = False
+                    Patcher._journal(self.stop)
+                return
+            self.__shared = False
+            was_active = self.__mock_metadata.is_active
             self.__mock_metadata._mock = self.__mock_metadata._patch.start()
+            Patcher._limit_children(self.__mock_metadata, self.__mock_metadata._mock)
             self.__mock_metadata.is_active = True
+            if not any([was_active, self.__mock_metadata.scope]):
+                Patcher._start_aliases(self.__mock_metadata)
+                Patcher._active_targets.insert(
+                    self.__mock_metadata.target_path,
+                    self.__mock_metadata
+                )
+            if not was_active:
+                Patcher._journal(self.stop)
             print(f"Mock {self.__get_mock()} started")
+            # After printing it: the first str() of a MagicMock sets its __str__ child.
+            DirtyTracker.arm(self.__mock_metadata._mock)
 
         def stop(self):
+            if self.__shared:
+                if not self.__released:
+                    self.__released = True
+                    Patcher._journal(self.start)
+                return
+            was_active = self.__mock_metadata.is_active
+            # A suspended patch gets its value back first so it's restored as usual.
+            PatchSet._resume(self.__mock_metadata._patch)
+            Patcher._stop_aliases(self.__mock_metadata)
             self.__mock_metadata._patch.stop()
             self.__mock_metadata.is_active = False
+            Patcher._active_targets.remove(self.__mock_metadata.target_path, self.__mock_metadata)
+            if was_active:
+                Patcher._journal(self.start)
             print(f"Mock {self.__get_mock()} stopped")
 
         def configure_mock(self, **mock_configure: Dict):
+            patch_kwargs = dict(self.__mock_metadata.patch_kwargs)
+            if patch_kwargs.get('mock_configure'):
+                patch_kwargs['mock_configure'] = dict(patch_kwargs['mock_configure'])
             if self.__mock_metadata.mock_configure:
                 self.__mock_metadata.mock_configure.update(mock_configure)
             else:
@@ -555,19 +1891,479 @@ class TMocker:
                 self.__mock_metadata
             )
             self.__mock_metadata = _tpath.__mock_metadata
+            Patcher._journal(
+                partial(Patcher._restore_configuration, self.__mock_metadata, patch_kwargs)
+            )
 
     PatchType = _TPatch[_TMockType]
 
 
+class PatchTransaction:
+    """Undo log of a ``PatchSet.transaction`` block."""
+
+    def __init__(self) -> None:
+        self._undo: List[Callable] = []
+        self.committed = False
+
+    def commit(self):
+        """Keep the changes made in the block.
+
+        Inside another transaction they are handed to it, so it can still roll them back.
+        """
+        self.committed = True
+
+    def rollback(self):
+        """Undo the changes made so far in the block, the latest first."""
+        # Emptied in place: it's the log the open transaction block keeps recording into.
+        undo = list(self._undo)
+        del self._undo[:]
+        journals, Patcher._journals = Patcher._journals, []
+        errors = []
+        try:
+            for action in reversed(undo):
+                try:
+                    action()
+                except Exception as ex:
+                    errors.append(ex)
+        finally:
+            Patcher._journals = journals
+        if errors:
+            raise MockerBuilderException(*errors)
+
+
+class PatchSet:
+    """The patches of the running test handled as a whole, given by ``MockerBuilder.patches``.
+
+    .. code-block::
+        :caption: Example
+
+            def test_against_the_real_heroes(self):
+                with self.patches.suspended():
+                    assert Robin().just_says() == "Holy crap, Batman!"
+
+                with self.patches.transaction():
+                    self.my_hero.set_result(return_value="Just for a while")
+                    self.patch(Batman.eating_banana, return_value="Just for a while too")
+                # Both changes are rolled back here.
+    """
+
+    @staticmethod
+    def _swap_out(_patch: Any):
+        # Put the original back like mock.patch stop does, keeping the patch started.
+        if isinstance(_patch, _ScopedPatch):
+            _patch._activation.active = False
+            return
+        if _patch.is_local and _patch.temp_original is not DEFAULT:
+            setattr(_patch.target, _patch.attribute, _patch.temp_original)
+            return
+        delattr(_patch.target, _patch.attribute)
+        if not _patch.create and not hasattr(_patch.target, _patch.attribute):
+            setattr(_patch.target, _patch.attribute, _patch.temp_original)
+
+    @staticmethod
+    def _swap_in(_patch: Any, installed: Any):
+        if isinstance(_patch, _ScopedPatch):
+            _patch._activation.active = True
+        else:
+            setattr(_patch.target, _patch.attribute, installed)
+
+    @staticmethod
+    def _resume(_patch: Any):
+        if id(_patch) in Patcher._suspended:
+            PatchSet._swap_in(_patch, Patcher._suspended.pop(id(_patch)))
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Run the block against the original targets.
+
+        Active patches are taken out in one pass, keeping their mocks and configuration, and put
+        back when the block exits. Patches stopped inside the block stay stopped.
+        """
+        swapped = []
+        try:
+            for record in reversed(Patcher._mocked_metadata):
+                mock_metadata = record.metadata
+                if any([
+                    not record.is_active,
+                    mock_metadata is None,
+                    id(record._patch) in Patcher._suspended
+                ]):
+                    continue
+                for _patch, installed in [(record._patch, mock_metadata._mock)] + [
+                    (alias, alias.new) for alias in mock_metadata.aliases
+                ][::-1]:
+                    PatchSet._swap_out(_patch)
+                    Patcher._suspended[id(_patch)] = installed
+                    swapped.append(_patch)
+            yield
+        finally:
+            for _patch in reversed(swapped):
+                # Patches stopped in the block were already resumed by their stop.
+                if hasattr(_patch, 'is_local'):
+                    PatchSet._resume(_patch)
+                Patcher._suspended.pop(id(_patch), None)
+
+    @contextmanager
+    def transaction(self) -> Iterator[PatchTransaction]:
+        """Roll back the patches changed through mocker-builder inside the block when it exits.
+
+        Patches started, stopped or configured with ``patch``, ``start``, ``stop``, ``set_result``
+        and ``configure_mock`` are rolled back. Changes made on the mocks themselves are not
+        tracked. Call ``commit`` on the given ``PatchTransaction`` to keep the changes instead.
+        Rolling back costs just the changes made in the block.
+        """
+        transaction = PatchTransaction()
+        Patcher._journals.append(transaction._undo)
+        try:
+            yield transaction
+        finally:
+            Patcher._journals[:] = [
+                journal for journal in Patcher._journals if journal is not transaction._undo
+            ]
+            if not transaction.committed:
+                transaction.rollback()
+            elif Patcher._journals:
+                Patcher._journals[-1].extend(transaction._undo)
+
+
 TFixtureContentType = TypeVar('TFixtureContentType')
 
 
+@dataclass
+class TFixtureMetadata:
+    """Fixture metadata structure to keep the value created from ``add_fixture`` content.
+
+    Its teardown state is kept as well.
+
+    Args:
+        content (TFixtureContentType):
+            Content given to ``add_fixture``. We keep it alive while cached so its identity can't
+            be reused by another content.
+
+        scope (str):
+            Scope the value is cached for: ``test``, ``class`` or ``session``.
+
+        value (Any):
+            The return/yield data from content.
+
+        is_async (bool):
+            Identify if content is a coroutine or an async generator.
+
+        _generator (Union[Generator, AsyncGenerator]):
+            Generator returned by content, resumed once to run the teardown code after ``yield``.
+
+        _awaitable (Union[Coroutine, AsyncGenerator]):
+            Async content still waiting to be set up.
+
+        _loop (asyncio.AbstractEventLoop):
+            Event loop the async content was set up on, so it's torn down on the same loop.
+    """
+
+    content: TFixtureContentType = None
+    scope: str = 'test'
+    value: Any = None
+    is_async: bool = False
+    _generator: Union[Generator, AsyncGenerator] = None
+    _awaitable: Union[Coroutine, AsyncGenerator] = None
+    _loop: asyncio.AbstractEventLoop = None
+
+    @property
+    def is_pending(self) -> bool:
+        return self._awaitable is not None
+
+
+class TAsyncFixture(Generic[TFixtureContentType]):
+    """Handle given back by ``add_fixture`` for async contents which are not set up yet.
+
+    Inside ``mocker_builder_setup`` they are set up all together right after it returns, and the
+    handles stored on the test instance are replaced by their values. Anywhere else just
+    ``await`` the handle.
+
+    Args:
+        fixture_metadata (TFixtureMetadata):
+            Fixture metadata of the async content.
+    """
+
+    def __init__(self, fixture_metadata: TFixtureMetadata) -> None:
+        self.__fixture_metadata = fixture_metadata
+
+    @property
+    def value(self) -> TFixtureContentType:
+        if self.__fixture_metadata.is_pending:
+            raise MockerBuilderException(
+                f"Async fixture {self.__fixture_metadata.content} was not set up yet."
+            )
+        return self.__fixture_metadata.value
+
+    def __await__(self):
+        return FixtureCache._asetup(self.__fixture_metadata).__await__()
+
+
+class FixtureCache:
+    """Cache of ``add_fixture`` values by scope.
+
+    Values are keyed by content identity so heavy contents are built once per scope, and generator
+    contents are finalized when the scope ends. Async contents declared together are set up and
+    torn down concurrently.
+
+    Args:
+        _request (pytest.FixtureRequest):
+            Request of the running test, used to hook class and session finalizers.
+
+        _cache (Dict[str, Dict[Hashable, TFixtureMetadata]]):
+            Cached fixtures by scope and content key, in creation order.
+
+        _loops (Dict[str, asyncio.AbstractEventLoop]):
+            Event loops we created to set up async fixtures by scope.
+
+        _collecting (bool):
+            Flag set while ``mocker_builder_setup`` runs, so async contents are gathered after it.
+
+        _given (List[TFixtureMetadata]):
+            Fixtures given to the running test, whichever scope they are cached for.
+    """
+
+    SCOPES: Tuple[str, ...] = ('test', 'class', 'session')
+    _request: pytest.FixtureRequest = None
+    _cache: Dict[str, Dict[Hashable, TFixtureMetadata]] = {scope: {} for scope in SCOPES}
+    _loops: Dict[str, asyncio.AbstractEventLoop] = {}
+    _collecting: bool = False
+    _given: List[TFixtureMetadata] = []
+
+    @staticmethod
+    def key(content: TFixtureContentType) -> Hashable:
+        """Content identity.
+
+        Lambdas and closures are rebuilt every time ``mocker_builder_setup`` runs, so functions are
+        identified by their code and the objects they capture instead of the function object itself.
+        The test instance changes every test, so it's identified by its class to keep class and
+        session scoped contents bound to it cached.
+        """
+        if inspect.ismethod(content):
+            return (FixtureCache.key(content.__func__), FixtureCache._identity(content.__self__))
+        if inspect.isfunction(content):
+            captured = []
+            for cell in content.__closure__ or ():
+                try:
+                    captured.append(FixtureCache._identity(cell.cell_contents))
+                except ValueError:
+                    captured.append(None)
+            defaults = tuple(FixtureCache._identity(value) for value in content.__defaults__ or ())
+            return (content.__code__, tuple(captured), defaults)
+        return id(content)
+
+    @staticmethod
+    def _identity(value: Any) -> Hashable:
+        request = FixtureCache._request
+        if request is not None and value is request.instance:
+            return type(value)
+        return id(value)
+
+    @staticmethod
+    def setup(content: TFixtureContentType, scope: str = 'test') -> Any:
+        if scope not in FixtureCache.SCOPES:
+            raise MockerBuilderException(
+                f"Invalid fixture scope {scope!r}. Choose one of {', '.join(FixtureCache.SCOPES)}."
+            )
+        cache = FixtureCache._cache[scope]
+        key = FixtureCache.key(content)
+        fixture = cache.get(key)
+        if fixture:
+            FixtureCache._given.append(fixture)
+            if fixture.is_pending:
+                return TAsyncFixture(fixture)
+            return fixture.value
+
+        if not cache:
+            FixtureCache._add_finalizer(scope)
+        fixture = TFixtureMetadata(content=content, scope=scope)
+        with MemoryTracker.measure_fixture(getattr(content, '__qualname__', repr(content))):
+            result = content() if callable(content) else content
+            if inspect.isgenerator(result):
+                fixture._generator = result
+                fixture.value = next(result)
+            elif inspect.iscoroutine(result) or inspect.isasyncgen(result):
+                fixture.is_async = True
+                fixture._awaitable = result
+            else:
+                fixture.value = result
+        cache[key] = fixture
+        FixtureCache._given.append(fixture)
+
+        if not fixture.is_pending:
+            return fixture.value
+        if not FixtureCache._collecting:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                FixtureCache.setup_pending()
+                return fixture.value
+        return TAsyncFixture(fixture)
+
+    @staticmethod
+    def _loop(scope: str) -> asyncio.AbstractEventLoop:
+        # Test scoped fixtures of pytest-asyncio tests share the test event loop, so resources
+        # like connection pools are bound to the loop the test runs on.
+        request = FixtureCache._request
+        if scope == 'test' and request is not None and 'event_loop' in request.fixturenames:
+            return request.getfixturevalue('event_loop')
+        loop = FixtureCache._loops.get(scope)
+        if loop is None or loop.is_closed():
+            loop = FixtureCache._loops[scope] = asyncio.new_event_loop()
+        return loop
+
+    @staticmethod
+    async def _asetup(fixture: TFixtureMetadata) -> Any:
+        awaitable, fixture._awaitable = fixture._awaitable, None
+        if awaitable is None:
+            return fixture.value
+        fixture._loop = asyncio.get_running_loop()
+        if inspect.isasyncgen(awaitable):
+            fixture._generator = awaitable
+            fixture.value = await awaitable.__anext__()
+        else:
+            fixture.value = await awaitable
+        return fixture.value
+
+    @staticmethod
+    def _gather(loop: asyncio.AbstractEventLoop, coroutines: List[Coroutine]) -> List[BaseException]:
+        # gather must be created inside the loop, otherwise it binds to the default event loop.
+        async def gather():
+            return await asyncio.gather(*coroutines, return_exceptions=True)
+
+        results = loop.run_until_complete(gather())
+        return [result for result in results if isinstance(result, BaseException)]
+
+    @staticmethod
+    def setup_pending(test_instance: object = None):
+        """Set up every pending async fixture concurrently, one ``asyncio.gather`` per event loop.
+
+        The ``TAsyncFixture`` handles stored on ``test_instance`` are replaced by their values.
+
+        Raises:
+            MockerBuilderException:
+                Raised after all fixtures were set up if any of them failed.
+        """
+        errors = []
+        for scope in FixtureCache.SCOPES:
+            pending = [
+                fixture for fixture in FixtureCache._cache[scope].values() if fixture.is_pending
+            ]
+            if not pending:
+                continue
+            # Async fixtures run interleaved, so their memory is accounted all together.
+            with MemoryTracker.measure_fixture(f"async {scope} fixtures"):
+                errors.extend(FixtureCache._gather(
+                    FixtureCache._loop(scope),
+                    [FixtureCache._asetup(fixture) for fixture in pending]
+                ))
+        if errors:
+            raise MockerBuilderException(*errors)
+
+        if test_instance is not None:
+            for name, attr in list(vars(test_instance).items()):
+                if isinstance(attr, TAsyncFixture):
+                    setattr(test_instance, name, attr.value)
+
+    @staticmethod
+    def _add_finalizer(scope: str):
+        # Test scope is finalized by the initializer itself. Class and session scopes are
+        # finalized by pytest when the class or the session node is torn down.
+        request = FixtureCache._request
+        if scope == 'test' or request is None:
+            return
+        if scope == 'class':
+            node = request.node.getparent(pytest.Class) or request.node.getparent(pytest.Module)
+        else:
+            node = request.session
+        node.addfinalizer(lambda: FixtureCache.teardown(scope))
+
+    @staticmethod
+    def _finalize(fixture: TFixtureMetadata):
+        generator, fixture._generator = fixture._generator, None
+        if generator is None:
+            return
+        try:
+            next(generator)
+        except StopIteration:
+            return
+        generator.close()
+        raise MockerBuilderException(
+            f"Fixture content {fixture.content} yielded more than once."
+        )
+
+    @staticmethod
+    async def _afinalize(fixture: TFixtureMetadata):
+        generator, fixture._generator = fixture._generator, None
+        if generator is None:
+            return
+        try:
+            await generator.__anext__()
+        except StopAsyncIteration:
+            return
+        await generator.aclose()
+        raise MockerBuilderException(
+            f"Fixture content {fixture.content} yielded more than once."
+        )
+
+    @staticmethod
+    def teardown(scope: str):
+        """Finalize the fixtures of ``scope`` and drop them from cache.
+
+        Async fixtures are finalized concurrently on the loop they were set up on, then sync
+        fixtures in reverse creation order.
+
+        Raises:
+            MockerBuilderException:
+                Raised after all fixtures were finalized if any teardown failed.
+        """
+        fixtures = list(FixtureCache._cache[scope].values())
+        FixtureCache._cache[scope].clear()
+        errors = []
+
+        by_loop: Dict[asyncio.AbstractEventLoop, List[TFixtureMetadata]] = {}
+        for fixture in fixtures:
+            if fixture.is_pending:
+                # Set up never happened, so there is nothing to finalize.
+                if inspect.iscoroutine(fixture._awaitable):
+                    fixture._awaitable.close()
+                fixture._awaitable = None
+            elif fixture.is_async and fixture._generator is not None:
+                by_loop.setdefault(fixture._loop, []).append(fixture)
+        for loop, async_fixtures in by_loop.items():
+            if loop.is_closed():
+                errors.append(MockerBuilderException(
+                    f"Event loop closed before finalizing async fixtures {async_fixtures}."
+                ))
+                continue
+            errors.extend(FixtureCache._gather(
+                loop,
+                [FixtureCache._afinalize(fixture) for fixture in async_fixtures]
+            ))
+
+        for fixture in reversed(fixtures):
+            if fixture.is_async:
+                continue
+            try:
+                FixtureCache._finalize(fixture)
+            except Exception as ex:
+                errors.append(ex)
+
+        loop = FixtureCache._loops.pop(scope, None)
+        if loop is not None and not loop.is_closed():
+            loop.close()
+        if errors:
+            raise MockerBuilderException(*errors)
+
+
 class MockerBuilder(ABC):
     """Our interface to connect mock metadata builder to the user's building tests"""
 
+    mocker_builder_config: MockerBuilderConfig = MockerBuilderConfig()
+
     def initializer(fnc):
         @pytest.fixture(autouse=True)
-        def builder(test_main_class, mocker: MockFixture):
+        def builder(test_main_class, mocker: MockFixture, request: pytest.FixtureRequest):
             """Decorator which inject a fixture to the TestClass method decorated with this
             so we can get the mocker fixture injected to be used all spread on the tests.
 
@@ -577,16 +2373,101 @@ class MockerBuilder(ABC):
 
                 mocker:
                     pytest-mock fixture to create patch and so on.
+
+                request:
+                    pytest request to finalize class and session scoped fixtures.
             """
-            print("\n################# Mocker Builder Initializer ################")
-            Patcher._mocker = mocker
-            setattr(test_main_class, 'mocker', mocker)
-            yield fnc(test_main_class)
+            # Runners from mocker_builder.runners take over the setup of the classes they run.
+            runner = getattr(type(test_main_class), '_mocker_builder_runner', None)
+            initialize = runner.initialize if runner is not None else MockerBuilder._initialize
+            yield from initialize(fnc, test_main_class, mocker, request)
+        builder.mocker_builder_setup = fnc
+        return builder
 
+    @staticmethod
+    def _initialize(
+        fnc: Callable,
+        test_main_class: MockerBuilder,
+        mocker: MockFixture,
+        request: Optional[pytest.FixtureRequest]
+    ) -> Generator:
+        """Run the ``mocker_builder_setup`` of ``test_main_class``, yield to the test and tear it down.
+
+        Without ``request`` class and session scoped fixtures are not finalized by pytest.
+        """
+        print("\n################# Mocker Builder Initializer ################")
+        config = getattr(test_main_class, 'mocker_builder_config', MockerBuilderConfig())
+        # Records left behind by a test whose setup failed: its mocker already stopped them.
+        del Patcher._mocked_metadata[:]
+        del FixtureCache._given[:]
+        Patcher._active_targets.clear()
+        Patcher._mocker = mocker
+        FixtureCache._request = request
+        if config.track_memory:
+            MemoryTracker.start(
+                request.node.nodeid if request is not None else type(test_main_class).__name__
+            )
+        if config.track_usage:
+            cls = type(test_main_class)
+            UsageTracker.start(
+                f"{cls.__module__}:{cls.__qualname__}",
+                request.node.name if request is not None else cls.__name__
+            )
+            if request is not None:
+                UsageTracker.report_at_exit(request.config, config.usage_report)
+        CallTimeline.start(every_patch=config.call_timeline)
+        setattr(test_main_class, 'mocker', mocker)
+        FixtureCache._collecting = True
+        try:
+            setup = fnc(test_main_class)
+            FixtureCache._collecting = False
+            FixtureCache.setup_pending(test_main_class)
+        except BaseException:
+            FixtureCache._collecting = False
+            FixtureCache._request = None
+            Patcher._clean_up()
+            MemoryTracker.finish()
+            UsageTracker.finish()
+            raise
+        if config.track_usage:
+            UsageTracker.snapshot(Patcher.mocks())
+        yield setup
+
+        records = list(Patcher._mocked_metadata)
+        try:
+            if config.track_usage:
+                UsageTracker.collect(Patcher.mocks())
+            MemoryTracker.collect(
+                Patcher.mocks(),
+                max_calls=config.max_mock_calls,
+                max_children=config.max_child_mocks
+            )
+            FixtureCache.teardown('test')
+        finally:
             # Cleaning up stopped mocks: mock_metadata.is_active = False to avoid raising
             # mocker RuntimeError: "stop called on unstarted patcher".
             Patcher._clean_up()
-        return builder
+            # Class finalizers were bound to their node already, the finished test's request
+            # must not serve the event loop of fixtures set up outside a test.
+            FixtureCache._request = None
+            UsageTracker.finish()
+            report = MemoryTracker.finish()
+            if report is not None:
+                print(report)
+                for target_path in report.flagged:
+                    target = report.targets[target_path]
+                    MockerBuilderWarning.warn(
+                        f"Mock of {target_path} holds {target.calls} calls and "
+                        f"{target.children} child mocks ({target.call_log_bytes:,} bytes). "
+                        "Consider resetting it or patching a narrower target."
+                    )
+        if config.leak_check:
+            Patcher._check_leaks(records)
+
+    @property
+    def patches(self) -> PatchSet:
+        """Suspend, or roll back changes made to, all the patches of the running test at once."""
+        return PatchSet()
 
     @abstractmethod
     def mocker_builder_setup(self):
@@ -617,6 +2498,17 @@ class MockerBuilder(ABC):
         return_value: ReturnValueType = None,
         side_effect: SideEffectType = None,
         mock_configure: MockMetadataKwargsType = None,
+        latency: float = None,
+        behavior: BehaviorProfile = None,
+        everywhere: bool = False,
+        scope: str = None,
+        timed: bool = False,
+        timeline: bool = None,
+        track_concurrency: bool = False,
+        call_log: Union[str, CallLogWriter] = None,
+        max_depth: int = None,
+        max_children: int = None,
+        on_child_limit: str = 'raise',
         **kwargs
     ) -> TMocker.PatchType:
         """From here we create new ``mock.patch`` parsing the ``target`` parameter. You can just set
@@ -695,7 +2587,8 @@ class MockerBuilder(ABC):
 
             new (TypeNew, optional):
                 The new type that ``target`` attribute will get after mocking.
-                Defaults to DEFAULT.
+                Defaults to DEFAULT. A plain ``new`` value, with no other option than ``create``,
+                is set and restored directly without going through ``mock.patch``.
 
                 .. code-block:
                     :caption: Example
@@ -780,49 +2673,444 @@ class MockerBuilder(ABC):
                         }
                     )
 
+            latency (float, optional):
+                Seconds async mocks await before giving back their result, to simulate slow
+                dependencies. Run the tests on a ``VirtualTimeEventLoop`` so the latency advances
+                virtual time instead of really waiting. Only available for async targets.
+
+            behavior (BehaviorProfile, optional):
+                Seeded latency distribution and error rates by exception type applied on every
+                call, for sync and async targets::
+
+                    self.patch(
+                        Client.fetch,
+                        behavior=BehaviorProfile(
+                            latency=LogNormal.from_median(.05, sigma=.8),
+                            errors={TimeoutError: .01},
+                            seed=42
+                        )
+                    )
+
+            everywhere (bool, optional):
+                Patch as well every module global referencing the target, like the copies made by
+                ``from module import function``, all sharing the same mock. They are found with an
+                index of module globals kept up to date by an import hook. Defaults to False.
+
+            scope (str, optional):
+                ``task`` to patch the target just for the running asyncio task and the tasks it
+                creates afterwards, so concurrent tasks can patch the same target with different
+                mocks. The target is replaced by a dispatcher which looks the mock up in a
+                ``ContextVar`` and falls back to the original target where none is active.
+                ``thread`` does the same per thread with a ``threading.local``, so tests can run
+                on a ``ThreadPoolExecutor``. Patches set from ``mocker_builder_setup`` are seen
+                just by the thread running it. Defaults to None, patching the target for
+                everyone.
+
+                .. code-block::
+
+                    async def worker(self, name: str) -> str:
+                        self.patch(Client.fetch, return_value=name, scope="task")
+                        return await Client().fetch()
+
+                    async def test_concurrent_heroes(self):
+                        assert await asyncio.gather(
+                            self.worker("Batman"),
+                            self.worker("Robin")
+                        ) == ["Batman", "Robin"]
+
+            timed (bool, optional):
+                Record a monotonic timestamp and the calling line of the code under test for each
+                mock call, giving call rate, inter-arrival and hot callers summaries through the
+                ``timings`` of the returned patch. Records are reset when the patch gets a new
+                mock, like its calls. Defaults to False.
+
+                .. code-block::
+
+                    def test_no_n_plus_one(self):
+                        mock_fetch = self.patch(Client.fetch, timed=True)
+                        load_league()
+                        assert mock_fetch.timings.calls == 1, mock_fetch.timings
+
+            timeline (bool, optional):
+                Record each call of the mock, with a digest of its arguments, in the
+                ``CallTimeline`` shared by the mocks of the running test, to check the order of
+                calls across mocks with ``assert_called_in_order``. Defaults to None, following
+                the ``call_timeline`` option of the class config.
+
+                .. code-block::
+
+                    def test_fetch_before_save(self):
+                        mock_fetch = self.patch(Client.fetch, timeline=True)
+                        mock_save = self.patch(Client.save, timeline=True)
+                        sync_league()
+                        self.assert_called_in_order(mock_fetch, mock_save)
+
+            track_concurrency (bool, optional):
+                Account the awaits of an async target in flight at once: peak and average
+                concurrency, awaits overlapping others and time spent with a single await in
+                flight, through the ``concurrency`` of the returned patch. Each await yields to
+                the event loop once, so concurrent awaits overlap even without ``latency``.
+                Defaults to False.
+
+                .. code-block::
+
+                    @pytest.mark.asyncio
+                    async def test_heroes_called_concurrently(self):
+                        mock_call_heroes = self.patch(
+                            JusticeLeague.call_heroes,
+                            latency=.5,
+                            track_concurrency=True
+                        )
+                        await call_every_league()
+                        mock_call_heroes.concurrency.assert_max_concurrency_at_least(3)
+
+            call_log (Union[str, CallLogWriter], optional):
+                Stream each call of the mock, with a timestamp and its arguments, to a
+                ``CallLogWriter``, or to a JSON lines file shared by every patch logging to that
+                path and closed at the test teardown. Calls are written by a background thread
+                and not kept once written; ``CallLog`` reads them back lazily. Just calls to the
+                patched target itself are logged, not to its child mocks. Defaults to None.
+
+                .. code-block::
+
+                    def test_fetch_pattern(self):
+                        self.patch(Client.fetch, call_log="fetch_calls.jsonl")
+                        load_league()
+
+            max_depth (int, optional):
+                Levels of child mocks the mock can create below itself, by attribute access or
+                return values, counting the ones ``mock_configure`` created. Magic methods are
+                neither counted nor refused. Defaults to None, no limit.
+
+            max_children (int, optional):
+                Child mocks the whole mock tree can hold. Defaults to None, no limit.
+
+            on_child_limit (str, optional):
+                ``raise`` a ``ChildMockLimitError``, an ``AttributeError``, when a child mock
+                past ``max_depth`` or ``max_children`` would be created, or give back
+                ``sentinel``, a shared ``CHILD_LIMIT_SENTINEL`` which records nothing. Counters
+                are kept in the ``child_limits`` of the returned patch. Defaults to ``raise``.
+
+                .. code-block::
+
+                    def test_reflective_walk(self):
+                        mock_hero = self.patch(
+                            Batman.get_my_hero_hobby,
+                            max_depth=3,
+                            max_children=100,
+                            on_child_limit="sentinel"
+                        )
+                        dump_everything(Batman())
+                        assert mock_hero.child_limits.limited == 0
+
         Returns:
             TMocker.PatchType:
                 Alias to _TPatch Generics which handle with MagicMock or AsyncMock
                 (not yet really but working on) according patching async methods or not.
         """
-        return TMocker._patch(
-            TMockMetadataBuilder()(
-                target=target,
-                method=method,
-                attribute=attribute,
-                new=new,
-                spec=spec,
-                create=create,
-                spec_set=spec_set,
-                autospec=autospec,
-                new_callable=new_callable,
-                return_value=return_value,
-                side_effect=side_effect,
-                mock_configure=mock_configure,
-                mock_kwargs=kwargs
-            )
+        started = time.perf_counter()
+        mock_metadata = TMockMetadataBuilder()(
+            target=target,
+            method=method,
+            attribute=attribute,
+            new=new,
+            spec=spec,
+            create=create,
+            spec_set=spec_set,
+            autospec=autospec,
+            new_callable=new_callable,
+            return_value=return_value,
+            side_effect=side_effect,
+            mock_configure=mock_configure,
+            latency=latency,
+            behavior=behavior,
+            everywhere=everywhere,
+            scope=scope,
+            timed=timed,
+            timeline=timeline,
+            track_concurrency=track_concurrency,
+            call_log=call_log,
+            max_depth=max_depth,
+            max_children=max_children,
+            on_child_limit=on_child_limit,
+            mock_kwargs=kwargs
         )
+        _tpatch = TMocker._patch(mock_metadata)
+        UsageTracker.add_setup(mock_metadata.target_path, time.perf_counter() - started)
+        return _tpatch
+
+    def spy(
+        self,
+        target: TargetType,
+        method: AttrType = None,
+        attribute: AttrType = None,
+        mode: str = 'monitor',
+    ) -> CallSpy:
+        """Count the calls of a real function or method, which keeps running as usual.
+
+        It has far less overhead than a ``MagicMock(wraps=...)``: no call is recorded but its
+        count. The ``target`` is given just like to ``patch`` and the spy is stopped at the test
+        teardown.
+
+        On Python 3.12 and newer the ``monitor`` mode leaves the target in place and counts the
+        ``sys.monitoring`` start events of its code object, so calls through every reference are
+        counted, ``from module import function`` copies included, as well as calls of closures
+        made by the same ``def``. Elsewhere, for targets with no code object of their own, like
+        builtins, or when every ``sys.monitoring`` tool id is taken, it falls back to ``wrap``,
+        which sets a thin counting wrapper in place of the target attribute.
+
+        .. code-block::
+            :caption: Example
+
+                def test_heroes_joined_once(self):
+                    spy_join_hero = self.spy(JusticeLeague.join_hero)
+                    JusticeLeague().join_hero(Batman())
+                    spy_join_hero.assert_called_times(1)
+
+        Args:
+            target (TargetType):
+                Function, method, class or module, or its dotted path, like for ``patch``.
+
+            method (AttrType, optional):
+                Method of a class or module ``target``. Defaults to None.
+
+            attribute (AttrType, optional):
+                Callable attribute of a class or module ``target``. Defaults to None.
+
+            mode (str, optional):
+                ``monitor`` or ``wrap``. Defaults to ``monitor``.
+
+        Raises:
+            MockerBuilderException:
+                Raised for unknown modes and targets not found.
+
+        Returns:
+            CallSpy:
+                Call counter of the target, with ``mode`` telling how it ended up counting.
+        """
+        if mode not in SPY_MODES:
+            raise MockerBuilderException(
+                f"Unknown spy mode {mode!r}. Available modes: {', '.join(SPY_MODES)}."
+            )
+        target_path = TMockMetadataBuilder()(
+            target=target,
+            method=method,
+            attribute=attribute
+        ).target_path
+        owner_path, attribute = target_path.rsplit('.', 1)
+        original = _ScopedPatch._original(_SetattrPatch._resolve(owner_path), attribute)
+        code = _code_of(original)
+        if all([mode == 'monitor', code is not None, MonitorSpy.available()]):
+            _spy = MonitorSpy(target_path, code).start()
+        else:
+            _spy = WrapperSpy(target_path)
+            _spy.start(_SetattrPatch(owner_path, attribute, _spy.wrapper(original)))
+        Patcher._restore_log.append(_spy)
+        return _spy
+
+    def reset_mocks(self) -> DirtyStats:
+        """Reset the call records of the mocks used since they were patched or last reset.
+
+        It works like ``mocker.resetall`` does for every mock. Mocks mark themselves dirty on their
+        first call, or the first call of any child mock, and on their first attribute set, so the
+        clean ones are skipped without being looked into.
+
+        .. code-block::
+            :caption: Example
+
+                def test_heroes_join_again(self):
+                    JusticeLeague().join_hero(Batman())
+                    stats = self.reset_mocks()
+                    assert stats.reset == 1, stats
+                    self.mock_join_hero().assert_not_called()
+
+        Returns:
+            DirtyStats:
+                Mocks checked, reset and skipped by this reset. ``DirtyTracker.stats`` adds up
+                every reset of the session.
+        """
+        return Patcher.reset_mocks()
+
+    @property
+    def timeline(self) -> CallTimeline:
+        """Calls of the mocks of the running test patched with ``timeline``, in order."""
+        return CallTimeline.current()
+
+    @staticmethod
+    def _timeline_target(item: Union[str, TMocker.PatchType, Any]) -> str:
+        if isinstance(item, str):
+            return item
+        if isinstance(item, TMocker._TPatch):
+            return item.target_path
+        for mock_metadata in Patcher.mocked_metadata():
+            if mock_metadata._mock is item:
+                return mock_metadata.target_path
+        raise MockerBuilderException(f"{item!r} is not a mock patched by this test.")
+
+    def assert_called_in_order(self, *expected: Any):
+        """Fail unless the mocks were called in the ``expected`` order, with any other calls between.
+
+        The order is checked in one pass over the ``CallTimeline`` of the test, no ``attach_mock``
+        manager needed. The mocks must be patched with ``timeline``.
+
+        .. code-block::
+            :caption: Example
+
+                def test_batman_calls_first(self):
+                    JusticeLeague().call_everybody()
+                    self.assert_called_in_order(
+                        self.mock_batman_says,
+                        (self.mock_robin_says, call("Holy crap!")),
+                        "test_cases.my_heroes.Batman.eating_banana",
+                    )
+
+        Args:
+            expected (Any):
+                Patches given back by ``patch``, their mocks or target paths, for any call, or
+                pairs of one of them and a ``call`` the mock must be called with.
+
+        Raises:
+            MockerBuilderException:
+                Raised for mocks not patched by the running test.
+        """
+        resolved = []
+        for item in expected:
+            if isinstance(item, tuple) and not isinstance(item, str):
+                item, expected_call = item
+                resolved.append((
+                    self._timeline_target(item),
+                    call_digest(tuple(expected_call[-2]), dict(expected_call[-1]))
+                ))
+            else:
+                resolved.append(self._timeline_target(item))
+        CallTimeline.current().assert_called_in_order(*resolved)
 
     def add_fixture(
         self,
         content: TFixtureContentType,
+        scope: str = 'test',
     ) -> TFixtureContentType:
         """Method to simulate a pytest fixture to be called in every test but in another way.
 
+        The value is cached by content identity for the given ``scope``, and the code after
+        ``yield`` of generator contents runs when the scope ends.
+
+        .. code-block::
+            :caption: Example
+
+                @MockerBuilder.initializer
+                def mocker_builder_setup(self):
+                    self.my_hero = self.add_fixture(
+                        content=lambda: (yield PeakyBlinder(nickname="Thomas Shelby")),
+                        scope="class"
+                    )
+
         Args:
             content (TFixtureContentType):
-                Method to be called and returned or yielded
+                Method to be called and returned or yielded. Coroutine functions and async
+                generators are accepted too: the ones declared in ``mocker_builder_setup`` are set
+                up concurrently after it returns and torn down concurrently when scope ends.
+
+            scope (str, optional):
+                ``test``, ``class`` or ``session``. Defaults to ``test``.
 
         Returns:
             TFixtureContentType:
-                The return/yield data from content.
+                The return/yield data from content, or a ``TAsyncFixture`` handle to be awaited for
+                async contents added while an event loop is running.
 
         """
-        if callable(content):
-            result = content()
-        else:
-            result = content
-        if inspect.isgenerator(result):
-            return next(result)
-        else:
-            return result
+        return FixtureCache.setup(content, scope)
+
+    @staticmethod
+    def _benchmark(batch_size: int) -> Benchmark:
+        mocks = {
+            mock_metadata.target_path: mock_metadata._mock
+            for mock_metadata in Patcher.active_patches()
+        }
+        return Benchmark(mocks, batch_size=batch_size)
+
+    def benchmark(
+        self,
+        fn: Callable[[], Any],
+        iterations: int = 1000,
+        concurrency: int = 1,
+        batch_size: int = 1000,
+    ) -> BenchmarkResult:
+        """Run the code under test many times against the active patches.
+
+        Its throughput and latency are measured. Call logs of the called mocks are reset every
+        ``batch_size`` iterations and the harness and mocks own cost, measured by a calibration
+        run, is subtracted.
+
+        .. code-block::
+            :caption: Example
+
+                def test_heroes_throughput(self):
+                    result = self.benchmark(
+                        lambda: JusticeLeague().join_hero(Batman()),
+                        iterations=10_000,
+                        concurrency=4
+                    )
+                    print(result)
+                    assert result.p99 < .001
+
+        Args:
+            fn (Callable[[], Any]):
+                Code under test. Coroutine functions are run on a new event loop.
+
+            iterations (int, optional):
+                Times to call ``fn``. Defaults to 1000.
+
+            concurrency (int, optional):
+                Threads calling ``fn`` at the same time. Defaults to 1.
+
+            batch_size (int, optional):
+                Iterations between call logs resets. Defaults to 1000.
+
+        Returns:
+            BenchmarkResult:
+                Calls per second, p50/p95/p99 latency and calls into each patched target.
+        """
+        if asyncio.iscoroutinefunction(fn):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                raise MockerBuilderException(
+                    "Event loop already running. Please, use `await self.abenchmark(...)` instead."
+                )
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(
+                    self.abenchmark(fn, iterations, concurrency, batch_size)
+                )
+            finally:
+                loop.close()
+        return self._benchmark(batch_size).run(fn, iterations, concurrency)
+
+    async def abenchmark(
+        self,
+        fn: Callable[[], Coroutine],
+        iterations: int = 1000,
+        concurrency: int = 1,
+        batch_size: int = 1000,
+    ) -> BenchmarkResult:
+        """Async version of ``benchmark``.
+
+        ``fn()`` is awaited from ``concurrency`` tasks on the running event loop.
+
+        .. code-block::
+            :caption: Example
+
+                @pytest.mark.asyncio
+                async def test_call_heroes_throughput(self):
+                    result = await self.abenchmark(
+                        JusticeLeague().call_everybody,
+                        iterations=1000,
+                        concurrency=50
+                    )
+                    assert sum(result.mock_calls.values()) == 1000
+        """
+        return await self._benchmark(batch_size).arun(fn, iterations, concurrency)
@@ -0,0 +1,274 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Picklable plans of the patches set up by a test class, to replay them in other processes.
+###################################################################################################
+from __future__ import annotations
+from dataclasses import dataclass, field
+import pickle
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from .behavior import BehaviorProfile
+from .call_log import CallLogWriter
+from .child_limits import ChildMockLimits
+from .mocker_builder import (
+    FixtureCache,
+    MockerBuilder,
+    MockerBuilderException,
+    MockMetadataKwargsType,
+    Patcher,
+    TMocker,
+    TMockMetadata,
+)
+
+
+def _fresh_limits(limits: Optional[ChildMockLimits]) -> Optional[ChildMockLimits]:
+    if limits is None:
+        return None
+    return ChildMockLimits(
+        max_depth=limits.max_depth,
+        max_children=limits.max_children,
+        on_limit=limits.on_limit
+    )
+
+
+@dataclass(frozen=True)
+class _PatchRef:
+    # Stands for the patch at ``index`` of the plan in the planned attributes.
+    index: int
+
+
+def _to_plan(value: Any, indexes: Dict[int, int]) -> Any:
+    if isinstance(value, TMocker._TPatch) and id(value.mock) in indexes:
+        return _PatchRef(indexes[id(value.mock)])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_plan(item, indexes) for item in value)
+    if isinstance(value, dict):
+        return {key: _to_plan(item, indexes) for key, item in value.items()}
+    return value
+
+
+def _from_plan(value: Any, patches: List[TMocker.PatchType]) -> Any:
+    if isinstance(value, _PatchRef):
+        return patches[value.index]
+    if isinstance(value, (list, tuple)):
+        return type(value)(_from_plan(item, patches) for item in value)
+    if isinstance(value, dict):
+        return {key: _from_plan(item, patches) for key, item in value.items()}
+    return value
+
+
+_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _fixture_values() -> Dict[int, str]:
+    # Values ``add_fixture`` gave to the running test, by identity, with the content they came
+    # from. Immutable scalars share their identity with unrelated values, and planning them by
+    # value gives the same value anyway.
+    return {
+        id(fixture.value): getattr(fixture.content, '__qualname__', repr(fixture.content))
+        for fixture in FixtureCache._given
+        if not isinstance(fixture.value, _SCALARS)
+    }
+
+
+def _picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+@dataclass
+class PlannedPatch:
+    """Declarative parameters of a patch, already resolved by ``TMockMetadataBuilder``.
+
+    Args:
+        target_path (str):
+            Patched target.
+
+        is_async (bool):
+            Whether the target is async.
+
+        patch_kwargs (MockMetadataKwargsType):
+            ``mock.patch`` keyword arguments, async results unwrapped.
+
+        latency (float):
+            Seconds awaited by the async mock.
+
+        behavior (BehaviorProfile):
+            Latency and fault injection profile.
+
+        everywhere (bool):
+            Patch every module global referencing the target as well.
+
+        scope (str):
+            ``task`` or ``thread`` scoped patch.
+
+        timed (bool):
+            Record the timestamp and the caller of each call.
+
+        timeline (bool):
+            Record the calls in the call timeline of the test.
+
+        track_concurrency (bool):
+            Account the awaits in flight at once.
+
+        child_limits (ChildMockLimits):
+            Caps on the child mocks, counters left out.
+
+        call_log (str):
+            Path of the call log, opened again as a shared writer where the plan is applied.
+
+        call_log_binary (bool):
+            Whether the call log is written as binary records.
+    """
+
+    target_path: str = None
+    is_async: bool = False
+    patch_kwargs: MockMetadataKwargsType = field(default_factory=dict)
+    latency: float = None
+    behavior: BehaviorProfile = None
+    everywhere: bool = False
+    scope: str = None
+    timed: bool = False
+    timeline: bool = False
+    track_concurrency: bool = False
+    child_limits: ChildMockLimits = None
+    call_log: str = None
+    call_log_binary: bool = False
+
+    @staticmethod
+    def from_metadata(mock_metadata: TMockMetadata) -> PlannedPatch:
+        call_log = mock_metadata.call_log
+        return PlannedPatch(
+            target_path=mock_metadata.target_path,
+            is_async=mock_metadata.is_async,
+            patch_kwargs=Patcher._unwrapped_kwargs(mock_metadata),
+            latency=mock_metadata.latency,
+            behavior=mock_metadata.behavior,
+            everywhere=mock_metadata.everywhere,
+            scope=mock_metadata.scope,
+            timed=mock_metadata.timed,
+            timeline=mock_metadata.timeline,
+            track_concurrency=mock_metadata.track_concurrency,
+            child_limits=_fresh_limits(mock_metadata.child_limits),
+            call_log=call_log.path if call_log is not None else None,
+            call_log_binary=call_log is not None and call_log.binary,
+        )
+
+    def metadata(self) -> TMockMetadata:
+        return TMockMetadata(
+            target_path=self.target_path,
+            is_async=self.is_async,
+            patch_kwargs=dict(self.patch_kwargs),
+            latency=self.latency,
+            behavior=self.behavior,
+            everywhere=self.everywhere,
+            scope=self.scope,
+            timed=self.timed,
+            timeline=self.timeline,
+            track_concurrency=self.track_concurrency,
+            child_limits=_fresh_limits(self.child_limits),
+            call_log=(
+                CallLogWriter.shared(self.call_log, binary=self.call_log_binary)
+                if self.call_log is not None else None
+            ),
+        )
+
+
+@dataclass
+class PatchPlan:
+    """Patches and attributes set up by ``mocker_builder_setup`` of a test class.
+
+    They are recorded once and replayed in other processes without running the setup again, so
+    targets are not parsed, inspected or imported through the builder there.
+
+    .. code-block::
+        :caption: Example
+
+            plan = PatchPlan.record(test_instance)
+            data = plan.dumps()
+            # in a worker process
+            PatchPlan.loads(data).apply(other_test_instance)
+
+    Args:
+        test_class (str):
+            ``module:QualifiedName`` of the test class.
+
+        patches (List[PlannedPatch]):
+            Patches in the order they were started.
+
+        values (Dict[str, Any]):
+            Test instance attributes set by the setup, patches included, even inside lists,
+            tuples and dicts. ``add_fixture`` values are not planned since their contents must run
+            in the process using them.
+    """
+
+    test_class: str = None
+    patches: List[PlannedPatch] = field(default_factory=list)
+    values: Dict[str, Any] = field(default_factory=dict)
+
+    @staticmethod
+    def record(test_instance: MockerBuilder) -> PatchPlan:
+        """Plan of the patches started so far by ``test_instance`` setup.
+
+        Raises:
+            MockerBuilderException:
+                Raised when a patch parameter or an attribute can't be pickled, like lambdas, or
+                when an attribute is an ``add_fixture`` value.
+        """
+        cls = type(test_instance)
+        plan = PatchPlan(test_class=f"{cls.__module__}:{cls.__qualname__}")
+        indexes: Dict[int, int] = {}
+        for mock_metadata in Patcher.mocked_metadata():
+            planned = PlannedPatch.from_metadata(mock_metadata)
+            for key, value in planned.patch_kwargs.items():
+                if not _picklable(value):
+                    raise MockerBuilderException(
+                        f"Can't plan the {key} parameter of {planned.target_path} patch: "
+                        f"{type(value).__name__} is not picklable."
+                    )
+            indexes[id(mock_metadata._mock)] = len(plan.patches)
+            plan.patches.append(planned)
+        fixture_values = _fixture_values()
+        for name, value in vars(test_instance).items():
+            if name == 'mocker':
+                continue
+            if id(value) in fixture_values:
+                raise MockerBuilderException(
+                    f"Can't plan the {name} attribute: it's set up by the "
+                    f"{fixture_values[id(value)]} fixture content."
+                )
+            value = _to_plan(value, indexes)
+            if not _picklable(value):
+                raise MockerBuilderException(
+                    f"Can't plan the {name} attribute: {type(value).__name__} is not picklable."
+                )
+            plan.values[name] = value
+        return plan
+
+    def apply(self, test_instance: MockerBuilder):
+        """Start the planned patches and set the planned attributes on ``test_instance``."""
+        patches = [Patcher.dispatch(planned.metadata()) for planned in self.patches]
+        for name, value in self.values.items():
+            setattr(test_instance, name, _from_plan(value, patches))
+
+    def dumps(self) -> bytes:
+        return pickle.dumps(self)
+
+    @staticmethod
+    def loads(data: bytes) -> PatchPlan:
+        return pickle.loads(data)
+
+
+__all__ = [
+    "PatchPlan",
+    "PlannedPatch",
+]
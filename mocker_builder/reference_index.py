@@ -0,0 +1,171 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Reverse index of module globals to find everywhere a function or class was imported.
+###################################################################################################
+from __future__ import annotations
+import inspect
+import sys
+import threading
+from types import ModuleType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+
+class _ImportHook:
+    """``sys.meta_path`` finder telling the index which modules are being imported.
+
+    It never finds anything, it just lets only those modules be indexed later on.
+    """
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]] = None,
+        target: Optional[ModuleType] = None
+    ):
+        ReferenceIndex._pending.add(fullname)
+        return None
+
+    def invalidate_caches(self):
+        pass
+
+
+class ReferenceIndex:
+    """Reverse index from functions and classes to the module globals referencing them.
+
+    ``from module import function`` copies are found without scanning every module.
+
+    The index is built from ``sys.modules`` the first time it's used and kept up to date by an
+    import hook, indexing just the modules imported since the last lookup. Entries are checked
+    against the live module globals when read, so rebound names are never returned.
+
+    .. note::
+        Globals rebound at runtime to a function or class, after their module was imported, are
+        not indexed until the module is imported or reloaded again.
+
+    Args:
+        _references (Dict[int, Set[Tuple[str, str]]]):
+            ``(module name, global name)`` pairs by referenced object id.
+
+        _modules (Dict[str, int]):
+            Id of the indexed module object by module name.
+
+        _pending (Set[str]):
+            Modules imported since the last lookup.
+
+        _known_modules (int):
+            Size of ``sys.modules`` at the last lookup.
+
+        _hook (_ImportHook):
+            Import hook installed in ``sys.meta_path``, None while the index isn't built.
+
+        _session (Any):
+            pytest config of the session uninstalling the index when it finishes.
+    """
+
+    _references: Dict[int, Set[Tuple[str, str]]] = {}
+    _modules: Dict[str, int] = {}
+    _pending: Set[str] = set()
+    _known_modules: int = 0
+    _hook: Optional[_ImportHook] = None
+    _session: Any = None
+    _lock: threading.RLock = threading.RLock()
+
+    @staticmethod
+    def _indexable(value: Any) -> bool:
+        return inspect.isroutine(value) or inspect.isclass(value)
+
+    @staticmethod
+    def _add_module(name: str, module: ModuleType):
+        try:
+            attrs = list(vars(module).items())
+        except TypeError:  # module proxies without __dict__
+            return
+        references = ReferenceIndex._references
+        for attr, value in attrs:
+            if ReferenceIndex._indexable(value):
+                references.setdefault(id(value), set()).add((name, attr))
+        ReferenceIndex._modules[name] = id(module)
+
+    @staticmethod
+    def install():
+        """Build the index from ``sys.modules`` and install the import hook."""
+        with ReferenceIndex._lock:
+            if ReferenceIndex._hook is not None:
+                return
+            ReferenceIndex._hook = _ImportHook()
+            sys.meta_path.insert(0, ReferenceIndex._hook)
+            modules = list(sys.modules.items())
+            for name, module in modules:
+                if isinstance(module, ModuleType):
+                    ReferenceIndex._add_module(name, module)
+            ReferenceIndex._known_modules = len(modules)
+
+    @staticmethod
+    def uninstall():
+        """Remove the import hook and drop the index."""
+        with ReferenceIndex._lock:
+            if ReferenceIndex._hook in sys.meta_path:
+                sys.meta_path.remove(ReferenceIndex._hook)
+            ReferenceIndex._hook = None
+            ReferenceIndex._references.clear()
+            ReferenceIndex._modules.clear()
+            ReferenceIndex._pending.clear()
+            ReferenceIndex._known_modules = 0
+
+    @staticmethod
+    def uninstall_at_exit(pytest_config: Any):
+        """Uninstall the index when the pytest session of ``pytest_config`` finishes."""
+        if ReferenceIndex._session is not pytest_config:
+            ReferenceIndex._session = pytest_config
+            pytest_config.add_cleanup(ReferenceIndex.uninstall)
+
+    @staticmethod
+    def _sync():
+        modules = sys.modules
+        pending, ReferenceIndex._pending = ReferenceIndex._pending, set()
+        # Modules added to sys.modules by hand never go through the import system.
+        added = set()
+        if len(modules) != ReferenceIndex._known_modules:
+            added = modules.keys() - ReferenceIndex._modules.keys()
+            ReferenceIndex._known_modules = len(modules)
+        for name in pending | added:
+            module = modules.get(name)
+            if isinstance(module, ModuleType):
+                ReferenceIndex._add_module(name, module)
+
+    @staticmethod
+    def references(obj: Any) -> List[str]:
+        """Dotted paths of the module globals referencing ``obj``, sorted.
+
+        Args:
+            obj (Any):
+                Function or class to look for.
+
+        Returns:
+            List[str]:
+                Paths such as ``test_cases.main.who_is_the_best_hero``.
+        """
+        with ReferenceIndex._lock:
+            ReferenceIndex.install()
+            ReferenceIndex._sync()
+            # Entries not matching anymore are kept: they may be just patched for a while.
+            result = []
+            for module_name, attr in ReferenceIndex._references.get(id(obj), ()):
+                module = sys.modules.get(module_name)
+                if getattr(module, '__dict__', {}).get(attr) is obj:
+                    result.append(f"{module_name}.{attr}")
+            return sorted(result)
+
+
+__all__ = [
+    "ReferenceIndex",
+]
@@ -0,0 +1,235 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Resolution of dotted target paths, with the modules and classes of each prefix memoized.
+###################################################################################################
+from __future__ import annotations
+from dataclasses import dataclass
+from importlib import import_module
+import inspect
+import sys
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import weakref
+
+from .memory import _is_mock
+
+_MISSING = object()
+
+
+class _PrefixNode:
+    __slots__ = ('children', 'value', 'module_path')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _PrefixNode] = {}
+        self.value: Any = _MISSING
+        # Longest module prefix up to this node.
+        self.module_path: str = None
+
+
+@dataclass
+class ResolvedTarget:
+    """Objects along a dotted target path.
+
+    Args:
+        target_path (str):
+            Resolved path.
+
+        module_path (str):
+            Longest prefix of the path which is a module.
+
+        parent (Any):
+            Module, class or object holding the last attribute of the path.
+
+        attribute (str):
+            Last part of the path.
+
+        value (Any):
+            The target itself, or its ``parent`` when it's missing and allowed to be created.
+
+        owner (Any):
+            Class defining the attribute, found along the ``parent`` MRO, or the ``parent`` itself
+            when it's not a class.
+
+        raw (Any):
+            Attribute as stored by its ``owner``, so staticmethods and classmethods are kept as
+            they are.
+    """
+
+    target_path: str = None
+    module_path: str = None
+    parent: Any = None
+    attribute: str = None
+    value: Any = None
+    owner: Any = None
+    raw: Any = None
+
+
+class TargetResolver:
+    """Resolver of dotted paths like ``package.module.Outer.Inner.method``.
+
+    Paths like ``package.module.CONSTANT.attribute`` work as well: each part is looked up as an
+    attribute and imported as a submodule when it's not one yet, like ``mock.patch`` does, so the
+    longest importable module prefix is found without guessing what the middle parts are.
+
+    The modules and classes found for each prefix are memoized in a trie shared by every patch.
+    A memoized prefix is checked to still be its parent attribute before it's reused, so prefixes
+    replaced by patches are looked up again, and mocks are never memoized. Owners of inherited
+    attributes are memoized by class as well.
+
+    Args:
+        _root (_PrefixNode):
+            Trie of the resolved prefixes, a node by dotted part.
+
+        _owners (weakref.WeakKeyDictionary):
+            Class defining each attribute looked up, by class and attribute name.
+    """
+
+    _root: _PrefixNode = _PrefixNode()
+    _owners: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _memoizable(value: Any) -> bool:
+        return (inspect.ismodule(value) or inspect.isclass(value)) and not _is_mock(value)
+
+    @staticmethod
+    def _child(parent: Any, part: str, prefix: str) -> Any:
+        if not inspect.ismodule(parent) or not hasattr(parent, '__path__'):
+            # Raising the AttributeError of the missing part.
+            return getattr(parent, part)
+        # Submodules are attributes of their package once imported.
+        try:
+            return import_module(prefix)
+        except ModuleNotFoundError as ex:
+            if ex.name != prefix:
+                raise
+            # The missing part, not a module the submodule imports.
+            raise AttributeError(
+                f"module {parent.__name__!r} has no attribute or submodule {part!r}"
+            ) from ex
+
+    @staticmethod
+    def _walk(target_path: str, objects: Optional[List[Any]] = None) -> Tuple[_PrefixNode, Any]:
+        parts = target_path.split('.')
+        first = parts[0]
+        node = TargetResolver._root.children.get(first)
+        value = sys.modules.get(first, _MISSING)
+        # Nodes are added once their part is resolved, so a failed lookup leaves none behind.
+        if value is _MISSING or node is None or node.value is not value:
+            if value is _MISSING:
+                value = import_module(first)
+            if node is None:
+                node = TargetResolver._root.children[first] = _PrefixNode()
+            node.value = value
+            node.module_path = first
+        if objects is not None:
+            objects.append(value)
+        for position in range(1, len(parts)):
+            part = parts[position]
+            parent, child = value, node.children.get(part)
+            value = getattr(parent, part, _MISSING)
+            if value is _MISSING or child is None or child.value is not value:
+                if value is _MISSING:
+                    value = TargetResolver._child(parent, part, '.'.join(parts[:position + 1]))
+                if child is None:
+                    child = node.children[part] = _PrefixNode()
+                child.module_path = (
+                    '.'.join(parts[:position + 1]) if inspect.ismodule(value) else node.module_path
+                )
+                child.value = value if TargetResolver._memoizable(value) else _MISSING
+            if objects is not None:
+                objects.append(value)
+            node = child
+        return node, value
+
+    @staticmethod
+    def walk(target_path: str) -> List[Any]:
+        """Objects of each prefix of ``target_path``, the target itself last.
+
+        Raises:
+            ModuleNotFoundError:
+                Raised when the first part is not a module.
+
+            AttributeError:
+                Raised when a part is neither an attribute nor a submodule.
+        """
+        objects: List[Any] = []
+        TargetResolver._walk(target_path, objects)
+        return objects
+
+    @staticmethod
+    def lookup(target_path: str) -> Any:
+        """Object at ``target_path``."""
+        return TargetResolver._walk(target_path)[1]
+
+    @staticmethod
+    def owner_of(klass: type, attribute: str) -> Optional[type]:
+        """Class of the ``klass`` MRO defining ``attribute``, None when none does."""
+        owners = TargetResolver._owners.get(klass)
+        if owners is None:
+            owners = TargetResolver._owners[klass] = {}
+        owner = owners.get(attribute)
+        # Patches set and delete attributes on the classes they patch through subclasses.
+        if owner is not None and attribute in vars(owner) and (
+            owner is klass or attribute not in vars(klass)
+        ):
+            return owner
+        owner = next((base for base in klass.__mro__ if attribute in vars(base)), None)
+        if owner is not None:
+            owners[attribute] = owner
+        return owner
+
+    @staticmethod
+    def resolve(target_path: str, create: bool = False) -> ResolvedTarget:
+        """Objects along ``target_path``, which must have a parent, like ``module.attribute``.
+
+        Args:
+            target_path (str):
+                Dotted path of the target.
+
+            create (bool, optional):
+                Allow the last attribute to be missing. Defaults to False.
+
+        Raises:
+            AttributeError:
+                Raised when the target is missing and not allowed to be created.
+        """
+        owner_path, attribute = target_path.rsplit('.', 1)
+        node, parent = TargetResolver._walk(owner_path)
+        resolved = ResolvedTarget(
+            target_path=target_path,
+            module_path=node.module_path,
+            parent=parent,
+            attribute=attribute,
+            owner=parent
+        )
+        if inspect.isclass(parent):
+            owner = TargetResolver.owner_of(parent, attribute)
+            if owner is not None:
+                resolved.owner = owner
+                resolved.raw = vars(owner)[attribute]
+                resolved.value = getattr(parent, attribute)
+                return resolved
+        try:
+            resolved.value = resolved.raw = getattr(parent, attribute)
+        except AttributeError:
+            if not create:
+                raise
+            resolved.value = parent
+        return resolved
+
+    @staticmethod
+    def clear():
+        TargetResolver._root = _PrefixNode()
+        TargetResolver._owners = weakref.WeakKeyDictionary()
+
+
+__all__ = [
+    "ResolvedTarget",
+    "TargetResolver",
+]
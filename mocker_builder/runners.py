@@ -0,0 +1,521 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Runners of MockerBuilder test classes in forked children or in a pool of worker processes.
+###################################################################################################
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import inspect
+import json
+import multiprocessing
+import os
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import pytest
+from _pytest.runner import runtestprotocol
+from pytest_mock import MockFixture
+
+from .mocker_builder import (
+    FixtureCache,
+    MockerBuilder,
+    MockerBuilderConfig,
+    MockerBuilderException,
+    MockerBuilderWarning,
+    Patcher,
+    PatchSet,
+)
+from .patch_plan import PatchPlan
+from .timeline import CallTimeline
+
+
+class _ForkedChild:
+    """Initializer of the tests run by a forked child, which inherited the warmed setup."""
+
+    def __init__(self, warm_instance: MockerBuilder) -> None:
+        self.warm_instance = warm_instance
+
+    def initialize(
+        self,
+        fnc: Callable,
+        test_main_class: MockerBuilder,
+        mocker: MockFixture,
+        request: pytest.FixtureRequest
+    ) -> Generator:
+        vars(test_main_class).update(vars(self.warm_instance))
+        # Just the mocks used by the warm up or the tests run before in this child.
+        Patcher.reset_mocks()
+        # Recording side effects append to the warm timeline, so it's emptied in place.
+        CallTimeline.current().reset()
+        # The next test of the batch gets the warm patches back, without this test's changes.
+        with PatchSet().transaction():
+            yield
+
+
+class ForkServerRunner:
+    """Runs the tests of ``MockerBuilder`` classes configured with ``fork_server=True``.
+
+    The first test of a class runs ``mocker_builder_setup`` in the pytest process, so imports,
+    targets resolution and patching happen just once, then every test, or batch of
+    ``fork_batch_size`` tests, runs in a child forked from that state and sends its reports
+    back. The setup is torn down after the last test of the class.
+
+    Enable the plugin with ``-p mocker_builder.runners`` or from the root ``conftest.py``.
+
+    .. code-block::
+        :caption: Example
+
+            # conftest.py
+            pytest_plugins = ["mocker_builder.runners"]
+
+            # test_justice_league.py
+            class TestJusticeLeague(MockerBuilder):
+                mocker_builder_config = MockerBuilderConfig(fork_server=True, fork_batch_size=4)
+
+    Args:
+        _warm (Dict[type, Tuple[MockerBuilder, Generator]]):
+            Warmed up test instance and running initializer by test class.
+
+        _reports (Dict[str, List[Dict[str, Any]]]):
+            Serialized reports by node id of the tests already run by a batch.
+    """
+
+    _warm: Dict[type, Tuple[MockerBuilder, Generator]] = {}
+    _reports: Dict[str, List[Dict[str, Any]]] = {}
+
+    @staticmethod
+    def config(item: pytest.Item) -> Optional[MockerBuilderConfig]:
+        """Config of the ``item`` class if it opted in and this platform can fork."""
+        cls = getattr(item, 'cls', None)
+        if cls is None or not issubclass(cls, MockerBuilder) or not hasattr(os, 'fork'):
+            return None
+        config = getattr(cls, 'mocker_builder_config', None)
+        if config is None or not config.fork_server:
+            return None
+        return config
+
+    @staticmethod
+    def warm_up(item: pytest.Item):
+        cls = item.cls
+        if cls in ForkServerRunner._warm:
+            return
+        instance = cls()
+        initializer = ForkServerRunner._initializer(cls)
+        # No request: pytest doesn't own this setup, so class fixtures are finalized by cool_down.
+        running = MockerBuilder._initialize(initializer, instance, MockFixture(item.config), None)
+        next(running)
+        ForkServerRunner._warm[cls] = (instance, running)
+
+    @staticmethod
+    def cool_down(cls: type):
+        instance, running = ForkServerRunner._warm.pop(cls, (None, None))
+        if running is None:
+            return
+        try:
+            next(running, None)
+        finally:
+            instance.mocker.stopall()
+            FixtureCache.teardown('class')
+
+    @staticmethod
+    def _initializer(cls: type):
+        for klass in cls.__mro__:
+            setup = getattr(vars(klass).get('mocker_builder_setup'), 'mocker_builder_setup', None)
+            if setup is not None:
+                return setup
+        raise pytest.UsageError(
+            f"{cls.__name__} has no mocker_builder_setup decorated with MockerBuilder.initializer."
+        )
+
+    @staticmethod
+    def _batch(item: pytest.Item, size: int) -> List[pytest.Item]:
+        items = item.session.items
+        index = items.index(item)
+        batch = [item]
+        for following in items[index + 1:index + size]:
+            if following.cls is not item.cls:
+                break
+            batch.append(following)
+        return batch
+
+    @staticmethod
+    def _run_child(batch: List[pytest.Item], write_fd: int):
+        # Never returns: the child must not run anything else of the parent pytest session.
+        status = 0
+        try:
+            batch[0].cls._mocker_builder_runner = _ForkedChild(
+                ForkServerRunner._warm[batch[0].cls][0]
+            )
+            results = {}
+            for index, item in enumerate(batch):
+                nextitem = batch[index + 1] if index + 1 < len(batch) else None
+                results[item.nodeid] = [
+                    item.config.hook.pytest_report_to_serializable(config=item.config, report=report)
+                    for report in runtestprotocol(item, log=False, nextitem=nextitem)
+                ]
+            with os.fdopen(write_fd, 'w') as pipe:
+                json.dump(results, pipe)
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    @staticmethod
+    def _fork(batch: List[pytest.Item]) -> Dict[str, List[Dict[str, Any]]]:
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            ForkServerRunner._run_child(batch, write_fd)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            data = pipe.read()
+        _, status = os.waitpid(pid, 0)
+        if data:
+            return json.loads(data)
+        return {
+            item.nodeid: [ForkServerRunner._crash_report(item, status)]
+            for item in batch
+        }
+
+    @staticmethod
+    def _crash_report(item: pytest.Item, status: int) -> Dict[str, Any]:
+        report = pytest.TestReport(
+            item.nodeid,
+            item.location,
+            {name: 1 for name in item.keywords},
+            'failed',
+            f"Forked test process crashed with wait status {status}.",
+            'call'
+        )
+        return item.config.hook.pytest_report_to_serializable(config=item.config, report=report)
+
+    @staticmethod
+    def run(item: pytest.Item, nextitem: Optional[pytest.Item]) -> bool:
+        """Run ``item`` in a forked child, or log its reports if a batch already ran it."""
+        config = ForkServerRunner.config(item)
+        if config is None:
+            return False
+        reports = ForkServerRunner._reports.pop(item.nodeid, None)
+        if reports is None:
+            try:
+                ForkServerRunner.warm_up(item)
+            except Exception:
+                # Run it as usual so pytest reports the setup error.
+                return False
+            results = ForkServerRunner._fork(
+                ForkServerRunner._batch(item, max(config.fork_batch_size, 1))
+            )
+            reports = results.pop(item.nodeid)
+            ForkServerRunner._reports.update(results)
+
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for data in reports:
+            report = item.config.hook.pytest_report_from_serializable(
+                config=item.config, data=data
+            )
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+        if nextitem is None or nextitem.cls is not item.cls:
+            ForkServerRunner.cool_down(item.cls)
+        return True
+
+
+class _PlanRecorder:
+    """Initializer recording the patch plan of the setup it runs."""
+
+    def __init__(self) -> None:
+        self.plan: Optional[PatchPlan] = None
+        self.error: Optional[str] = None
+
+    def initialize(
+        self,
+        fnc: Callable,
+        test_main_class: MockerBuilder,
+        mocker: MockFixture,
+        request: pytest.FixtureRequest
+    ) -> Generator:
+        running = MockerBuilder._initialize(fnc, test_main_class, mocker, request)
+        setup = next(running)
+        try:
+            self.plan = PatchPlan.record(test_main_class)
+        except MockerBuilderException as ex:
+            self.error = str(ex)
+        yield setup
+        next(running, None)
+
+
+class _PlanReplay:
+    """Initializer replaying a patch plan instead of running the setup.
+
+    The calls of each mock are kept by test.
+    """
+
+    def __init__(self, plan: PatchPlan) -> None:
+        self.plan = plan
+        self.calls: Dict[str, Dict[str, int]] = {}
+
+    def initialize(
+        self,
+        fnc: Callable,
+        test_main_class: MockerBuilder,
+        mocker: MockFixture,
+        request: pytest.FixtureRequest
+    ) -> Generator:
+        running = MockerBuilder._initialize(self.plan.apply, test_main_class, mocker, request)
+        yield next(running)
+        self.calls[request.node.nodeid] = _call_counts()
+        next(running, None)
+
+
+def _call_counts() -> Dict[str, int]:
+    return {
+        mock_metadata.target_path: mock_metadata._mock.call_count
+        for mock_metadata in Patcher.mocked_metadata()
+        if isinstance(getattr(mock_metadata._mock, 'call_count', None), int)
+    }
+
+
+@dataclass
+class TestOutcome:
+    """Compact result of a test run by a ``ProcessPoolRunner`` worker.
+
+    Args:
+        nodeid (str):
+            Test node id.
+
+        outcome (str):
+            ``passed``, ``failed`` or ``skipped``.
+
+        duration (float):
+            Seconds taken by the setup, call and teardown phases.
+
+        longrepr (str):
+            Failure report, empty when passed.
+
+        calls (Dict[str, int]):
+            Calls into each patched target during the test.
+    """
+
+    __test__ = False
+
+    nodeid: str = None
+    outcome: str = 'passed'
+    duration: float = 0.0
+    longrepr: str = ''
+    calls: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class PoolReport:
+    """Outcomes of a test class run by a ``ProcessPoolRunner``.
+
+    Args:
+        outcomes (List[TestOutcome]):
+            Outcomes in node id order.
+
+        elapsed (float):
+            Wall time of the whole run in seconds, planning included.
+
+        workers (int):
+            Worker processes used.
+
+        planned (bool):
+            Whether workers replayed a patch plan or ran the setup themselves.
+    """
+
+    outcomes: List[TestOutcome] = field(default_factory=list)
+    elapsed: float = 0.0
+    workers: int = 1
+    planned: bool = False
+
+    @property
+    def passed(self) -> bool:
+        return all(outcome.outcome != 'failed' for outcome in self.outcomes)
+
+    @property
+    def failures(self) -> List[TestOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.outcome == 'failed']
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        """Calls into each patched target summed over all tests."""
+        totals: Dict[str, int] = {}
+        for outcome in self.outcomes:
+            for target_path, calls in outcome.calls.items():
+                totals[target_path] = totals.get(target_path, 0) + calls
+        return totals
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.outcomes)} tests on {self.workers} workers in {self.elapsed:.2f}s: "
+            f"{len(self.failures)} failed"
+        )
+
+
+class _WorkerPlugin:
+    """pytest plugin of a worker session, taking over the setup of the class with ``runner``.
+
+    It keeps the tests from ``index`` every ``count`` ones, or just the first one without
+    ``count``.
+    """
+
+    def __init__(self, runner: Any, index: int = 0, count: int = None) -> None:
+        self.runner = runner
+        self.index = index
+        self.count = count
+        self.outcomes: Dict[str, TestOutcome] = {}
+        self._classes: List[type] = []
+
+    def pytest_collection_modifyitems(self, items: List[pytest.Item]):
+        items[:] = items[self.index::self.count] if self.count else items[:1]
+        for item in items:
+            if item.cls is not None and item.cls not in self._classes:
+                item.cls._mocker_builder_runner = self.runner
+                self._classes.append(item.cls)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport):
+        outcome = self.outcomes.setdefault(report.nodeid, TestOutcome(nodeid=report.nodeid))
+        outcome.duration += report.duration
+        if report.outcome != 'passed' and outcome.outcome != 'failed':
+            outcome.outcome = report.outcome
+            outcome.longrepr = str(report.longrepr)
+
+    def pytest_sessionfinish(self):
+        # Workers are reused for other sessions, which may not replay a plan.
+        for cls in self._classes:
+            del cls._mocker_builder_runner
+
+    def results(self) -> List[TestOutcome]:
+        for nodeid, calls in getattr(self.runner, 'calls', {}).items():
+            if nodeid in self.outcomes:
+                self.outcomes[nodeid].calls = calls
+        return list(self.outcomes.values())
+
+
+class _RecordPlugin(_WorkerPlugin):
+    """pytest plugin of the worker recording the plan: sets up the first test, without running it."""
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem: pytest.Function) -> bool:
+        return True
+
+
+_WORKER_ARGS = ['-p', 'no:cacheprovider', '-p', 'no:terminal']
+
+
+def _record_plan(nodeid: str) -> Tuple[Optional[bytes], Optional[str]]:
+    recorder = _PlanRecorder()
+    pytest.main([nodeid, *_WORKER_ARGS], plugins=[_RecordPlugin(recorder)])
+    if recorder.plan is None:
+        return None, recorder.error or "The setup didn't run."
+    return recorder.plan.dumps(), None
+
+
+def _run_shard(nodeid: str, index: int, count: int, plan: Optional[bytes]) -> List[TestOutcome]:
+    runner = _PlanReplay(PatchPlan.loads(plan)) if plan is not None else None
+    plugin = _WorkerPlugin(runner, index, count)
+    pytest.main([nodeid, *_WORKER_ARGS], plugins=[plugin])
+    return plugin.results()
+
+
+class ProcessPoolRunner:
+    """Runs the tests of a ``MockerBuilder`` class spread over a ``ProcessPoolExecutor``.
+
+    No ``pytest-xdist`` is needed. A first worker runs the class setup once, without running any
+    test, and records it as a ``PatchPlan``. Then every worker runs a shard of the tests in its own
+    pytest session, replaying the plan instead of the setup. Setups that can't be planned, like patches
+    with lambda side effects or ``add_fixture`` values, run for each test as usual. Workers send
+    back compact ``TestOutcome`` results with the calls into each patched target, aggregated
+    into a ``PoolReport``.
+
+    .. code-block::
+        :caption: Example
+
+            if __name__ == '__main__':
+                report = ProcessPoolRunner(TestJusticeLeague, max_workers=8).run()
+                print(report, report.calls)
+
+    Args:
+        test_class (type):
+            ``MockerBuilder`` test class to run.
+
+        max_workers (int, optional):
+            Worker processes. Defaults to the CPU count.
+
+        shards (int, optional):
+            Parts the tests are split into. Defaults to ``max_workers``.
+
+        mp_context (BaseContext, optional):
+            Multiprocessing context of the pool. Defaults to ``spawn``, so workers don't inherit
+            the state of the calling process.
+    """
+
+    def __init__(
+        self,
+        test_class: type,
+        max_workers: int = None,
+        shards: int = None,
+        mp_context: multiprocessing.context.BaseContext = None
+    ) -> None:
+        if not issubclass(test_class, MockerBuilder):
+            raise MockerBuilderException(f"{test_class.__name__} is not a MockerBuilder class.")
+        self.test_class = test_class
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shards = shards or self.max_workers
+        self.mp_context = mp_context or multiprocessing.get_context('spawn')
+
+    @property
+    def nodeid(self) -> str:
+        return f"{inspect.getfile(self.test_class)}::{self.test_class.__qualname__}"
+
+    @property
+    def class_path(self) -> str:
+        return f"{self.test_class.__module__}:{self.test_class.__qualname__}"
+
+    def run(self) -> PoolReport:
+        started = time.perf_counter()
+        with ProcessPoolExecutor(self.max_workers, mp_context=self.mp_context) as executor:
+            plan, error = executor.submit(_record_plan, self.nodeid).result()
+            if error:
+                MockerBuilderWarning.warn(f"Running {self.class_path} setup per test. {error}")
+            shards = [
+                executor.submit(_run_shard, self.nodeid, index, self.shards, plan)
+                for index in range(self.shards)
+            ]
+            outcomes = [outcome for shard in shards for outcome in shard.result()]
+        return PoolReport(
+            outcomes=sorted(outcomes, key=lambda outcome: outcome.nodeid),
+            elapsed=time.perf_counter() - started,
+            workers=self.max_workers,
+            planned=plan is not None,
+        )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: Optional[pytest.Item]) -> Optional[bool]:
+    return ForkServerRunner.run(item, nextitem) or None
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    # Classes left warm when the session was interrupted, like with --exitfirst.
+    for cls in list(ForkServerRunner._warm):
+        ForkServerRunner.cool_down(cls)
+
+
+__all__ = [
+    "ForkServerRunner",
+    "PoolReport",
+    "ProcessPoolRunner",
+    "TestOutcome",
+]
@@ -0,0 +1,163 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Dispatchers standing in for patched targets to route each asyncio task or thread to its own mock.
+###################################################################################################
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+import threading
+from typing import Any, Optional
+
+
+_DISPATCHER_SLOTS = frozenset({'target_path', 'original', '_get', '_var', '_local'})
+
+
+class _Activation:
+    """Mock made visible to a scope by a scoped patch.
+
+    Stopping the patch just deactivates it, so a patch stopped from another scope (like the test
+    teardown) doesn't leak its mock, and the activation it shadowed becomes visible again.
+    """
+
+    __slots__ = ('mock', 'previous', 'active')
+
+    def __init__(self, mock: Any, previous: Optional[_Activation]) -> None:
+        self.mock = mock
+        self.previous = previous
+        self.active = True
+
+
+class ScopedDispatcher(ABC):
+    """Object set in place of a patched target, forwarding to the mock active for the scope.
+
+    Calls and attribute lookups go to the mock active for the current scope, or to the original
+    target where no mock is active. Accessed through instances of a patched class it hands the
+    mock out unbound, like ``mock.patch`` does.
+
+    Args:
+        target_path (str):
+            Patched target.
+
+        original (Any):
+            Original target, as found in its owner ``__dict__``.
+    """
+
+    __slots__ = ('target_path', 'original', '_get', '__weakref__')
+    scope: str = None
+
+    def __init__(self, target_path: str, original: Any) -> None:
+        self.target_path = target_path
+        self.original = original
+        self._get = getattr(type(original), '__get__', None)
+
+    @abstractmethod
+    def _current(self) -> Optional[_Activation]:
+        raise NotImplementedError("Please, implement me!")
+
+    @abstractmethod
+    def _store(self, activation: Optional[_Activation]):
+        raise NotImplementedError("Please, implement me!")
+
+    def active_mock(self) -> Optional[Any]:
+        """Mock active for the current scope, None to use the original target."""
+        activation = self._current()
+        while activation is not None and not activation.active:
+            activation = activation.previous
+        return activation.mock if activation is not None else None
+
+    def activate(self, mock: Any) -> _Activation:
+        """Make ``mock`` the one seen by the current scope."""
+        activation = _Activation(mock, self._current())
+        self._store(activation)
+        return activation
+
+    def deactivate(self, activation: _Activation):
+        """Hide the mock of ``activation``. It can be called from any scope."""
+        activation.active = False
+        if self._current() is activation:
+            self._store(activation.previous)
+
+    def resolve(self, instance: Any = None, owner: type = None) -> Any:
+        """Active mock, or the original target bound to ``instance`` or ``owner``."""
+        # Inlined active_mock: it runs on every call of the patched target.
+        activation = self._current()
+        while activation is not None:
+            if activation.active:
+                return activation.mock
+            activation = activation.previous
+        if self._get is None or (instance is None and owner is None):
+            return self.original
+        return self._get(self.original, instance, owner)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        return self.resolve(instance, owner)
+
+    def __getattr__(self, name: str) -> Any:
+        # Slots not set yet must not recurse into resolve.
+        if name in _DISPATCHER_SLOTS:
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.target_path} -> {self.resolve()!r}>"
+
+
+class ContextDispatcher(ScopedDispatcher):
+    """Dispatcher resolving the mock from a ``ContextVar``.
+
+    Each asyncio task sees the mock patched by itself or inherited from the context it was created
+    from, with no locking.
+    """
+
+    __slots__ = ('_var',)
+    scope = 'task'
+
+    def __init__(self, target_path: str, original: Any) -> None:
+        super().__init__(target_path, original)
+        self._var: ContextVar[Optional[_Activation]] = ContextVar(
+            f"mocker_builder:{target_path}", default=None
+        )
+
+    def _current(self) -> Optional[_Activation]:
+        return self._var.get()
+
+    def _store(self, activation: Optional[_Activation]):
+        self._var.set(activation)
+
+
+class ThreadDispatcher(ScopedDispatcher):
+    """Dispatcher resolving the mock from a ``threading.local``.
+
+    Each thread sees just the mock it patched. Threads started afterwards don't inherit it, unlike
+    asyncio tasks.
+    """
+
+    __slots__ = ('_local',)
+    scope = 'thread'
+
+    def __init__(self, target_path: str, original: Any) -> None:
+        super().__init__(target_path, original)
+        self._local = threading.local()
+
+    def _current(self) -> Optional[_Activation]:
+        return getattr(self._local, 'activation', None)
+
+    def _store(self, activation: Optional[_Activation]):
+        self._local.activation = activation
+
+
+SCOPED_DISPATCHERS = {
+    ContextDispatcher.scope: ContextDispatcher,
+    ThreadDispatcher.scope: ThreadDispatcher,
+}
+
+__all__ = [
+    "ScopedDispatcher",
+    "ContextDispatcher",
+    "ThreadDispatcher",
+    "SCOPED_DISPATCHERS",
+]
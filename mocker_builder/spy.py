@@ -0,0 +1,215 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Call counting spies leaving the real target in place, through sys.monitoring where available.
+###################################################################################################
+from __future__ import annotations
+import functools
+import inspect
+import sys
+from types import CodeType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+SPY_MODES = ('monitor', 'wrap')
+_TOOL_NAME = "mocker-builder"
+# Ids sys.monitoring leaves free for tools other than debuggers, coverage, profilers and optimizers
+# first, then the profiler one.
+_TOOL_IDS = (3, 4, 2)
+
+
+class CallSpy:
+    """Counter of the calls of a real target, which keeps running as usual.
+
+    Args:
+        target_path (str):
+            Spied target.
+
+        mode (str):
+            ``monitor`` when counted by ``sys.monitoring`` events, ``wrap`` when counted by a thin
+            wrapper set in place of the target.
+
+        calls (int):
+            Calls counted so far.
+    """
+
+    def __init__(self, target_path: str, mode: str) -> None:
+        self.target_path = target_path
+        self.mode = mode
+        self.calls = 0
+
+    @property
+    def called(self) -> bool:
+        return self.calls > 0
+
+    def assert_called(self):
+        if not self.calls:
+            raise AssertionError(f"Expected {self.target_path} to have been called.")
+
+    def assert_not_called(self):
+        if self.calls:
+            raise AssertionError(
+                f"Expected {self.target_path} not to have been called. Called {self.calls} times."
+            )
+
+    def assert_called_times(self, calls: int):
+        if self.calls != calls:
+            raise AssertionError(
+                f"Expected {self.target_path} to have been called {calls} times. "
+                f"Called {self.calls} times."
+            )
+
+    def reset(self):
+        self.calls = 0
+
+    def stop(self):
+        """Stop counting. Called at the test teardown as well."""
+        raise NotImplementedError("Please, implement me!")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.target_path} ({self.mode}): {self.calls} calls>"
+
+
+class MonitorSpy(CallSpy):
+    """Spy counting the ``PY_START`` events of the target code object with ``sys.monitoring``.
+
+    Events are enabled just for that code object, so the target itself is not replaced and other
+    code runs with no overhead at all. Calls through any reference to the function are counted, module
+    globals copied by ``from module import function`` included, as well as calls of every function
+    sharing its code, like closures made by the same ``def``.
+
+    Args:
+        _code (CodeType):
+            Code object of the spied function.
+
+        _tool_id (int):
+            ``sys.monitoring`` tool id, while any monitor spy is active.
+
+        _spies (Dict[int, List[MonitorSpy]]):
+            Active spies by id of their code object. Code objects are hashed by value, slowly.
+    """
+
+    _tool_id: Optional[int] = None
+    _spies: Dict[int, List[MonitorSpy]] = {}
+
+    def __init__(self, target_path: str, code: CodeType) -> None:
+        super().__init__(target_path, 'monitor')
+        self._code = code
+
+    @staticmethod
+    def available() -> bool:
+        monitoring = getattr(sys, 'monitoring', None)
+        if monitoring is None:
+            return False
+        if MonitorSpy._tool_id is not None:
+            return True
+        return any(monitoring.get_tool(tool_id) is None for tool_id in _TOOL_IDS)
+
+    @staticmethod
+    def _on_start(code: CodeType, instruction_offset: int):
+        for spy in MonitorSpy._spies.get(id(code), ()):
+            spy.calls += 1
+
+    @staticmethod
+    def _acquire() -> int:
+        if MonitorSpy._tool_id is None:
+            monitoring = sys.monitoring
+            tool_id = next(
+                tool_id for tool_id in _TOOL_IDS if monitoring.get_tool(tool_id) is None
+            )
+            monitoring.use_tool_id(tool_id, _TOOL_NAME)
+            monitoring.register_callback(tool_id, monitoring.events.PY_START, MonitorSpy._on_start)
+            MonitorSpy._tool_id = tool_id
+        return MonitorSpy._tool_id
+
+    @staticmethod
+    def _release():
+        monitoring = sys.monitoring
+        monitoring.register_callback(MonitorSpy._tool_id, monitoring.events.PY_START, None)
+        monitoring.free_tool_id(MonitorSpy._tool_id)
+        MonitorSpy._tool_id = None
+
+    def start(self) -> MonitorSpy:
+        tool_id = MonitorSpy._acquire()
+        spies = MonitorSpy._spies.setdefault(id(self._code), [])
+        if not spies:
+            sys.monitoring.set_local_events(tool_id, self._code, sys.monitoring.events.PY_START)
+        spies.append(self)
+        return self
+
+    def stop(self):
+        spies = MonitorSpy._spies.get(id(self._code), [])
+        if self not in spies:
+            return
+        spies.remove(self)
+        if spies:
+            return
+        del MonitorSpy._spies[id(self._code)]
+        sys.monitoring.set_local_events(MonitorSpy._tool_id, self._code, 0)
+        if not MonitorSpy._spies:
+            MonitorSpy._release()
+
+
+class WrapperSpy(CallSpy):
+    """Spy counting calls with a thin wrapper set in place of the target.
+
+    It's used for Pythons without ``sys.monitoring`` and targets with no code object of their own,
+    like builtins. Just calls through the patched attribute are counted.
+
+    Args:
+        _patch (Any):
+            Patch setting the wrapper in place of the target, stopped with the spy.
+    """
+
+    def __init__(self, target_path: str) -> None:
+        super().__init__(target_path, 'wrap')
+        self._patch = None
+
+    def wrapper(self, original: Any) -> Any:
+        """Build the counting replacement of ``original``, keeping its staticmethod or classmethod."""
+        method_type = type(original) if isinstance(original, (staticmethod, classmethod)) else None
+        function: Callable = original.__func__ if method_type else original
+        spy = self
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def counted(*args, **kwargs):
+                spy.calls += 1
+                return await function(*args, **kwargs)
+        else:
+            @functools.wraps(function)
+            def counted(*args, **kwargs):
+                spy.calls += 1
+                return function(*args, **kwargs)
+        return method_type(counted) if method_type else counted
+
+    def start(self, _patch: Any) -> WrapperSpy:
+        self._patch = _patch
+        _patch.start()
+        return self
+
+    def stop(self):
+        if self._patch is not None:
+            self._patch.stop()
+            self._patch = None
+
+
+def _code_of(original: Any) -> Optional[CodeType]:
+    # Code object run by calls of the raw class or module attribute, None for builtins and
+    # callables with no code of their own.
+    if isinstance(original, (staticmethod, classmethod)):
+        original = original.__func__
+    return getattr(original, '__code__', None) if inspect.isfunction(original) else None
+
+
+__all__ = [
+    "CallSpy",
+    "MonitorSpy",
+    "WrapperSpy",
+    "SPY_MODES",
+]
@@ -0,0 +1,137 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Cases and results of the return value and side effect sweeps run on one live patch.
+###################################################################################################
+from __future__ import annotations
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import traceback
+from typing import (
+    Any,
+    List,
+    Optional,
+)
+
+
+@dataclass
+class SweepCase:
+    """Run of the sweep body against one of the swept values.
+
+    Args:
+        index (int):
+            Position of the value in the sweep.
+
+        value (Any):
+            Return value or side effect the mock had for this case.
+
+        calls (int):
+            Calls of the mock made by this case, counted apart even when cases run concurrently.
+
+        error (BaseException):
+            Exception raised by the body, None when it passed.
+
+        effect (Any):
+            Side effect applied to the calls of this case.
+    """
+
+    index: int = 0
+    value: Any = None
+    calls: int = 0
+    error: Optional[BaseException] = None
+    effect: Any = field(default=None, repr=False)
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None
+
+    def __str__(self) -> str:
+        outcome = "passed" if self.passed else f"failed: {self.error!r}"
+        return f"case {self.index} {self.value!r} ({self.calls} calls) {outcome}"
+
+
+@dataclass
+class SweepResult:
+    """Cases of a sweep, in the order of the swept values.
+
+    .. code-block::
+        :caption: Example
+
+            result = mock_eating_banana.sweep(
+                ["banana", "", None],
+                lambda value: my_heroes.is_eating_banana()
+            )
+            result.assert_passed()
+
+    Args:
+        target_path (str):
+            Swept target.
+
+        cases (List[SweepCase]):
+            Every case run.
+    """
+
+    target_path: str = None
+    cases: List[SweepCase] = field(default_factory=list)
+
+    @property
+    def failures(self) -> List[SweepCase]:
+        return [case for case in self.cases if not case.passed]
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    def assert_passed(self):
+        """Fail with every failed case and the traceback of the first one."""
+        failures = self.failures
+        if not failures:
+            return
+        first = "".join(traceback.format_exception(
+            type(failures[0].error), failures[0].error, failures[0].error.__traceback__
+        ))
+        lines = [f"{len(failures)} of {len(self.cases)} sweep cases of {self.target_path} failed:"]
+        lines.extend(f"    {case}" for case in failures)
+        lines.append(f"\nFirst failure:\n{first}")
+        raise AssertionError("\n".join(lines))
+
+    def __str__(self) -> str:
+        passed = len(self.cases) - len(self.failures)
+        lines = [f"{self.target_path}: {passed} of {len(self.cases)} cases passed"]
+        lines.extend(f"    {case}" for case in self.cases)
+        return "\n".join(lines)
+
+
+class SweepCases:
+    """Case the calls of a swept mock belong to.
+
+    That's the running case for sequential sweeps, even when the mock is called from other
+    threads, and the case of the calling task for concurrent sweeps.
+
+    Args:
+        side_effects (bool):
+            Swept values are side effects instead of return values.
+    """
+
+    def __init__(self, side_effects: bool) -> None:
+        self.side_effects = side_effects
+        self._task_case: ContextVar[Optional[SweepCase]] = ContextVar(
+            'mocker_builder_sweep_case', default=None
+        )
+        self._case: Optional[SweepCase] = None
+
+    def enter(self, case: SweepCase, task_local: bool = False):
+        if task_local:
+            self._task_case.set(case)
+        else:
+            self._case = case
+
+    def current(self) -> Optional[SweepCase]:
+        return self._task_case.get() or self._case
+
+
+__all__ = [
+    "SweepCase",
+    "SweepCases",
+    "SweepResult",
+]
@@ -0,0 +1,238 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# One ordered timeline of the calls of every mock of a test, kept in a compact array.
+###################################################################################################
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+import inspect
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .memory import _is_mock
+
+_INDEX_BITS = 16
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+_DIGEST_MASK = (1 << (64 - _INDEX_BITS)) - 1
+_SHOWN_CALLS = 20
+
+# Target path, with the digest of the expected call arguments or None for any call.
+ExpectedCall = Tuple[str, Optional[int]]
+
+
+@dataclass(frozen=True)
+class _MockArgument:
+    # Stands for a mock argument, which is digested by identity: hashing a MagicMock calls its
+    # __hash__ mock, recording the call in its mock_calls.
+    mock_id: int
+
+
+def _digestible(value: Any) -> Any:
+    if _is_mock(value):
+        return _MockArgument(id(value))
+    if type(value) in (list, tuple):
+        return type(value)(_digestible(item) for item in value)
+    if type(value) is dict:
+        return {key: _digestible(item) for key, item in value.items()}
+    return value
+
+
+def call_digest(args: Tuple, kwargs: Dict[str, Any]) -> int:
+    """Digest of call arguments kept in the timeline instead of the arguments themselves.
+
+    Hashable arguments are hashed, mocks by identity and the other ones by their repr.
+    """
+    args = _digestible(args)
+    kwargs = _digestible(kwargs)
+    try:
+        digest = hash((args, frozenset(kwargs.items()))) if kwargs else hash(args)
+    except TypeError:
+        digest = hash(repr((args, sorted(kwargs.items()))))
+    return digest & _DIGEST_MASK
+
+
+@dataclass
+class TimelineEntry:
+    """Call in a ``CallTimeline``.
+
+    Args:
+        seq (int):
+            Order of the call among the calls of every mock of the test.
+
+        target_path (str):
+            Patched target called.
+
+        digest (int):
+            ``call_digest`` of the call arguments.
+    """
+
+    seq: int = 0
+    target_path: str = None
+    digest: int = 0
+
+
+class CallTimeline:
+    """Calls of the mocks patched with ``timeline=True``, in the order they happened across mocks.
+
+    Every mock of the classes configured with ``call_timeline=True`` is recorded too. Each call is
+    a single 64 bits integer in an ``array``, the index of its target and the digest of its
+    arguments, appended in one step, so calls from other threads never split an entry.
+
+    .. code-block::
+        :caption: Example
+
+            class TestJusticeLeague(MockerBuilder):
+                mocker_builder_config = MockerBuilderConfig(call_timeline=True)
+
+                def test_heroes_called_in_order(self):
+                    JusticeLeague().call_everybody()
+                    self.assert_called_in_order(
+                        self.mock_batman_says,
+                        (self.mock_robin_says, call("Holy crap!")),
+                    )
+
+    Args:
+        _current (CallTimeline):
+            Timeline of the running test.
+
+        _every_patch (bool):
+            Every patch of the running test records into the timeline, unless it opts out.
+    """
+
+    _current: Optional[CallTimeline] = None
+    _every_patch: bool = False
+
+    def __init__(self) -> None:
+        self._calls = array('Q')
+        self._indexes: Dict[str, int] = {}
+        self._targets: List[str] = []
+
+    @staticmethod
+    def current() -> CallTimeline:
+        """Timeline of the running test, created on first use."""
+        if CallTimeline._current is None:
+            CallTimeline._current = CallTimeline()
+        return CallTimeline._current
+
+    @staticmethod
+    def start(every_patch: bool):
+        CallTimeline._current = CallTimeline()
+        CallTimeline._every_patch = every_patch
+
+    @staticmethod
+    def finish():
+        CallTimeline._current = None
+        CallTimeline._every_patch = False
+
+    def register(self, target_path: str) -> int:
+        index = self._indexes.get(target_path)
+        if index is None:
+            if len(self._targets) > _INDEX_MASK:
+                raise OverflowError(f"More than {_INDEX_MASK + 1} targets in a call timeline.")
+            index = self._indexes[target_path] = len(self._targets)
+            self._targets.append(target_path)
+        return index
+
+    def wrap(self, target_path: str, side_effect: Callable) -> Callable:
+        """Side effect appending the call of ``target_path`` to the timeline.
+
+        The call is appended before applying ``side_effect``, which must take the call arguments.
+        """
+        index = self.register(target_path)
+        append = self._calls.append
+
+        def recorded(*args, **kwargs):
+            append(call_digest(args, kwargs) << _INDEX_BITS | index)
+            return side_effect(*args, **kwargs)
+
+        if inspect.iscoroutinefunction(side_effect):
+            # Async mocks await just coroutine function side effects.
+            async def async_recorded(*args, **kwargs):
+                return await recorded(*args, **kwargs)
+            async_recorded.timeline = self
+            return async_recorded
+        recorded.timeline = self
+        return recorded
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __iter__(self) -> Iterator[TimelineEntry]:
+        targets = self._targets
+        for seq, value in enumerate(self._calls):
+            yield TimelineEntry(
+                seq=seq,
+                target_path=targets[value & _INDEX_MASK],
+                digest=value >> _INDEX_BITS
+            )
+
+    def _expected_index(self, expected: Union[str, ExpectedCall]) -> Tuple[int, Optional[int]]:
+        target_path, digest = (expected, None) if isinstance(expected, str) else expected
+        index = self._indexes.get(target_path)
+        if index is None:
+            raise AssertionError(f"{target_path} is not recorded in the call timeline.")
+        return index, digest
+
+    def assert_called_in_order(self, *expected: Union[str, ExpectedCall]):
+        """Fail unless the ``expected`` calls happened in this order, other calls in between allowed.
+
+        Each one is a target path, for any call of it, or a target path and the ``call_digest`` of
+        the arguments it must be called with. Matching is a single pass over the timeline.
+        """
+        wanted = [self._expected_index(item) for item in expected]
+        position = 0
+        for value in self._calls:
+            if position == len(wanted):
+                return
+            index, digest = wanted[position]
+            if value & _INDEX_MASK == index and digest in (None, value >> _INDEX_BITS):
+                position += 1
+        if position == len(wanted):
+            return
+        raise AssertionError(self._order_error(wanted, position))
+
+    def _order_error(self, wanted: Sequence[Tuple[int, Optional[int]]], position: int) -> str:
+        targets = self._targets
+        relevant = {index for index, _ in wanted}
+        called = [
+            f"{seq}: {targets[value & _INDEX_MASK]}"
+            for seq, value in enumerate(self._calls)
+            if value & _INDEX_MASK in relevant
+        ]
+        shown = called[:_SHOWN_CALLS]
+        if len(called) > len(shown):
+            shown.append(f"... {len(called) - len(shown)} more")
+        index, digest = wanted[position]
+        missing = targets[index] + ("" if digest is None else " with the expected arguments")
+        lines = [
+            f"Calls not in the expected order: matched {position} of {len(wanted)}, then no call "
+            f"of {missing}.",
+            "Expected:",
+        ]
+        lines.extend(
+            f"    {targets[index]}" + ("" if digest is None else " (with arguments)")
+            for index, digest in wanted
+        )
+        lines.append("Called:")
+        lines.extend(f"    {line}" for line in shown)
+        return "\n".join(lines)
+
+    def reset(self):
+        del self._calls[:]
+
+
+__all__ = [
+    "CallTimeline",
+    "TimelineEntry",
+    "call_digest",
+]
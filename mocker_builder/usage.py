@@ -0,0 +1,297 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Report of the patches set up for each test but never called or accessed by it.
+###################################################################################################
+from __future__ import annotations
+from dataclasses import asdict, dataclass, field
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .memory import _call_list, _child_mocks, _is_mock
+
+
+def _fingerprint(mock: Any) -> Tuple[int, int, int]:
+    # Calls of the mock tree, mocks in it and the return value: any of them changing means the
+    # mock was called or accessed. Read from the mocks __dict__, so taking the fingerprint doesn't
+    # create children itself.
+    nodes, seen = [mock], set()
+    while nodes:
+        node = nodes.pop()
+        if id(node) not in seen:
+            seen.add(id(node))
+            nodes.extend(_child_mocks(node))
+    return (
+        len(_call_list(mock, 'mock_calls')),
+        len(seen),
+        id(vars(mock).get('_mock_return_value')),
+    )
+
+
+def _watch_reads(mock: Any, target_path: str, reads: Set[str]) -> Optional[type]:
+    # Reads like ``called``, ``call_count`` or ``assert_called`` leave no trace on the mock, so
+    # they are flagged by a __getattribute__ set on the class every mock instance gets for itself.
+    # Private names are left out: mocks read them themselves.
+    cls = type(mock)
+    if '__getattribute__' in vars(cls):
+        return None
+    getattribute = cls.__getattribute__
+
+    def __getattribute__(self, name):
+        if not name.startswith('_'):
+            reads.add(target_path)
+        return getattribute(self, name)
+
+    cls.__getattribute__ = __getattribute__
+    return cls
+
+
+@dataclass
+class PatchUsage:
+    """Usage of a patch set up by ``mocker_builder_setup`` across the tests of a class.
+
+    Args:
+        target_path (str):
+            Patched target.
+
+        setup_seconds (float):
+            Time spent resolving and starting the patch, summed over all tests.
+
+        used_in (List[str]):
+            Tests which called or accessed the mock.
+
+        unused_in (List[str]):
+            Tests which never touched the mock.
+    """
+
+    target_path: str = None
+    setup_seconds: float = 0.0
+    used_in: List[str] = field(default_factory=list)
+    unused_in: List[str] = field(default_factory=list)
+
+    @property
+    def unused(self) -> bool:
+        return not self.used_in
+
+    @property
+    def estimated_savings(self) -> float:
+        """Setup seconds saved by patching the target just in the tests using it."""
+        tests = len(self.used_in) + len(self.unused_in)
+        return self.setup_seconds / tests * len(self.unused_in) if tests else 0.0
+
+
+@dataclass
+class ClassUsageReport:
+    """Patch usage of a test class.
+
+    Args:
+        test_class (str):
+            ``module:QualifiedName`` of the test class.
+
+        tests (Dict[str, List[str]]):
+            Targets never called nor accessed by each test.
+
+        patches (Dict[str, PatchUsage]):
+            Usage by patched target.
+    """
+
+    test_class: str = None
+    tests: Dict[str, List[str]] = field(default_factory=dict)
+    patches: Dict[str, PatchUsage] = field(default_factory=dict)
+
+    @property
+    def unused(self) -> List[str]:
+        """Targets no test of the class called or accessed, safe to remove from the setup."""
+        return [target_path for target_path, usage in self.patches.items() if usage.unused]
+
+    @property
+    def estimated_savings(self) -> float:
+        return sum(usage.estimated_savings for usage in self.patches.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['unused'] = self.unused
+        data['estimated_savings'] = self.estimated_savings
+        for target_path, usage in self.patches.items():
+            data['patches'][target_path]['estimated_savings'] = usage.estimated_savings
+        return data
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.test_class}: {len(self.unused)} of {len(self.patches)} patches never used, "
+            f"{self.estimated_savings * 1000:.3f} ms of setup to save"
+        ]
+        for usage in sorted(self.patches.values(), key=lambda u: -u.estimated_savings):
+            if usage.unused_in:
+                lines.append(
+                    f"    {usage.target_path}: unused in {len(usage.unused_in)} of "
+                    f"{len(usage.used_in) + len(usage.unused_in)} tests "
+                    f"({usage.estimated_savings * 1000:.3f} ms)"
+                )
+        return "\n".join(lines)
+
+
+class UsageTracker:
+    """Tracks which patches of ``mocker_builder_setup`` each test calls or accesses.
+
+    It's enabled by ``MockerBuilderConfig``. Non mock replacements, like ``new=`` values, can't be
+    observed and are left out.
+
+    Args:
+        reports (Dict[str, ClassUsageReport]):
+            Reports by test class, over the whole session.
+
+        _report (ClassUsageReport):
+            Report of the class of the running test, None while usage tracking is off.
+
+        _test (str):
+            Running test name.
+
+        _setup (Dict[str, float]):
+            Setup seconds of each patch of the running test, until it leaves its setup.
+
+        _fingerprints (Dict[str, Tuple[int, int, int]]):
+            State of each mock when the running test left its setup.
+
+        _reads (Set[str]):
+            Targets whose mock attributes the running test read.
+
+        _watched (List[type]):
+            Mock classes watched for reads during the running test.
+
+        _exports (Set[str]):
+            Paths the JSON report is exported to when the session finishes.
+
+        _session (Any):
+            pytest config the session report is registered to.
+    """
+
+    reports: Dict[str, ClassUsageReport] = {}
+    _report: Optional[ClassUsageReport] = None
+    _test: str = None
+    _setup: Optional[Dict[str, float]] = None
+    _fingerprints: Dict[str, Tuple[int, int, int]] = {}
+    _reads: Set[str] = set()
+    _watched: List[type] = []
+    _exports: Set[str] = set()
+    _session: Any = None
+
+    @staticmethod
+    def start(test_class: str, test: str):
+        UsageTracker._report = UsageTracker.reports.setdefault(
+            test_class, ClassUsageReport(test_class=test_class)
+        )
+        UsageTracker._test = test
+        UsageTracker._setup = {}
+
+    @staticmethod
+    def add_setup(target_path: str, seconds: float):
+        """Account the setup time of a patch, unless patched by the test itself."""
+        if UsageTracker._setup is not None:
+            UsageTracker._setup[target_path] = UsageTracker._setup.get(target_path, 0.0) + seconds
+
+    @staticmethod
+    def snapshot(mocks: Dict[str, Any]):
+        """Take the state of the setup mocks when the running test leaves its setup.
+
+        Args:
+            mocks (Dict[str, Any]):
+                Mocks by target path.
+        """
+        setup, UsageTracker._setup = UsageTracker._setup, None
+        if setup is None:
+            return
+        UsageTracker._reads.clear()
+        UsageTracker._fingerprints = {
+            target_path: _fingerprint(mock)
+            for target_path, mock in mocks.items()
+            if target_path in setup and _is_mock(mock)
+        }
+        report = UsageTracker._report
+        for target_path in UsageTracker._fingerprints:
+            usage = report.patches.setdefault(target_path, PatchUsage(target_path=target_path))
+            usage.setup_seconds += setup[target_path]
+            watched = _watch_reads(mocks[target_path], target_path, UsageTracker._reads)
+            if watched is not None:
+                UsageTracker._watched.append(watched)
+
+    @staticmethod
+    def collect(mocks: Dict[str, Any]):
+        """Compare the setup mocks with their state when the running test left its setup."""
+        report = UsageTracker._report
+        if report is None:
+            return
+        UsageTracker._unwatch()
+        test, unused = UsageTracker._test, []
+        for target_path, fingerprint in UsageTracker._fingerprints.items():
+            usage = report.patches[target_path]
+            mock = mocks.get(target_path)
+            if target_path in UsageTracker._reads or (
+                mock is not None and _fingerprint(mock) != fingerprint
+            ):
+                usage.used_in.append(test)
+            else:
+                usage.unused_in.append(test)
+                unused.append(target_path)
+        report.tests[test] = unused
+
+    @staticmethod
+    def _unwatch():
+        for cls in UsageTracker._watched:
+            del cls.__getattribute__
+        del UsageTracker._watched[:]
+
+    @staticmethod
+    def finish():
+        UsageTracker._unwatch()
+        UsageTracker._report = None
+        UsageTracker._setup = None
+        UsageTracker._fingerprints = {}
+        UsageTracker._reads.clear()
+
+    @staticmethod
+    def to_dict() -> Dict[str, Any]:
+        return {
+            test_class: report.to_dict() for test_class, report in UsageTracker.reports.items()
+        }
+
+    @staticmethod
+    def dumps() -> str:
+        return json.dumps(UsageTracker.to_dict(), indent=2)
+
+    @staticmethod
+    def export(path: str):
+        """Write the usage reports of all classes so far to ``path`` as JSON."""
+        with open(path, 'w') as report_file:
+            report_file.write(UsageTracker.dumps())
+
+    @staticmethod
+    def report_at_exit(pytest_config: Any, path: Optional[str] = None):
+        """Print the reports, and export them to ``path`` if given, when the session finishes."""
+        if path is not None:
+            UsageTracker._exports.add(path)
+        if UsageTracker._session is not pytest_config:
+            UsageTracker._session = pytest_config
+            pytest_config.add_cleanup(UsageTracker.session_report)
+
+    @staticmethod
+    def session_report():
+        """Print the usage reports and export them to the configured paths."""
+        for report in UsageTracker.reports.values():
+            print(report)
+        for path in UsageTracker._exports:
+            UsageTracker.export(path)
+
+
+__all__ = [
+    "ClassUsageReport",
+    "PatchUsage",
+    "UsageTracker",
+]
@@ -0,0 +1,113 @@
+###################################################################################################
+# mocker-builder
+###################################################################################################
+# Virtual clock event loop so simulated latencies of mocked async dependencies don't really wait.
+###################################################################################################
+from __future__ import annotations
+import asyncio
+import selectors
+import time
+from typing import List, Optional, Tuple
+
+
+class _VirtualClockSelector:
+    """Selector wrapper jumping the loop virtual clock to the next scheduled timer.
+
+    It does so instead of blocking while there is no I/O ready.
+    """
+
+    def __init__(self, selector: selectors.BaseSelector, loop: VirtualTimeEventLoop) -> None:
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[selectors.SelectorKey, int]]:
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            # Nothing scheduled: only real I/O (or another thread) can wake the loop up.
+            return self._selector.select(None)
+        self._loop.advance(timeout)
+        return []
+
+    def __getattr__(self, name: str):
+        return getattr(self._selector, name)
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop driven by a virtual clock.
+
+    Whenever the loop would sleep waiting for a timer (``asyncio.sleep``, ``call_later``,
+    ``wait_for`` timeouts and so on) the clock jumps straight to it, so simulated delays cost no
+    real time while scheduling order and timeouts are kept.
+
+    .. code-block::
+        :caption: Example
+
+            class TestJusticeLeague(MockerBuilder):
+
+                @pytest.fixture
+                def event_loop(self):
+                    loop = VirtualTimeEventLoop()
+                    yield loop
+                    loop.close()
+
+                @MockerBuilder.initializer
+                def mocker_builder_setup(self):
+                    self.mock_call_heroes = self.patch(
+                        JusticeLeague.call_heroes,
+                        return_value=[],
+                        latency=2
+                    )
+
+                @pytest.mark.asyncio
+                async def test_call_everybody(self):
+                    # Takes 3 virtual seconds and a few real milliseconds
+                    assert await JusticeLeague().call_everybody() == []
+
+    .. note::
+        Real I/O ready to be read is still handled first, but the loop never waits for it while a
+        timer is scheduled. Work done in other threads (``run_in_executor``) doesn't hold the clock
+        either, so a pending timeout may fire before the thread finishes.
+
+    Args:
+        selector (selectors.BaseSelector, optional):
+            Selector to watch real I/O. Defaults to ``selectors.DefaultSelector``.
+    """
+
+    def __init__(self, selector: selectors.BaseSelector = None) -> None:
+        self._virtual_time = time.monotonic()
+        super().__init__(selector)
+        self._selector = _VirtualClockSelector(self._selector, self)
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance(self, seconds: float):
+        """Move the virtual clock forward. Timers due meanwhile run in the next loop iteration."""
+        if seconds < 0:
+            raise ValueError("Virtual time can't go backwards")
+        self._virtual_time += seconds
+
+
+class VirtualTimeEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy creating ``VirtualTimeEventLoop`` loops.
+
+    .. code-block::
+        :caption: conftest.py
+
+            @pytest.fixture(autouse=True, scope="session")
+            def virtual_time_policy():
+                asyncio.set_event_loop_policy(VirtualTimeEventLoopPolicy())
+                yield
+                asyncio.set_event_loop_policy(None)
+    """
+
+    def new_event_loop(self) -> VirtualTimeEventLoop:
+        return VirtualTimeEventLoop()
+
+
+__all__ = [
+    "VirtualTimeEventLoop",
+    "VirtualTimeEventLoopPolicy",
+]
@@ -1,6 +1,8 @@
 import pytest
 from collections import namedtuple
 
+pytest_plugins = ['pytester']
+
 TestCase = namedtuple("TestCase", ["text", "expected"])
 
 
@@ -0,0 +1,153 @@
+import asyncio
+import pytest
+
+from mocker_builder.mocker_builder import (
+    FixtureCache,
+    MockerBuilder,
+    MockerBuilderException,
+    TAsyncFixture,
+)
+
+SCOPES = """
+from mocker_builder.mocker_builder import MockerBuilder
+from test_cases.my_heroes import PeakyBlinder
+
+EVENTS = []
+BUILT = []
+
+
+def peaky_blinder():
+    EVENTS.append('setup class hero')
+    yield PeakyBlinder(nickname="Thomas Shelby")
+    EVENTS.append('teardown class hero')
+
+
+class TestAddFixtureScopes(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.class_hero = self.add_fixture(peaky_blinder, scope='class')
+        self.test_hero = self.add_fixture(
+            content=lambda: (yield EVENTS.append('setup test hero') or PeakyBlinder())
+        )
+        self.bound_hero = self.add_fixture(self.build_hero, scope='class')
+        self.closure_hero = self.add_fixture(lambda: self.build_hero(), scope='class')
+
+    def build_hero(self):
+        BUILT.append(self)
+        return PeakyBlinder()
+
+    def test_first(self):
+        assert self.class_hero.nickname == "Thomas Shelby"
+        assert EVENTS == ['setup class hero', 'setup test hero']
+
+    def test_second(self):
+        # The class scoped hero is cached while the test scoped lambda is rebuilt
+        assert EVENTS == ['setup class hero', 'setup test hero', 'setup test hero']
+        assert self.test_hero is not self.class_hero
+        # Contents bound to the test instance are cached too, though the instance changes
+        assert len(BUILT) == 2
+
+
+def test_class_scope_finalized():
+    assert EVENTS.count('teardown class hero') == 1
+    assert EVENTS.index('teardown class hero') == len(EVENTS) - 1
+"""
+
+
+class TestAddFixtureTeardown:
+
+    def test_class_scope_finalized(self, pytester):
+        pytester.makepyfile(test_scopes=SCOPES)
+        pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=3)
+
+    def test_same_content_cached(self):
+        calls = []
+
+        def content():
+            calls.append(1)
+            return object()
+
+        first = FixtureCache.setup(content, 'test')
+        assert FixtureCache.setup(content, 'test') is first
+        FixtureCache.teardown('test')
+        assert FixtureCache.setup(content, 'test') is not first
+        FixtureCache.teardown('test')
+        assert len(calls) == 2
+
+    def test_generator_yielding_twice(self):
+        def content():
+            yield 1
+            yield 2
+
+        FixtureCache.setup(content, 'test')
+        with pytest.raises(MockerBuilderException, match="yielded more than once"):
+            FixtureCache.teardown('test')
+
+    def test_invalid_scope(self):
+        with pytest.raises(MockerBuilderException, match="Invalid fixture scope"):
+            FixtureCache.setup(lambda: 1, 'module')
+
+
+ASYNC_EVENTS = []
+IN_FLIGHT = {'now': 0, 'peak': 0}
+
+
+async def setting_up(event: str):
+    # Contents setting up at the same time are counted instead of timed.
+    IN_FLIGHT['now'] += 1
+    IN_FLIGHT['peak'] = max(IN_FLIGHT['peak'], IN_FLIGHT['now'])
+    await asyncio.sleep(.01)
+    IN_FLIGHT['now'] -= 1
+    ASYNC_EVENTS.append(event)
+
+
+async def connection_pool():
+    await setting_up('pool up')
+    yield 'pool'
+    await asyncio.sleep(.01)
+    ASYNC_EVENTS.append('pool down')
+
+
+async def in_process_server():
+    await setting_up('server up')
+    return 'server'
+
+
+class TestAsyncFixtures(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        IN_FLIGHT['peak'] = 0
+        self.pool = self.add_fixture(connection_pool)
+        self.server = self.add_fixture(in_process_server)
+        self.other_pool = self.add_fixture(
+            content=lambda: connection_pool()
+        )
+        assert isinstance(self.pool, TAsyncFixture)
+
+    def test_set_up_concurrently(self):
+        assert IN_FLIGHT['peak'] == 3
+        assert self.pool == 'pool'
+        assert self.other_pool == 'pool'
+        assert self.server == 'server'
+
+    @pytest.mark.asyncio
+    async def test_await_handle_inside_loop(self):
+        async def content():
+            return 'ready'
+
+        handle = self.add_fixture(content)
+        assert isinstance(handle, TAsyncFixture)
+        assert await handle == 'ready'
+        assert handle.value == 'ready'
+
+
+class TestAsyncFixturesTeardown:
+
+    def test_torn_down(self):
+        del ASYNC_EVENTS[:]
+        assert FixtureCache.setup(connection_pool, 'test') == 'pool'
+        assert FixtureCache.setup(lambda: connection_pool(), 'test') == 'pool'
+        FixtureCache.teardown('test')
+        assert ASYNC_EVENTS == ['pool up', 'pool up', 'pool down', 'pool down']
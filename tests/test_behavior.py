@@ -0,0 +1,97 @@
+import asyncio
+import statistics
+import pytest
+
+from mocker_builder import (
+    BehaviorProfile,
+    Fixed,
+    LogNormal,
+    MockerBuilder,
+    Percentiles,
+    Uniform,
+    VirtualTimeEventLoop,
+)
+from test_cases.my_heroes import Batman, JusticeLeague
+
+
+class TestBehaviorProfile:
+
+    def test_seeded_schedule_is_deterministic(self):
+        profile = BehaviorProfile(
+            latency=LogNormal.from_median(.05, sigma=.5),
+            errors={TimeoutError: .1, ConnectionError: .05},
+            seed=7,
+            batch_size=100
+        )
+        first, second = profile.schedule(), profile.schedule()
+        assert [next(first) for _ in range(250)] == [next(second) for _ in range(250)]
+        assert first.calls == 250
+
+    def test_error_rates(self):
+        schedule = BehaviorProfile(errors={TimeoutError: .2}, seed=1).schedule()
+        faults = [next(schedule)[1] for _ in range(10000)]
+        assert faults.count(TimeoutError) == pytest.approx(2000, rel=.1)
+        assert set(faults) == {None, TimeoutError}
+
+    @pytest.mark.parametrize(
+        "latency, median", [
+            (Fixed(.5), .5),
+            (Uniform(.1, .3), .2),
+            (LogNormal.from_median(.05, sigma=.3), .05),
+            (Percentiles({50: .01, 99: .5, 100: 1.}), .01),
+        ]
+    )
+    def test_latency_distributions(self, latency, median):
+        schedule = BehaviorProfile(latency=latency, seed=3).schedule()
+        latencies = [next(schedule)[0] for _ in range(5000)]
+        assert statistics.median(latencies) == pytest.approx(median, rel=.1)
+        assert schedule.simulated_latency == pytest.approx(sum(latencies))
+
+    def test_invalid_rates(self):
+        with pytest.raises(ValueError):
+            BehaviorProfile(errors={TimeoutError: .7, ValueError: .5})
+
+
+class TestBehaviorPatch(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.slept = []
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana",
+            behavior=BehaviorProfile(
+                latency=2,
+                errors={ValueError("No banana!"): .5},
+                seed=11,
+                sleep=self.slept.append
+            )
+        )
+
+    def test_sync_target(self):
+        results = []
+        for _ in range(100):
+            try:
+                results.append(Batman().eating_banana())
+            except ValueError as ex:
+                results.append(str(ex))
+        assert set(results) == {"doesn't like banana", "No banana!"}
+        assert self.slept == [2] * 100
+        assert self.mock_eating_banana.behavior_schedule.calls == 100
+
+    def test_async_target(self):
+        mock_call_heroes = self.patch(
+            JusticeLeague.call_heroes,
+            side_effect=lambda: ['Batman'],
+            behavior=BehaviorProfile(latency=Uniform(1, 3), seed=5)
+        )
+        loop = VirtualTimeEventLoop()
+        try:
+            started = loop.time()
+            for _ in range(10):
+                assert loop.run_until_complete(JusticeLeague().call_heroes()) == ['Batman']
+            schedule = mock_call_heroes.behavior_schedule
+            assert loop.time() - started == pytest.approx(schedule.simulated_latency, abs=.01)
+        finally:
+            loop.close()
+        assert asyncio.iscoroutinefunction(mock_call_heroes.mock.side_effect)
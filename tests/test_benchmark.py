@@ -0,0 +1,79 @@
+from unittest.mock import call
+import pytest
+
+from mocker_builder.benchmark import Benchmark
+from mocker_builder.mocker_builder import MockerBuilder, MockerBuilderException
+from test_cases.my_heroes import Batman, JusticeLeague
+
+
+class TestBenchmark(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana"
+        )
+        self.mock_call_heroes = self.patch(
+            JusticeLeague.call_heroes,
+            return_value=['Batman']
+        )
+
+    def test_sync(self):
+        result = self.benchmark(
+            lambda: Batman().eating_banana(),
+            iterations=2500,
+            batch_size=1000
+        )
+        assert result.iterations == 2500
+        assert list(result.mock_calls.values()) == [2500]
+        assert 0 <= result.p50 <= result.p95 <= result.p99
+        assert result.calls_per_sec >= result.raw_calls_per_sec > 0
+        # Call logs are reset between batches and the ones from before the run put back
+        assert self.mock_eating_banana.mock.call_count == 0
+
+    def test_sync_concurrency(self):
+        result = self.benchmark(lambda: Batman().eating_banana(), iterations=1000, concurrency=4)
+        assert result.iterations == 1000
+        assert result.concurrency == 4
+
+    def test_coroutine_function(self):
+        result = self.benchmark(JusticeLeague().call_heroes, iterations=300, concurrency=10)
+        assert result.iterations == 300
+        assert list(result.mock_calls.values()) == [300]
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        result = await self.abenchmark(JusticeLeague().call_heroes, iterations=500, concurrency=20)
+        assert list(result.mock_calls.values()) == [500]
+        assert result.overhead > 0
+        with pytest.raises(MockerBuilderException, match="abenchmark"):
+            self.benchmark(JusticeLeague().call_heroes)
+
+    def test_calls_before_run_kept(self):
+        Batman().eating_banana()
+        hobby = self.patch(Batman.get_my_hero_hobby)
+        self.benchmark(lambda: Batman().get_my_hero_hobby().get_hobby(), iterations=100)
+        self.mock_eating_banana.mock.assert_called_once()
+        assert self.mock_eating_banana.mock.mock_calls == [call()]
+        hobby.mock.assert_not_called()
+
+    def test_child_calls_not_counted(self):
+        hobby = self.patch(Batman.get_my_hero_hobby)
+        hobby.mock.return_value.get_hobby()
+        result = self.benchmark(
+            lambda: Batman().get_my_hero_hobby().get_hobby(),
+            iterations=200,
+            batch_size=50
+        )
+        assert result.mock_calls == {hobby.target_path: 200}
+        assert hobby.mock.return_value.get_hobby.call_count == 1
+
+
+class TestBenchmarkHarness:
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            Benchmark({}).run(lambda: None, iterations=0)
+        with pytest.raises(ValueError):
+            Benchmark({}, batch_size=0)
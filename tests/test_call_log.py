@@ -0,0 +1,122 @@
+import asyncio
+import json
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.call_log import CallLog, CallLogWriter
+from mocker_builder.mocker_builder import MockerBuilderException
+from test_cases.my_heroes import Batman, IHero, Robin
+
+EATING_BANANA = 'test_cases.my_heroes.Batman.eating_banana'
+
+
+class TestCallLog(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(Batman.eating_banana, return_value="no banana")
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_streamed(self, tmp_path, binary):
+        path = str(tmp_path / "calls.log")
+        with CallLogWriter(path, binary=binary, batch_size=4, max_batches=1) as writer:
+            mock_just_says = self.patch(
+                target=Robin,
+                method='just_says',
+                side_effect=lambda *args, **kwargs: "Holy log",
+                call_log=writer
+            )
+            for number in range(10):
+                assert Robin().just_says(number, hero={"name": Batman, "tags": ("bat",)}) == \
+                    "Holy log"
+            assert mock_just_says.call_log is writer
+            assert len(writer._batch) == 2
+        calls = list(CallLog(path))
+        assert [call.seq for call in calls] == list(range(1, 11))
+        assert calls[3].target == 'test_cases.my_heroes.Robin.just_says'
+        assert calls[3].args == [3]
+        assert calls[3].kwargs == {'hero': {'name': repr(Batman), 'tags': ['bat']}}
+        assert calls[0].time <= calls[-1].time
+        assert not writer._batch and writer._queue.empty()
+
+    def test_shared_path(self, tmp_path):
+        path = str(tmp_path / "calls.jsonl")
+        self.mock_eating_banana.stop()
+        self.patch(Batman.eating_banana, return_value="no banana", call_log=path)
+        self.patch(target=Robin, method='just_says', call_log=path)
+        Batman().eating_banana()
+        Robin().just_says("Holy")
+        writer = CallLogWriter._shared[path]
+        writer.flush()
+        with open(path) as log_file:
+            lines = [json.loads(line) for line in log_file]
+        assert [line['target'] for line in lines] == [
+            EATING_BANANA,
+            'test_cases.my_heroes.Robin.just_says',
+        ]
+        assert [call.args for call in CallLog(path).where(EATING_BANANA)] == [[]]
+
+    @pytest.mark.asyncio
+    async def test_async(self, tmp_path):
+        path = str(tmp_path / "calls.bin")
+        with CallLogWriter(path, binary=True) as writer:
+            self.patch(
+                IHero.what_i_do_when_nobody_is_looking,
+                return_value="sleeping",
+                latency=.01,
+                call_log=writer,
+                timed=True
+            )
+            await asyncio.gather(*[
+                Batman().what_i_do_when_nobody_is_looking() for _ in range(3)
+            ])
+        assert len(list(CallLog(path))) == 3
+
+    def test_invalid(self):
+        with pytest.raises(MockerBuilderException, match="path or a CallLogWriter"):
+            self.patch(target=Robin, method='just_says', call_log=42)
+
+    @pytest.mark.parametrize('binary', [False, True])
+    def test_format_mismatch(self, tmp_path, binary):
+        path = str(tmp_path / "calls.log")
+        with CallLogWriter(path, binary=binary) as writer:
+            writer.record(EATING_BANANA, (), {})
+        with pytest.raises(ValueError, match="Can't append"):
+            CallLogWriter(path, binary=not binary)
+        CallLogWriter(path, binary=binary).close()
+        assert len(list(CallLog(path))) == 1
+
+    def test_shared_format_mismatch(self, tmp_path):
+        path = str(tmp_path / "calls.bin")
+        CallLogWriter.shared(path, binary=True)
+        with pytest.raises(ValueError, match="already written as binary"):
+            CallLogWriter.shared(path)
+
+
+SHARED = """
+from mocker_builder import MockerBuilder
+from mocker_builder.call_log import CallLogWriter
+from test_cases.my_heroes import Batman
+
+
+class TestSharedCallLog(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.patch(Batman.eating_banana, return_value="no banana", call_log="calls.jsonl")
+
+    def test_logged(self):
+        Batman().eating_banana()
+        assert "calls.jsonl" in CallLogWriter._shared
+
+
+def test_shared_closed():
+    assert not CallLogWriter._shared
+"""
+
+
+def test_shared_closed_after_teardown(pytester):
+    pytester.makepyfile(test_shared=SHARED)
+    pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=2)
+    assert not CallLogWriter._shared
+    assert [call.target for call in CallLog(str(pytester.path / "calls.jsonl"))] == [EATING_BANANA]
@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.child_limits import CHILD_LIMIT_SENTINEL, ChildMockLimitError
+from mocker_builder.mocker_builder import MockerBuilderException
+from test_cases.my_heroes import Batman, Robin
+
+
+def walk(obj, names, depth):
+    # Reflective walk of the attributes of obj, like a naive serializer would do.
+    if depth == 0:
+        return 0
+    return sum(1 + walk(getattr(obj, name), names, depth - 1) for name in names)
+
+
+class TestChildLimits(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_hobby = self.patch(
+            Batman.get_my_hero_hobby,
+            new_callable=MagicMock,
+            max_depth=2
+        )
+
+    def test_max_depth_raises(self):
+        hobby = Batman().get_my_hero_hobby
+        assert hobby.what.i_do
+        with pytest.raises(ChildMockLimitError, match="max_depth 2"):
+            hobby.what.i_do.when
+        assert not hasattr(hobby.what.i_do, 'when')
+        limits = self.mock_hobby.child_limits
+        assert (limits.created, limits.deepest, limits.limited) == (2, 2, 2)
+
+    def test_max_children_sentinel(self):
+        mock_just_says = self.patch(
+            target=Robin,
+            method='just_says',
+            new_callable=MagicMock,
+            max_children=50,
+            on_child_limit="sentinel"
+        )
+        assert walk(Robin.just_says, [f"attribute_{number}" for number in range(10)], 4) == 11110
+        limits = mock_just_says.child_limits
+        assert limits.created == 50
+        assert limits.limited > 0
+        assert Robin.just_says.attribute_9.attribute_9 is CHILD_LIMIT_SENTINEL
+        assert CHILD_LIMIT_SENTINEL.whatever().anything is CHILD_LIMIT_SENTINEL
+        assert list(CHILD_LIMIT_SENTINEL) == []
+
+    def test_configured_children_counted(self):
+        mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            mock_configure={'return_value.eating_banana.return_value': "no banana"},
+            max_depth=2
+        )
+        assert Batman().eating_banana().eating_banana() == "no banana"
+        limits = mock_eating_banana.child_limits
+        assert limits.deepest == 2
+        with pytest.raises(ChildMockLimitError):
+            Batman().eating_banana().eating_banana.how_much
+
+    def test_return_value_chain(self):
+        mock_wearing_pyjama = self.patch(Robin.wearing_pyjama, max_depth=1)
+        assert Robin().wearing_pyjama()
+        with pytest.raises(ChildMockLimitError):
+            Robin().wearing_pyjama()()
+        assert mock_wearing_pyjama.child_limits.limited >= 1
+
+    def test_limits_reinstalled_on_restart(self):
+        self.mock_hobby.stop()
+        self.mock_hobby.start()
+        with pytest.raises(ChildMockLimitError):
+            Batman().get_my_hero_hobby.what.i_do.when
+
+    def test_counters_reset_on_reinstall(self):
+        Batman().get_my_hero_hobby.what.i_do
+        self.mock_hobby.stop()
+        self.mock_hobby.start()
+        limits = self.mock_hobby.child_limits
+        assert (limits.created, limits.deepest, limits.limited) == (0, 0, 0)
+        Batman().get_my_hero_hobby.what
+        self.mock_hobby.configure_mock(**{'how.return_value': "no hobby"})
+        limits = self.mock_hobby.child_limits
+        assert (limits.created, limits.deepest) == (1, 1)
+
+    def test_return_value_counted_once(self):
+        mock_wearing_pyjama = self.patch(Robin.wearing_pyjama, max_children=10)
+        Robin().wearing_pyjama()
+        limits = mock_wearing_pyjama.child_limits
+        assert (limits.created, limits.deepest) == (1, 1)
+
+    @pytest.mark.parametrize(
+        "options, message", [
+            ({'max_depth': -1}, "non negative int"),
+            ({'max_children': 10, 'on_child_limit': "ignore"}, "Unknown on_child_limit"),
+            ({'max_depth': 1, 'new': "Holy"}, "new option"),
+        ]
+    )
+    def test_invalid(self, options, message):
+        with pytest.raises(MockerBuilderException, match=message):
+            self.patch(target=Robin, method='just_says', **options)
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+
+from mocker_builder import MockerBuilder, VirtualTimeEventLoop
+from mocker_builder.mocker_builder import MockerBuilderException
+from test_cases.my_heroes import Batman, IHero, JusticeLeague
+
+
+class TestConcurrencyTracking(MockerBuilder):
+
+    @pytest.fixture
+    def event_loop(self):
+        loop = VirtualTimeEventLoop()
+        yield loop
+        loop.close()
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_call_heroes = self.patch(
+            JusticeLeague.call_heroes,
+            return_value=[('Batman', 'Come on', 'Big Fat Bat')],
+            latency=1,
+            track_concurrency=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_awaits(self):
+        league = JusticeLeague()
+        results = await asyncio.gather(*[league.call_heroes() for _ in range(3)])
+        assert results == [[('Batman', 'Come on', 'Big Fat Bat')]] * 3
+        concurrency = self.mock_call_heroes.concurrency
+        assert concurrency.awaits == 3
+        assert concurrency.peak == 3
+        assert concurrency.overlapped == 3
+        assert concurrency.average == pytest.approx(3)
+        assert concurrency.serialized_seconds == pytest.approx(0)
+        assert concurrency.busy_seconds == pytest.approx(1)
+        assert concurrency.in_flight == 0
+        concurrency.assert_max_concurrency_at_least(3)
+
+    @pytest.mark.asyncio
+    async def test_serial_awaits(self):
+        league = JusticeLeague()
+        for _ in range(3):
+            await league.call_heroes()
+        concurrency = self.mock_call_heroes.concurrency
+        assert concurrency.peak == 1
+        assert concurrency.overlapped == 0
+        assert concurrency.serialized_seconds == pytest.approx(3)
+        with pytest.raises(AssertionError, match="at least 2 concurrent awaits, but the peak was 1"):
+            concurrency.assert_max_concurrency_at_least(2)
+        concurrency.assert_max_concurrency_at_most(1)
+
+    @pytest.mark.asyncio
+    async def test_partial_overlap(self):
+        league = JusticeLeague()
+
+        async def late_call():
+            await asyncio.sleep(.5)
+            return await league.call_heroes()
+
+        await asyncio.gather(league.call_heroes(), late_call(), league.call_heroes())
+        concurrency = self.mock_call_heroes.concurrency
+        assert concurrency.peak == 3
+        assert concurrency.busy_seconds == pytest.approx(1.5)
+        assert concurrency.serialized_seconds == pytest.approx(.5)
+        assert concurrency.average == pytest.approx((2 * .5 + 3 * .5 + 1 * .5) / 1.5)
+
+    @pytest.mark.asyncio
+    async def test_without_latency(self):
+        mock_nobody_is_looking = self.patch(
+            IHero.what_i_do_when_nobody_is_looking,
+            return_value="sleeping",
+            track_concurrency=True,
+            timed=True
+        )
+        hero = Batman()
+
+        async def ask():
+            return await hero.what_i_do_when_nobody_is_looking()
+
+        results = await asyncio.gather(*[ask() for _ in range(4)])
+        assert results == ["sleeping"] * 4
+        assert mock_nobody_is_looking.concurrency.peak == 4
+        assert mock_nobody_is_looking.concurrency.average == pytest.approx(2.5)
+        assert mock_nobody_is_looking.timings.calls == 4
+        assert mock_nobody_is_looking.timings.hot_callers()[0].function == 'ask'
+
+    def test_sync_target(self):
+        with pytest.raises(MockerBuilderException, match="only available for async targets"):
+            self.patch(Batman.eating_banana, track_concurrency=True)
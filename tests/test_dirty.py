@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.dirty import DirtyTracker
+from test_cases.my_heroes import Batman, MyHeroes, PeakyBlinder, Robin
+
+
+class TestDirtyTracking(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana"
+        )
+        self.mock_wearing_pyjama = self.patch(Robin.wearing_pyjama)
+        self.mock_hobby = self.patch(
+            PeakyBlinder.get_my_hero_hobby,
+            new_callable=MagicMock,
+            mock_configure={'return_value.what_i_do': "sing"}
+        )
+        self.my_heroes = MyHeroes()
+        self.my_heroes.my_hero = Batman()
+
+    def test_clean_until_used(self):
+        assert not any(DirtyTracker.is_dirty(mock) for mock in [
+            self.mock_eating_banana(),
+            self.mock_wearing_pyjama(),
+            self.mock_hobby(),
+        ])
+        assert self.my_heroes.is_eating_banana() == "doesn't like banana"
+        assert DirtyTracker.is_dirty(self.mock_eating_banana())
+        assert not DirtyTracker.is_dirty(self.mock_wearing_pyjama())
+
+    def test_reset_skips_clean_mocks(self):
+        self.my_heroes.is_eating_banana()
+        stats = self.reset_mocks()
+        assert (stats.checked, stats.reset, stats.skipped) == (3, 1, 2)
+        self.mock_eating_banana().assert_not_called()
+        assert not DirtyTracker.is_dirty(self.mock_eating_banana())
+        assert self.my_heroes.is_eating_banana() == "doesn't like banana"
+        self.mock_eating_banana().assert_called_once()
+        assert self.reset_mocks().reset == 1
+
+    def test_child_calls_and_attribute_sets_mark_dirty(self):
+        assert self.mock_hobby().return_value.what_i_do == "sing"
+        assert not DirtyTracker.is_dirty(self.mock_hobby())
+        self.mock_hobby().return_value.get_hobby()
+        assert DirtyTracker.is_dirty(self.mock_hobby())
+        self.mock_wearing_pyjama.set_result(return_value="no pyjama")
+        assert DirtyTracker.is_dirty(self.mock_wearing_pyjama())
+        self.reset_mocks()
+        assert self.mock_hobby().mock_calls == []
+        assert Robin().wearing_pyjama() == "no pyjama"
+
+    def test_restarted_mock_is_clean(self):
+        self.my_heroes.is_eating_banana()
+        self.mock_eating_banana.stop()
+        self.mock_eating_banana.start()
+        assert not DirtyTracker.is_dirty(self.mock_eating_banana())
+
+    @pytest.mark.parametrize('calls', [0, 2])
+    def test_session_stats(self, calls):
+        before = DirtyTracker.stats.checked
+        for _ in range(calls):
+            Robin().wearing_pyjama()
+        stats = self.reset_mocks()
+        assert stats.reset == (1 if calls else 0)
+        assert DirtyTracker.stats.checked == before + 3
+        assert "clean ones skipped" in str(stats)
@@ -0,0 +1,101 @@
+import importlib
+import sys
+
+from mocker_builder import MockerBuilder
+from mocker_builder.mocker_builder import Patcher
+from mocker_builder.reference_index import ReferenceIndex
+from test_cases import main, my_heroes
+from test_cases.my_heroes import Robin, who_is_my_hero
+
+
+class TestReferenceIndex:
+
+    def test_references(self):
+        assert {
+            'test_cases.main.Robin',
+            'test_cases.my_heroes.Robin',
+            f'{__name__}.Robin',
+        } <= set(ReferenceIndex.references(Robin))
+
+    def test_modules_imported_later(self, tmp_path, monkeypatch):
+        ReferenceIndex.install()
+        (tmp_path / 'gotham_city.py').write_text(
+            "from test_cases.my_heroes import who_is_my_hero as call_hero\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        try:
+            importlib.import_module('gotham_city')
+            assert 'gotham_city.call_hero' in ReferenceIndex.references(who_is_my_hero)
+        finally:
+            sys.modules.pop('gotham_city', None)
+
+    def test_rebound_names_dropped(self, monkeypatch):
+        assert 'test_cases.my_heroes.who_is_my_hero' in ReferenceIndex.references(who_is_my_hero)
+        monkeypatch.setattr(my_heroes, 'who_is_my_hero', lambda: None)
+        assert 'test_cases.my_heroes.who_is_my_hero' not in ReferenceIndex.references(
+            who_is_my_hero
+        )
+
+
+class TestPatchEverywhere(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_robin = self.patch(
+            Robin,
+            everywhere=True
+        )
+
+    def test_all_references_patched(self):
+        assert my_heroes.Robin is self.mock_robin.mock
+        assert main.Robin is self.mock_robin.mock
+        assert Robin is self.mock_robin.mock
+        main.Robin(nickname="Boy Wonder")
+        self.mock_robin.mock.assert_called_once_with(nickname="Boy Wonder")
+
+    def test_stop_and_start_together(self):
+        self.mock_robin.stop()
+        assert main.Robin is my_heroes.Robin
+        assert not isinstance(main.Robin, type(self.mock_robin.mock))
+        self.mock_robin.start()
+        assert main.Robin is my_heroes.Robin is self.mock_robin.mock
+        assert len(Patcher.active_patches()) == 1
+
+    def test_function_everywhere(self):
+        mock_who_is_my_hero = self.patch(who_is_my_hero, everywhere=True)
+        assert who_is_my_hero is mock_who_is_my_hero.mock
+        my_heroes.who_is_the_best_hero()
+        mock_who_is_my_hero.mock.assert_called_once()
+
+
+EVERYWHERE = """
+from mocker_builder import MockerBuilder
+from test_cases import main, my_heroes
+from test_cases.my_heroes import Robin, who_is_my_hero
+
+
+class TestPatchEverywhere(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_robin = self.patch(Robin, everywhere=True)
+        self.mock_who_is_my_hero = self.patch(who_is_my_hero, everywhere=True)
+
+    def test_patched(self):
+        assert main.Robin is self.mock_robin.mock
+        assert who_is_my_hero is self.mock_who_is_my_hero.mock
+
+
+def test_everything_restored():
+    assert main.Robin is my_heroes.Robin is Robin
+    assert isinstance(Robin, type)
+    assert my_heroes.who_is_my_hero is who_is_my_hero
+"""
+
+
+def test_restored_and_uninstalled_after_session(pytester):
+    # pytester puts sys.meta_path back as it was, so the inner session starts without the index.
+    ReferenceIndex.uninstall()
+    pytester.makepyfile(test_everywhere_session=EVERYWHERE)
+    pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=2)
+    assert ReferenceIndex._hook is None
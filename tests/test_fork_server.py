@@ -0,0 +1,130 @@
+import os
+
+import pytest
+
+from mocker_builder import MockerBuilder, MockerBuilderConfig
+from test_cases import my_heroes
+from test_cases.my_heroes import Robin
+
+pytest_plugins = ["mocker_builder.runners"]
+
+PYTEST_PID = os.getpid()
+SETUPS = []
+
+
+class TestForkServer(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(fork_server=True)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        SETUPS.append(os.getpid())
+        self.mock_just_says = self.patch(target=Robin.just_says, return_value="Forked!")
+
+    def test_runs_in_child(self):
+        assert os.getpid() != PYTEST_PID
+        assert SETUPS == [PYTEST_PID]
+        assert Robin().just_says() == "Forked!"
+        my_heroes.UGLY_HERO = "Joker"
+
+    def test_isolated_by_fork(self):
+        assert SETUPS == [PYTEST_PID]
+        assert my_heroes.UGLY_HERO == "Me"
+        assert not self.mock_just_says.mock.called
+
+
+class TestForkServerBatch(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(fork_server=True, fork_batch_size=2)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(target=Robin.just_says, return_value="Batched!")
+
+    def test_first(self):
+        assert Robin().just_says() == "Batched!"
+        my_heroes.UGLY_HERO = "Penguin"
+
+    def test_second_shares_the_child(self):
+        assert my_heroes.UGLY_HERO == "Penguin"
+        assert not self.mock_just_says.mock.called
+
+    def test_third_in_new_child(self):
+        assert my_heroes.UGLY_HERO == "Me"
+
+
+class TestForkServerBatchIsolation(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(fork_server=True, fork_batch_size=2)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(target=Robin.just_says, return_value="Batched!")
+
+    def test_first_changes_the_setup(self):
+        self.mock_just_says.set_result(return_value="Changed!")
+        self.mock_just_says.configure_mock(name="changed")
+        self.patch(target=Robin, method='get_my_hero_hobby', return_value="Leaked!")
+        assert Robin().just_says() == "Changed!"
+
+    def test_second_gets_the_warm_setup(self):
+        assert Robin().just_says() == "Batched!"
+        assert 'changed' not in repr(self.mock_just_says.mock)
+        assert not hasattr(Robin.get_my_hero_hobby, 'return_value')
+
+
+class TestForkServerTimeline(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(
+        fork_server=True,
+        fork_batch_size=2,
+        call_timeline=True
+    )
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(target=Robin.just_says, return_value="Recorded!")
+
+    @pytest.mark.parametrize('times', [1, 2])
+    def test_own_calls_recorded(self, times):
+        for _ in range(times):
+            Robin().just_says()
+        assert len(self.timeline) == times
+
+
+TORN_DOWN = """
+import os
+
+from mocker_builder import MockerBuilder, MockerBuilderConfig
+from test_cases.my_heroes import Robin
+
+pytest_plugins = ["mocker_builder.runners"]
+
+PYTEST_PID = os.getpid()
+SETUPS = []
+
+
+class TestForked(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(fork_server=True, fork_batch_size=2)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        SETUPS.append(os.getpid())
+        self.patch(target=Robin.just_says, return_value="Forked!")
+
+    def test_first(self):
+        assert Robin().just_says() == "Forked!"
+
+    def test_second(self):
+        assert Robin().just_says() == "Forked!"
+
+    def test_third(self):
+        assert Robin().just_says() == "Forked!"
+
+
+def test_setup_torn_down():
+    assert SETUPS == [PYTEST_PID]
+    assert Robin().just_says() != "Forked!"
+"""
+
+
+def test_setup_torn_down(pytester):
+    pytester.makepyfile(test_torn_down=TORN_DOWN)
+    pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=4)
+    assert Robin().just_says() not in ["Forked!", "Batched!"]
@@ -0,0 +1,81 @@
+import tracemalloc
+import pytest
+
+from mocker_builder import MockerBuilder, MockerBuilderConfig
+from mocker_builder.memory import MemoryTracker
+from mocker_builder.mocker_builder import Patcher
+from test_cases.my_heroes import Batman, PeakyBlinder, Robin
+
+
+def heroes():
+    return [PeakyBlinder(nickname=str(number)) for number in range(1000)]
+
+
+class TestMemoryTracking(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(track_memory=True, max_mock_calls=500)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana"
+        )
+        self.mock_wearing_pyjama = self.patch(
+            target=Robin,
+            method='wearing_pyjama',
+            return_value="doesn't like pyjama"
+        )
+        self.heroes = self.add_fixture(heroes)
+
+    def test_setup_accounted(self):
+        report = MemoryTracker._report
+        assert report.test.endswith("test_setup_accounted")
+        assert set(report.targets) == {
+            'test_cases.my_heroes.Batman.eating_banana',
+            'test_cases.my_heroes.Robin.wearing_pyjama',
+        }
+        assert all(target.setup_bytes > 0 for target in report.targets.values())
+        assert report.fixtures['heroes'] > 1000 * 48
+
+    def test_call_logs_accounted(self):
+        for number in range(1000):
+            Batman().eating_banana(["banana"] * number)
+        Robin().wearing_pyjama()
+        report = MemoryTracker._report
+        # Measured again by the teardown, with the same results.
+        for _ in range(2):
+            MemoryTracker.collect(Patcher.mocks(), max_calls=500, max_children=1000)
+        assert report.flagged == ['test_cases.my_heroes.Batman.eating_banana']
+        eating_banana = report.targets['test_cases.my_heroes.Batman.eating_banana']
+        assert eating_banana.calls == 1000
+        assert eating_banana.call_log_bytes > sum(8 * number for number in range(1000))
+        assert report.targets['test_cases.my_heroes.Robin.wearing_pyjama'].calls == 1
+
+    def test_mock_returning_itself(self):
+        mock_eating_banana = self.mock_eating_banana()
+        mock_eating_banana.return_value = mock_eating_banana
+        Batman().eating_banana()
+        MemoryTracker.collect(Patcher.mocks(), max_calls=500, max_children=1000)
+        eating_banana = MemoryTracker._report.targets['test_cases.my_heroes.Batman.eating_banana']
+        assert (eating_banana.calls, eating_banana.children) == (1, 0)
+
+
+class TestMemoryTrackingOff(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(Batman.eating_banana)
+
+    def test_no_report(self):
+        assert MemoryTracker._report is None
+
+
+def test_tracemalloc_stopped_by_its_starter():
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc is traced by the whole session")
+    MemoryTracker.start("test_tracemalloc_stopped_by_its_starter")
+    assert tracemalloc.is_tracing()
+    report = MemoryTracker.finish()
+    assert not tracemalloc.is_tracing()
+    assert MemoryTracker.reports[-1] is report
+    assert len(MemoryTracker.reports) <= MemoryTracker.reports.maxlen
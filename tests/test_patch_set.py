@@ -0,0 +1,62 @@
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.mocker_builder import Patcher
+from test_cases import my_heroes
+from test_cases.my_heroes import Batman, HobbyHero, IHero, Robin
+
+
+class TestPatchSet(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(target=Robin.just_says, return_value="Mocked Robin")
+        self.mock_hobby = self.patch(target=IHero.get_my_hero_hobby, return_value="mocking")
+        self.mock_ugly_hero = self.patch(target=my_heroes, attribute='UGLY_HERO', new="Joker")
+
+    def test_suspended(self):
+        with self.patches.suspended():
+            assert Robin().just_says() != "Mocked Robin"
+            assert Batman(my_hobby=HobbyHero("flying")).get_my_hero_hobby().what_i_do == "flying"
+            assert my_heroes.UGLY_HERO == "Me"
+        assert Robin().just_says() == "Mocked Robin"
+        assert Batman().get_my_hero_hobby() == "mocking"
+        assert my_heroes.UGLY_HERO == "Joker"
+        self.mock_just_says.mock.assert_called_once_with()
+
+    def test_stopped_while_suspended(self):
+        with self.patches.suspended():
+            self.mock_hobby.stop()
+            with self.patches.suspended():
+                assert my_heroes.UGLY_HERO == "Me"
+        assert Batman(my_hobby=HobbyHero("sleeping")).get_my_hero_hobby().what_i_do == "sleeping"
+        assert my_heroes.UGLY_HERO == "Joker"
+
+    def test_transaction_rolled_back(self):
+        with self.patches.transaction():
+            self.mock_just_says.set_result(return_value="For a while")
+            self.mock_ugly_hero.stop()
+            self.patch(target=Batman.eating_banana, return_value="no bananas")
+            assert Robin().just_says() == "For a while"
+            assert my_heroes.UGLY_HERO == "Me"
+            assert Batman().eating_banana() == "no bananas"
+        assert Robin().just_says() == "Mocked Robin"
+        assert my_heroes.UGLY_HERO == "Joker"
+        assert Batman().eating_banana() != "no bananas"
+        assert len(Patcher.mocked_metadata()) == 3
+
+    def test_nested_commit(self):
+        with self.patches.transaction():
+            with self.patches.transaction() as transaction:
+                self.mock_just_says.set_result(return_value="Committed")
+                transaction.commit()
+            assert Robin().just_says() == "Committed"
+        assert Robin().just_says() == "Mocked Robin"
+
+    def test_rolled_back_on_error(self):
+        with pytest.raises(RuntimeError):
+            with self.patches.transaction():
+                self.mock_just_says.configure_mock(**{'return_value': "Configured"})
+                assert Robin().just_says() == "Configured"
+                raise RuntimeError("Holy rollback, Batman!")
+        assert Robin().just_says() == "Mocked Robin"
@@ -0,0 +1,117 @@
+import warnings
+
+import pytest
+
+from mocker_builder import BehaviorProfile
+from mocker_builder.mocker_builder import (
+    MockerBuilder,
+    Patcher,
+    PatchTargetTrie,
+    TMockMetadata,
+)
+from test_cases.my_heroes import IHero, Robin
+
+
+class TestPatchTargetTrie:
+
+    def test_ancestors_and_descendants(self):
+        trie = PatchTargetTrie()
+        robin = TMockMetadata(target_path='test_cases.my_heroes.Robin')
+        hobby = TMockMetadata(target_path='test_cases.my_heroes.Robin.get_my_hero_hobby')
+        trie.insert(robin.target_path, robin)
+        trie.insert(hobby.target_path, hobby)
+
+        assert trie.ancestors(hobby.target_path) == [robin]
+        assert trie.has_descendants(robin.target_path)
+        assert not trie.has_descendants(hobby.target_path)
+        assert trie.find(robin.target_path) == [robin]
+        assert sorted(
+            m.target_path for m in trie.descendants('test_cases.my_heroes')
+        ) == [robin.target_path, hobby.target_path]
+        assert trie.descendants('test_cases.other') == []
+
+        assert trie.remove(hobby.target_path, hobby)
+        assert not trie.remove(hobby.target_path, hobby)
+        assert not trie.has_descendants(robin.target_path)
+        assert len(trie) == 1
+
+
+class TestPatchTargetOverlaps(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_robin_hobby = self.patch(
+            Robin,
+            'get_my_hero_hobby',
+            return_value="I just watch TV"
+        )
+
+    def test_exact_duplicate_is_merged(self):
+        duplicated = self.patch(
+            target=Robin,
+            method='get_my_hero_hobby',
+            return_value="I just watch TV"
+        )
+        assert duplicated.mock is self.mock_robin_hobby.mock
+        assert Patcher.active_patches('test_cases.my_heroes.Robin') == [
+            Patcher._mocked_metadata[0].metadata
+        ]
+
+    def test_stopping_a_duplicate_keeps_the_patch(self):
+        duplicated = self.patch(
+            target=Robin,
+            method='get_my_hero_hobby',
+            return_value="I just watch TV"
+        )
+        duplicated.stop()
+        assert Robin().get_my_hero_hobby() == "I just watch TV"
+        assert Patcher.active_patches('test_cases.my_heroes.Robin') == [
+            Patcher._mocked_metadata[0].metadata
+        ]
+        self.mock_robin_hobby.stop()
+        assert Robin.get_my_hero_hobby is not duplicated.mock
+
+    def test_exact_async_duplicate_is_merged(self):
+        first = self.patch(IHero.what_i_do_when_nobody_is_looking, return_value="sleeping")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            duplicated = self.patch(
+                target=IHero,
+                method='what_i_do_when_nobody_is_looking',
+                return_value="sleeping"
+            )
+        assert duplicated.mock is first.mock
+
+    def test_overlap_warns(self):
+        with pytest.warns(UserWarning, match="overlaps"):
+            self.patch(Robin)
+        assert len(Patcher.active_patches('test_cases.my_heroes')) == 2
+
+    def test_stopped_patch_leaves_trie(self):
+        self.mock_robin_hobby.stop()
+        assert Patcher.active_patches() == []
+        self.mock_robin_hobby.start()
+        assert len(Patcher.active_patches()) == 1
+
+    @pytest.mark.parametrize('options, applied', [
+        ({'behavior': BehaviorProfile(errors={ValueError: 1.0})}, 'behavior_schedule'),
+        ({'scope': 'thread'}, None),
+        ({'timed': True}, 'timings'),
+        ({'timeline': True}, None),
+        ({'max_depth': 1}, 'child_limits'),
+        ({'everywhere': True}, None),
+        ({'call_log': 'robin_calls.jsonl'}, 'call_log'),
+    ])
+    def test_duplicate_with_other_options_is_not_merged(self, options, applied, tmp_path):
+        if 'call_log' in options:
+            options = {'call_log': str(tmp_path / options['call_log'])}
+        with pytest.warns(UserWarning, match="different parameters"):
+            other = self.patch(
+                target=Robin,
+                method='get_my_hero_hobby',
+                return_value="I just watch TV",
+                **options
+            )
+        assert other.mock is not self.mock_robin_hobby.mock
+        if applied:
+            assert getattr(other, applied) is not None
@@ -0,0 +1,93 @@
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.call_log import CallLogWriter
+from mocker_builder.mocker_builder import FixtureCache, MockerBuilderException
+from mocker_builder.patch_plan import PatchPlan
+from mocker_builder.runners import ProcessPoolRunner
+from test_cases.my_heroes import Batman, Robin
+
+
+class TestPoolHeroes(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(target=Robin.just_says, return_value="Pooled!")
+        self.mock_eating_banana = self.patch(target=Batman.eating_banana, return_value="no")
+        self.nickname = "Boy Wonder"
+
+    @pytest.mark.parametrize('times', [1, 2, 3])
+    def test_just_says(self, times):
+        for _ in range(times):
+            assert Robin().just_says() == "Pooled!"
+        assert self.mock_just_says.mock.call_count == times
+        assert self.nickname == "Boy Wonder"
+
+    def test_eating_banana(self):
+        assert Batman().eating_banana() == "no"
+
+    def test_plan_round_trip(self):
+        plan = PatchPlan.loads(PatchPlan.record(self).dumps())
+        assert [planned.target_path for planned in plan.patches] == [
+            'test_cases.my_heroes.Robin.just_says',
+            'test_cases.my_heroes.Batman.eating_banana',
+        ]
+        assert plan.values['nickname'] == "Boy Wonder"
+        assert plan.values['mock_just_says'].index == 0
+
+    def test_unpicklable_plan(self):
+        self.patch(target=Robin.eating_banana, side_effect=lambda: "banana")
+        with pytest.raises(MockerBuilderException, match="not picklable"):
+            PatchPlan.record(self)
+
+    def test_call_log_planned(self, tmp_path):
+        path = str(tmp_path / "calls.bin")
+        with CallLogWriter(path, binary=True) as writer:
+            self.patch(target=Robin.eating_banana, call_log=writer)
+            planned = PatchPlan.loads(PatchPlan.record(self).dumps()).patches[-1]
+        assert (planned.call_log, planned.call_log_binary) == (path, True)
+        assert planned.metadata().call_log is CallLogWriter._shared[path]
+
+    def test_fixture_value_not_planned(self):
+        self.hero = self.add_fixture(content=lambda: Robin())
+        with pytest.raises(MockerBuilderException, match="fixture content"):
+            PatchPlan.record(self)
+
+    def test_unrelated_values_planned(self):
+        hero = Robin()
+        FixtureCache.setup(lambda: hero, 'test')
+        # Given to another test: not in this one's setup.
+        del FixtureCache._given[:]
+        self.hero = hero
+        self.times = self.add_fixture(content=lambda: 1)
+        self.retries = 1
+        plan = PatchPlan.record(self)
+        assert (plan.values['times'], plan.values['retries']) == (1, 1)
+        assert isinstance(plan.values['hero'], Robin)
+
+
+class TestPoolFixtures(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(target=Robin.just_says, return_value="Pooled!")
+        self.hero = self.add_fixture(content=lambda: Robin())
+
+    def test_fixture_set_up(self):
+        assert self.hero.just_says() == "Pooled!"
+
+
+def test_process_pool_runner():
+    report = ProcessPoolRunner(TestPoolHeroes, max_workers=2).run()
+    assert report.planned
+    assert len(report.outcomes) == 9
+    assert report.passed, report.failures
+    assert report.calls['test_cases.my_heroes.Robin.just_says'] == 1 + 2 + 3
+    assert report.calls['test_cases.my_heroes.Batman.eating_banana'] == 1
+
+
+def test_fixture_contents_run_by_workers():
+    with pytest.warns(UserWarning, match="fixture content"):
+        report = ProcessPoolRunner(TestPoolFixtures, max_workers=1).run()
+    assert not report.planned
+    assert report.passed, report.failures
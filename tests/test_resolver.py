@@ -0,0 +1,116 @@
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.mocker_builder import MockerBuilderException
+from mocker_builder.resolver import TargetResolver
+from test_cases.my_heroes import Batman, IHero, MyHeroes
+
+
+class JusticeLeague:
+
+    class Hall:
+
+        class Door:
+            @staticmethod
+            def open() -> str:
+                return "open"
+
+        def who_is_in(self) -> str:
+            return "nobody"
+
+
+def test_resolve_deep_package_path():
+    resolved = TargetResolver.resolve('xml.etree.ElementTree.Element.get')
+    assert resolved.module_path == 'xml.etree.ElementTree'
+    assert resolved.attribute == 'get'
+    assert resolved.parent.__name__ == 'Element'
+
+
+def test_resolve_inherited_method_owner():
+    resolved = TargetResolver.resolve('test_cases.my_heroes.Batman.which_hero_i_am')
+    assert resolved.parent is Batman
+    assert resolved.owner is IHero
+    assert isinstance(resolved.raw, classmethod)
+    assert TargetResolver.owner_of(Batman, 'eating_banana') is Batman
+
+
+def test_prefixes_memoized_until_replaced():
+    path = f'{__name__}.JusticeLeague.Hall.Door.open'
+    assert TargetResolver.resolve(path).owner is JusticeLeague.Hall.Door
+    node = TargetResolver._root
+    for part in path.split('.')[:-1]:
+        node = node.children[part]
+    assert node.value is JusticeLeague.Hall.Door
+    door = JusticeLeague.Hall.Door
+    try:
+        JusticeLeague.Hall.Door = type('Door', (), {'open': staticmethod(lambda: "closed")})
+        assert TargetResolver.lookup(path)() == "closed"
+    finally:
+        JusticeLeague.Hall.Door = door
+    assert TargetResolver.lookup(path)() == "open"
+
+
+def test_resolve_missing_attribute():
+    with pytest.raises(AttributeError):
+        TargetResolver.resolve('test_cases.my_heroes.Batman.flying')
+    assert TargetResolver.resolve('test_cases.my_heroes.Batman.flying', create=True).value is Batman
+
+
+def test_missing_path_resolved_twice():
+    for _ in range(2):
+        with pytest.raises(AttributeError):
+            TargetResolver.lookup('test_cases.my_heroes.Nope')
+        with pytest.raises(AttributeError):
+            TargetResolver.resolve('test_cases.my_heroes.Nope.flying', create=True)
+        with pytest.raises(ModuleNotFoundError):
+            TargetResolver.lookup('no_such_heroes.Nope')
+        with pytest.raises(AttributeError, match="no attribute or submodule 'no_such_heroes'"):
+            TargetResolver.walk('test_cases.no_such_heroes.Nope')
+    assert 'no_such_heroes' not in TargetResolver._root.children
+    assert 'Nope' not in TargetResolver._root.children['test_cases'].children['my_heroes'].children
+
+
+class TestDeepTargets(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_door_open = self.patch(
+            JusticeLeague.Hall.Door.open,
+            return_value="locked"
+        )
+        self.mock_who_is_in = self.patch(
+            f'{__name__}.JusticeLeague.Hall.who_is_in',
+            return_value="Batman"
+        )
+
+    def test_nested_class_targets(self):
+        assert JusticeLeague.Hall.Door.open() == "locked"
+        assert JusticeLeague.Hall().who_is_in() == "Batman"
+        assert self.mock_door_open.target_path.endswith('JusticeLeague.Hall.Door.open')
+
+    @pytest.mark.asyncio
+    async def test_string_target_of_inherited_async_method(self):
+        mock_which_hero = self.patch(
+            'test_cases.my_heroes.Batman.which_hero_i_am',
+            return_value="Robin"
+        )
+        assert mock_which_hero().__class__.__name__ == 'AsyncMock'
+        assert (await Batman.which_hero_i_am()).result() == "Robin"
+
+    def test_string_target_with_method(self):
+        mock_is_eating_banana = self.patch(
+            'test_cases.my_heroes.MyHeroes',
+            method='is_eating_banana',
+            return_value="banana"
+        )
+        assert MyHeroes().is_eating_banana() == "banana"
+        mock_is_eating_banana().assert_called_once()
+
+    def test_missing_string_target_created_twice(self):
+        for _ in range(2):
+            with pytest.raises(MockerBuilderException):
+                self.patch('test_cases.my_heroes.Nope.flying', create=True)
+
+    def test_single_part_string_target(self):
+        with pytest.raises(MockerBuilderException, match="module.attribute"):
+            self.patch('test_cases')
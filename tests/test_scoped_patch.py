@@ -0,0 +1,144 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.mocker_builder import MockerBuilderException, Patcher
+from mocker_builder.scoped_patch import ContextDispatcher, ThreadDispatcher
+from test_cases.my_heroes import Batman, HobbyHero, IHero, Robin
+
+
+class TestTaskScopedPatch(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(
+            target=Robin.just_says,
+            return_value="Holy mock, Batman!",
+            scope="task"
+        )
+
+    async def hobby_of(self, hobby: str, started: asyncio.Event) -> str:
+        self.patch(target=IHero.get_my_hero_hobby, return_value=hobby, scope="task")
+        await started.wait()
+        return Robin().get_my_hero_hobby()
+
+    def test_patched_from_setup(self):
+        assert isinstance(vars(Robin)['just_says'], ContextDispatcher)
+        assert Robin().just_says() == "Holy mock, Batman!"
+        self.mock_just_says.mock.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks(self):
+        started = asyncio.Event()
+        hobbies = asyncio.gather(*[
+            self.hobby_of(hobby, started) for hobby in ["fighting", "flying", "laughing"]
+        ])
+        await asyncio.sleep(0)
+        assert isinstance(vars(IHero)['get_my_hero_hobby'], ContextDispatcher)
+        started.set()
+        assert await hobbies == ["fighting", "flying", "laughing"]
+        assert 'get_my_hero_hobby' not in vars(Robin)
+        assert Robin(my_hobby=HobbyHero("sleeping")).get_my_hero_hobby().what_i_do == "sleeping"
+        assert Robin().just_says() == "Holy mock, Batman!"
+
+    def test_stop_and_start(self):
+        self.mock_just_says.stop()
+        assert Robin().just_says() != "Holy mock, Batman!"
+        self.mock_just_says.start()
+        assert Robin().just_says() == "Holy mock, Batman!"
+        assert not Patcher.active_patches('test_cases.my_heroes.Robin')
+
+    def test_unknown_scope(self):
+        with pytest.raises(MockerBuilderException, match="Unknown patch scope"):
+            self.patch(target=Robin.just_says, scope="galaxy")
+
+    def test_scope_and_everywhere(self):
+        with pytest.raises(MockerBuilderException, match="everywhere"):
+            self.patch(target=Robin.just_says, scope="task", everywhere=True)
+
+
+class TestThreadScopedPatch(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_just_says = self.patch(
+            target=Robin.just_says,
+            return_value="Holy thread, Batman!",
+            scope="thread"
+        )
+
+    def hobby_of(self, hobby: str, started: threading.Barrier) -> str:
+        self.patch(target=IHero.get_my_hero_hobby, return_value=hobby, scope="thread")
+        started.wait()
+        return Robin().get_my_hero_hobby()
+
+    def test_concurrent_threads(self):
+        hobbies = ["fighting", "flying", "laughing"]
+        started = threading.Barrier(len(hobbies))
+        with ThreadPoolExecutor(max_workers=len(hobbies)) as executor:
+            results = list(executor.map(self.hobby_of, hobbies, [started] * len(hobbies)))
+        assert results == hobbies
+        assert isinstance(vars(IHero)['get_my_hero_hobby'], ThreadDispatcher)
+        assert Robin(my_hobby=HobbyHero("sleeping")).get_my_hero_hobby().what_i_do == "sleeping"
+
+    def test_other_threads_see_original(self):
+        assert Robin().just_says() == "Holy thread, Batman!"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(lambda: Robin().just_says()).result() != "Holy thread, Batman!"
+
+    def test_task_scope_conflict(self):
+        with pytest.raises(MockerBuilderException, match="already patched with scope 'thread'"):
+            self.patch(target=Robin, method='just_says', scope="task")
+
+
+SCOPED = """
+import asyncio
+
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.scoped_patch import ContextDispatcher, ThreadDispatcher
+from test_cases.my_heroes import Batman, IHero, Robin
+
+
+class TestTaskScoped(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.patch(target=Robin.just_says, return_value="Holy mock, Batman!", scope="task")
+
+    @pytest.mark.asyncio
+    async def test_patched(self):
+        self.patch(target=IHero.get_my_hero_hobby, return_value="flying", scope="task")
+        await asyncio.sleep(0)
+        assert isinstance(vars(Robin)['just_says'], ContextDispatcher)
+        assert isinstance(vars(IHero)['get_my_hero_hobby'], ContextDispatcher)
+
+
+class TestThreadScoped(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.patch(target=Batman.eating_banana, return_value="no banana", scope="thread")
+
+    def test_patched(self):
+        assert isinstance(vars(Batman)['eating_banana'], ThreadDispatcher)
+
+
+def test_all_restored():
+    assert not isinstance(vars(Robin)['just_says'], ContextDispatcher)
+    assert not isinstance(vars(IHero)['get_my_hero_hobby'], ContextDispatcher)
+    assert Robin().just_says() != "Holy mock, Batman!"
+    assert not isinstance(vars(Batman)['eating_banana'], ThreadDispatcher)
+"""
+
+
+def test_restored_after_teardown(pytester):
+    pytester.makepyfile(test_scoped=SCOPED)
+    pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=3)
+    assert not isinstance(vars(Robin)['just_says'], ContextDispatcher)
+    assert not isinstance(vars(IHero)['get_my_hero_hobby'], ContextDispatcher)
+    assert not isinstance(vars(Batman)['eating_banana'], ThreadDispatcher)
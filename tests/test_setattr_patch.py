@@ -0,0 +1,90 @@
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.mocker_builder import MockerBuilderException, Patcher, _SetattrPatch
+from test_cases import my_heroes
+from test_cases.my_heroes import Batman, IHero, Robin
+
+
+class TestSetattrPatch(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_nickname = self.patch(
+            target=Batman,
+            attribute='nickname',
+            new="Dark Knight"
+        )
+
+    def test_plain_value_replaced(self):
+        assert isinstance(Patcher.mocked_metadata()[0]._patch, _SetattrPatch)
+        assert Batman.nickname == "Dark Knight"
+        assert self.mock_nickname.mock == "Dark Knight"
+
+    def test_restored_after_test(self):
+        self.mock_nickname.stop()
+        assert Batman.nickname == "Big Fat Bat"
+        self.mock_nickname.start()
+        assert Batman.nickname == "Dark Knight"
+
+    def test_missing_attribute(self):
+        with pytest.raises((AttributeError, MockerBuilderException)):
+            self.patch(target=Robin, attribute='cave', new="bat cave")
+
+    def test_create(self):
+        self.patch(target=my_heroes, attribute='gotham', new="city", create=True)
+        self.patch(target=Robin, attribute='boy_wonder', new=True, create=True)
+        assert my_heroes.gotham == "city"
+        assert Robin.boy_wonder is True
+
+    def test_inherited_attribute(self):
+        self.patch(target=Robin, attribute='get_my_hero_hobby', new="sidekick")
+        assert Robin.get_my_hero_hobby == "sidekick"
+        assert IHero.get_my_hero_hobby != "sidekick"
+
+    def test_overlapped_target_uses_mock_patch(self):
+        with pytest.warns(UserWarning, match="overlaps"):
+            self.patch(target=Batman, new=type('Bat', (Batman,), {}))
+        assert not isinstance(Patcher.mocked_metadata()[-1]._patch, _SetattrPatch)
+        assert my_heroes.Batman.__name__ == 'Bat'
+
+
+RESTORED = """
+import pytest
+
+from mocker_builder import MockerBuilder
+from test_cases import my_heroes
+from test_cases.my_heroes import Batman, IHero, Robin
+
+
+class TestPatched(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.patch(target=Batman, attribute='nickname', new="Dark Knight")
+        self.patch(target=my_heroes, attribute='gotham', new="city", create=True)
+        self.patch(target=Robin, attribute='boy_wonder', new=True, create=True)
+        self.patch(target=Robin, attribute='get_my_hero_hobby', new="sidekick")
+
+    def test_overlapped_target(self):
+        with pytest.warns(UserWarning, match="overlaps"):
+            self.patch(target=Batman, new=type('Bat', (Batman,), {}))
+        assert my_heroes.Batman.__name__ == 'Bat'
+
+    def test_overlapped_target_restored(self):
+        assert my_heroes.Batman is Batman
+        assert vars(Batman)['nickname'] == "Dark Knight"
+
+
+def test_all_restored():
+    assert Batman.nickname == "Big Fat Bat"
+    assert not hasattr(my_heroes, 'gotham')
+    assert not hasattr(Robin, 'boy_wonder')
+    assert 'get_my_hero_hobby' not in vars(Robin)
+    assert Robin.get_my_hero_hobby is IHero.get_my_hero_hobby
+"""
+
+
+def test_restored_after_teardown(pytester):
+    pytester.makepyfile(test_restored=RESTORED)
+    pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=3)
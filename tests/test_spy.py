@@ -0,0 +1,77 @@
+import os
+import sys
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.mocker_builder import MockerBuilderException, Patcher
+from mocker_builder.spy import MonitorSpy
+from test_cases.my_heroes import Batman, IHero, MyHeroes
+
+monitoring = pytest.mark.skipif(
+    sys.version_info < (3, 12),
+    reason="sys.monitoring is available from Python 3.12"
+)
+
+
+class TestSpy(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.my_heroes = MyHeroes()
+        self.my_heroes.my_hero = Batman()
+
+    def test_wrap_counts_calls(self):
+        eating_banana = Batman.eating_banana
+        spy_eating_banana = self.spy(Batman.eating_banana, mode="wrap")
+        assert spy_eating_banana.mode == "wrap"
+        spy_eating_banana.assert_not_called()
+        for _ in range(3):
+            assert self.my_heroes.is_eating_banana() == "is eating 5 banana(s)"
+        spy_eating_banana.assert_called_times(3)
+        assert Batman.eating_banana.__wrapped__ is eating_banana
+        spy_eating_banana.stop()
+        assert Batman.eating_banana is eating_banana
+        Batman().eating_banana()
+        assert spy_eating_banana.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_wrap_async_classmethod(self):
+        spy_which_hero = self.spy(IHero, method="which_hero_i_am", mode="wrap")
+        assert await Batman.which_hero_i_am() == "I am Batman"
+        assert spy_which_hero.called
+        assert isinstance(vars(IHero)['which_hero_i_am'], classmethod)
+
+    def test_builtin_falls_back_to_wrap(self):
+        spy_getcwd = self.spy("os.getcwd")
+        assert spy_getcwd.mode == "wrap"
+        assert os.getcwd()
+        spy_getcwd.assert_called_times(1)
+
+    def test_stopped_at_teardown(self):
+        spy_eating_banana = self.spy(Batman.eating_banana)
+        assert spy_eating_banana in Patcher._restore_log
+        with pytest.raises(AssertionError, match="called 2 times. Called 0 times"):
+            spy_eating_banana.assert_called_times(2)
+
+    def test_unknown_mode(self):
+        with pytest.raises(MockerBuilderException, match="Unknown spy mode 'trace'"):
+            self.spy(Batman.eating_banana, mode="trace")
+
+    @monitoring
+    def test_monitor_counts_every_reference(self):
+        eating_banana = Batman.eating_banana
+        spy_eating_banana = self.spy(Batman.eating_banana)
+        other_spy = self.spy(Batman.eating_banana)
+        assert spy_eating_banana.mode == "monitor"
+        assert Batman.eating_banana is eating_banana
+        self.my_heroes.is_eating_banana()
+        eating_banana(Batman())
+        assert (spy_eating_banana.calls, other_spy.calls) == (2, 2)
+        other_spy.stop()
+        spy_eating_banana.reset()
+        Batman().eating_banana()
+        assert (spy_eating_banana.calls, other_spy.calls) == (1, 2)
+        spy_eating_banana.stop()
+        assert MonitorSpy._tool_id is None
+        Batman().eating_banana()
+        assert spy_eating_banana.calls == 1
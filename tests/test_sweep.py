@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+
+from mocker_builder import MockerBuilder
+from mocker_builder.mocker_builder import MockerBuilderException
+from test_cases.my_heroes import Batman, HobbyHero, IHero, MyHeroes, Robin
+
+
+class TestSweep(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana"
+        )
+        self.mock_what_i_do = self.patch(
+            IHero.what_i_do_when_nobody_is_looking,
+            return_value=HobbyHero("I just drink wisky")
+        )
+        self.my_heroes = MyHeroes()
+        self.my_heroes.my_hero = Batman()
+
+    def test_sweep_return_values(self):
+        def eats(food):
+            for _ in range(food.count("a")):
+                assert self.my_heroes.is_eating_banana() == food
+            assert food != "apple", "Batman doesn't eat apples"
+
+        result = self.mock_eating_banana.sweep(["banana", "apple", "pear"], eats)
+        assert [case.calls for case in result.cases] == [3, 1, 1]
+        assert [case.index for case in result.failures] == [1]
+        assert "Batman doesn't eat apples" in str(result.failures[0].error)
+        self.mock_eating_banana().assert_called_once()
+        with pytest.raises(AssertionError, match="1 of 3 sweep cases"):
+            result.assert_passed()
+        assert self.my_heroes.is_eating_banana() == "doesn't like banana"
+
+    def test_sweep_side_effects(self):
+        def eats(effect):
+            return [self.my_heroes.is_eating_banana(), self.my_heroes.is_eating_banana()]
+
+        result = self.mock_eating_banana.sweep(
+            [ValueError("no banana"), ["banana", "apple"], lambda: "pear"],
+            eats,
+            side_effect=True
+        )
+        assert isinstance(result.cases[0].error, ValueError)
+        assert result.cases[1].passed and result.cases[2].passed
+        assert [case.calls for case in result.cases] == [1, 2, 2]
+
+    def test_sweep_async_body(self):
+        async def body(value):
+            pass
+
+        with pytest.raises(MockerBuilderException, match="asweep"):
+            self.mock_eating_banana.sweep([1], body)
+
+    def test_sweep_stopped_patch(self):
+        mock_wearing_pyjama = self.patch(Robin.wearing_pyjama)
+        mock_wearing_pyjama.stop()
+        with pytest.raises(MockerBuilderException, match="not started"):
+            mock_wearing_pyjama.sweep([1], print)
+
+    @pytest.mark.asyncio
+    async def test_asweep(self):
+        async def hobby(expected):
+            # Like set_result, async targets with no latency give back futures.
+            hero = await self.my_heroes.what_my_hero_does_when_nobody_is_looking()
+            assert hero.result().what_i_do == expected.what_i_do
+
+        hobbies = [HobbyHero("sing"), HobbyHero("dance"), HobbyHero("sleep")]
+        result = await self.mock_what_i_do.asweep(hobbies, hobby)
+        result.assert_passed()
+        hero = await self.my_heroes.what_my_hero_does_when_nobody_is_looking()
+        assert hero.result().what_i_do == "I just drink wisky"
+
+    @pytest.mark.asyncio
+    async def test_asweep_concurrently(self):
+        mock_which_hero = self.patch(
+            IHero,
+            method="which_hero_i_am",
+            latency=.01
+        )
+
+        async def which_hero(name):
+            await asyncio.sleep(.01 if name == "Batman" else 0)
+            assert await Batman.which_hero_i_am() == name
+
+        names = ["Batman", "Robin", "Joker"]
+        result = await mock_which_hero.asweep(names, which_hero, concurrency=3)
+        result.assert_passed()
+        assert [case.calls for case in result.cases] == [1, 1, 1]
+        assert mock_which_hero().call_count == 3
@@ -0,0 +1,96 @@
+import threading
+from unittest.mock import MagicMock, call
+import pytest
+
+from mocker_builder import MockerBuilder, MockerBuilderConfig
+from mocker_builder.mocker_builder import MockerBuilderException
+from mocker_builder.timeline import CallTimeline
+from test_cases.my_heroes import Batman, MyHeroes, Robin
+
+
+class TestCallTimeline(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(call_timeline=True)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(Batman.eating_banana, return_value="no banana")
+        self.mock_just_says = self.patch(Robin.just_says)
+        self.mock_wearing_pyjama = self.patch(Robin.wearing_pyjama, timeline=False)
+        self.my_heroes = MyHeroes()
+        self.my_heroes.my_hero = Batman()
+
+    def test_called_in_order(self):
+        robin = Robin()
+        assert self.my_heroes.is_eating_banana() == "no banana"
+        robin.wearing_pyjama()
+        robin.just_says("Holy crap!")
+        Batman().eating_banana()
+        self.assert_called_in_order(self.mock_eating_banana, self.mock_just_says)
+        self.assert_called_in_order(
+            self.mock_just_says(),
+            "test_cases.my_heroes.Batman.eating_banana",
+        )
+        self.assert_called_in_order(
+            (self.mock_just_says, call("Holy crap!")),
+            self.mock_eating_banana,
+        )
+        assert [entry.target_path for entry in self.timeline] == [
+            "test_cases.my_heroes.Batman.eating_banana",
+            "test_cases.my_heroes.Robin.just_says",
+            "test_cases.my_heroes.Batman.eating_banana",
+        ]
+
+    def test_out_of_order(self):
+        Robin().just_says(["unhashable"])
+        Batman().eating_banana()
+        with pytest.raises(AssertionError, match="matched 1 of 2"):
+            self.assert_called_in_order(self.mock_eating_banana, self.mock_just_says)
+        with pytest.raises(AssertionError, match="with the expected arguments"):
+            self.assert_called_in_order((self.mock_just_says, call(["other"])))
+        self.assert_called_in_order((self.mock_just_says, call(["unhashable"])))
+        with pytest.raises(AssertionError, match="not recorded"):
+            self.assert_called_in_order(self.mock_wearing_pyjama)
+        with pytest.raises(MockerBuilderException, match="not a mock patched"):
+            self.assert_called_in_order(object())
+
+    def test_mock_arguments(self):
+        hero = MagicMock()
+        Robin().just_says(hero, sidekick=hero)
+        assert hero.mock_calls == []
+        self.assert_called_in_order((self.mock_just_says, call(hero, sidekick=hero)))
+        with pytest.raises(AssertionError, match="with the expected arguments"):
+            self.assert_called_in_order((self.mock_just_says, call(MagicMock(), sidekick=hero)))
+        assert hero.mock_calls == []
+
+    def test_threads_keep_entries_whole(self):
+        def eat():
+            for _ in range(500):
+                Batman().eating_banana()
+
+        threads = [threading.Thread(target=eat) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(self.timeline) == 2000
+        assert {entry.target_path for entry in self.timeline} == {
+            "test_cases.my_heroes.Batman.eating_banana"
+        }
+
+
+class TestOptInTimeline(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(Batman.eating_banana, timeline=True)
+        self.mock_just_says = self.patch(Robin.just_says)
+
+    def test_opt_in(self):
+        Robin().just_says()
+        Batman().eating_banana()
+        assert len(self.timeline) == 1
+        assert not CallTimeline._every_patch
+
+    def test_new_value(self):
+        with pytest.raises(MockerBuilderException, match="timeline option"):
+            self.patch(Robin.wearing_pyjama, new="pyjama", timeline=True)
@@ -0,0 +1,99 @@
+import pytest
+
+from mocker_builder import BehaviorProfile, MockerBuilder
+from mocker_builder.mocker_builder import MockerBuilderException
+from test_cases.my_heroes import Batman, IHero, MyHeroes, Robin
+
+
+class TestTimedPatch(MockerBuilder):
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana",
+            timed=True
+        )
+        self.my_heroes = MyHeroes()
+        self.my_heroes.my_hero = Batman()
+
+    def test_hot_callers(self):
+        for _ in range(10):
+            assert self.my_heroes.is_eating_banana() == "doesn't like banana"
+        for _ in range(3):
+            Batman().eating_banana()
+        timings = self.mock_eating_banana.timings
+        assert timings.calls == 13
+        assert [caller.function for caller in timings.hot_callers()] == [
+            'is_eating_banana',
+            'test_hot_callers',
+        ]
+        assert [caller.calls for caller in timings.hot_callers()] == [10, 3]
+        assert timings.hot_callers()[0].filename.endswith('my_heroes.py')
+        assert timings.timestamps == sorted(timings.timestamps)
+        assert timings.call_rate() > 0
+        inter_arrival = timings.inter_arrival()
+        assert inter_arrival.min <= inter_arrival.p50 <= inter_arrival.p95 <= inter_arrival.max
+        assert str(timings).startswith("13 calls")
+
+    def test_side_effect_list(self):
+        mock_just_says = self.patch(
+            target=Robin,
+            method='just_says',
+            side_effect=["Holy", ValueError("mock")],
+            timed=True
+        )
+        assert Robin().just_says() == "Holy"
+        with pytest.raises(ValueError):
+            Robin().just_says()
+        assert mock_just_says.timings.calls == 2
+        assert mock_just_says.timings.inter_arrival().max > 0
+
+    def test_set_result(self):
+        Batman().eating_banana()
+        self.mock_eating_banana.set_result(return_value="likes banana")
+        assert Batman().eating_banana() == "likes banana"
+        assert self.mock_eating_banana.timings.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_async_caller(self):
+        mock_nobody_is_looking = self.patch(
+            IHero.what_i_do_when_nobody_is_looking,
+            return_value="sleeping",
+            timed=True
+        )
+        await self.my_heroes.what_my_hero_does_when_nobody_is_looking()
+        timings = mock_nobody_is_looking.timings
+        assert timings.calls == 1
+        assert timings.inter_arrival() is None
+        assert timings.hot_callers()[0].function == 'what_my_hero_does_when_nobody_is_looking'
+
+    @pytest.mark.asyncio
+    async def test_async_latency(self):
+        mock_nobody_is_looking = self.patch(
+            IHero.what_i_do_when_nobody_is_looking,
+            return_value="sleeping",
+            latency=.001,
+            timed=True
+        )
+        assert await self.my_heroes.what_my_hero_does_when_nobody_is_looking() == "sleeping"
+        assert mock_nobody_is_looking.timings.calls == 1
+
+    def test_behavior_schedule_kept(self):
+        mock_just_says = self.patch(
+            target=Robin,
+            method='just_says',
+            behavior=BehaviorProfile(seed=1),
+            timed=True
+        )
+        Robin().just_says()
+        assert mock_just_says.behavior_schedule.calls == 1
+        assert mock_just_says.timings.calls == 1
+
+    def test_not_timed(self):
+        mock_just_says = self.patch(target=Robin, method='just_says')
+        assert mock_just_says.timings is None
+
+    def test_timed_new(self):
+        with pytest.raises(MockerBuilderException, match="timed option"):
+            self.patch(target=Robin, method='just_says', new="Holy", timed=True)
@@ -0,0 +1,62 @@
+import json
+
+from mocker_builder.usage import UsageTracker
+
+EATING_BANANA = 'test_cases.my_heroes.Batman.eating_banana'
+WEARING_PYJAMA = 'test_cases.my_heroes.Robin.wearing_pyjama'
+JUST_SAYS = 'test_cases.my_heroes.Robin.just_says'
+JUST_CALL_FOR = 'test_cases.my_heroes.Batman.just_call_for'
+
+TRACKED = """
+from mocker_builder import MockerBuilder, MockerBuilderConfig
+from test_cases.my_heroes import Batman, Robin
+
+
+class TestUsageTracking(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(track_usage=True)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(Batman.eating_banana, return_value="no banana")
+        self.mock_wearing_pyjama = self.patch(target=Robin, method='wearing_pyjama')
+        self.mock_just_says = self.patch(target=Robin, method='just_says')
+        self.mock_just_call_for = self.patch(target=Batman, method='just_call_for')
+
+    def test_calls(self):
+        assert Batman().eating_banana() == "no banana"
+        self.patch(Batman.get_my_hero_hobby)
+
+    def test_accesses(self):
+        Robin().wearing_pyjama.return_value.size
+        Batman().eating_banana()
+
+    def test_nothing(self):
+        pass
+
+    def test_asserts(self):
+        self.mock_just_call_for.mock.assert_not_called()
+"""
+
+
+def test_usage_report(pytester):
+    pytester.makepyfile(test_tracked=TRACKED)
+    UsageTracker.reports.pop("test_tracked:TestUsageTracking", None)
+    pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=4)
+    report = UsageTracker.reports["test_tracked:TestUsageTracking"]
+    assert report.tests == {
+        'test_calls': [WEARING_PYJAMA, JUST_SAYS, JUST_CALL_FOR],
+        'test_accesses': [JUST_SAYS, JUST_CALL_FOR],
+        'test_nothing': [EATING_BANANA, WEARING_PYJAMA, JUST_SAYS, JUST_CALL_FOR],
+        'test_asserts': [EATING_BANANA, WEARING_PYJAMA, JUST_SAYS],
+    }
+    assert report.unused == [JUST_SAYS]
+    assert report.patches[EATING_BANANA].used_in == ['test_calls', 'test_accesses']
+    just_says = report.patches[JUST_SAYS]
+    assert just_says.setup_seconds > 0
+    assert just_says.estimated_savings == just_says.setup_seconds
+    assert report.estimated_savings > just_says.estimated_savings
+
+    exported = json.loads(UsageTracker.dumps())[report.test_class]
+    assert exported['unused'] == [JUST_SAYS]
+    assert exported['patches'][EATING_BANANA]['unused_in'] == ['test_nothing', 'test_asserts']
+    assert str(report).startswith(f"{report.test_class}: 1 of 4 patches never used")
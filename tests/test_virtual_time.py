@@ -0,0 +1,92 @@
+import asyncio
+import time
+import pytest
+
+from mocker_builder import MockerBuilder, VirtualTimeEventLoop
+from mocker_builder.mocker_builder import MockerBuilderException
+from test_cases.my_heroes import Batman, JusticeLeague
+
+
+class TestVirtualTimeEventLoop:
+
+    def test_sleep_advances_virtual_time(self):
+        loop = VirtualTimeEventLoop()
+        try:
+            started, real_started = loop.time(), time.perf_counter()
+            order = []
+
+            async def sleeper(name, delay):
+                await asyncio.sleep(delay)
+                order.append(name)
+
+            async def main():
+                await asyncio.gather(sleeper('slow', 30), sleeper('fast', 10))
+
+            loop.run_until_complete(main())
+            assert order == ['fast', 'slow']
+            assert loop.time() - started == pytest.approx(30, abs=.01)
+            assert time.perf_counter() - real_started < 1
+        finally:
+            loop.close()
+
+    def test_timeout_kept(self):
+        loop = VirtualTimeEventLoop()
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                loop.run_until_complete(asyncio.wait_for(asyncio.sleep(60), timeout=5))
+        finally:
+            loop.close()
+
+
+class TestLatency(MockerBuilder):
+
+    @pytest.fixture
+    def event_loop(self):
+        loop = VirtualTimeEventLoop()
+        yield loop
+        loop.close()
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_call_heroes = self.patch(
+            JusticeLeague.call_heroes,
+            return_value=[('Batman', 'Come on', 'Big Fat Bat')],
+            latency=2
+        )
+
+    @pytest.mark.asyncio
+    async def test_latency_on_virtual_time(self):
+        loop = asyncio.get_running_loop()
+        started, real_started = loop.time(), time.perf_counter()
+
+        assert await JusticeLeague().call_everybody() == [('Batman', 'Come on', 'Big Fat Bat')]
+        assert loop.time() - started == pytest.approx(3, abs=.01)
+        assert time.perf_counter() - real_started < 1
+        self.mock_call_heroes.mock.assert_awaited_once()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(JusticeLeague().call_everybody(), timeout=2.5)
+
+    @pytest.mark.asyncio
+    async def test_set_result_keeps_latency(self):
+        loop = asyncio.get_running_loop()
+        self.mock_call_heroes.set_result(side_effect=[[], ValueError("Nobody here")])
+        started = loop.time()
+
+        assert await JusticeLeague().call_heroes() == []
+        with pytest.raises(ValueError):
+            await JusticeLeague().call_heroes()
+        assert loop.time() - started == pytest.approx(4, abs=.01)
+
+    @pytest.mark.asyncio
+    async def test_heroes_sleeping(self):
+        self.patch(JusticeLeague.__init__)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async for result in JusticeLeague().are_heroes_sleeping():
+            assert result == "=== Heroes are awakened ==="
+        assert loop.time() - started == pytest.approx(.5, abs=.01)
+
+    def test_latency_on_sync_target(self):
+        with pytest.raises(MockerBuilderException, match="only available for async targets"):
+            self.patch(Batman.eating_banana, latency=1)
@@ -0,0 +1,88 @@
+import gc
+import weakref
+import pytest
+
+from mocker_builder import MockerBuilder, MockerBuilderConfig
+from mocker_builder.mocker_builder import (
+    MockerBuilderException,
+    Patcher,
+    TMockMetadata,
+    _PatchRecord,
+)
+from test_cases.my_heroes import Batman, Robin
+
+FINISHED = """
+import gc
+import weakref
+
+from mocker_builder import MockerBuilder, MockerBuilderConfig
+from test_cases.my_heroes import Batman
+
+FINISHED_MOCKS = []
+
+
+class TestKeepMock(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(leak_check=True)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana"
+        )
+
+    def test_keep_mock(self):
+        Batman().eating_banana(["banana"] * 1000)
+        FINISHED_MOCKS.append(weakref.ref(self.mock_eating_banana.mock))
+
+
+def test_finished_mocks_collected():
+    gc.collect()
+    assert FINISHED_MOCKS[0]() is None
+"""
+
+
+class TestWeakRegistry(MockerBuilder):
+    mocker_builder_config = MockerBuilderConfig(leak_check=True)
+
+    @MockerBuilder.initializer
+    def mocker_builder_setup(self):
+        self.mock_eating_banana = self.patch(
+            Batman.eating_banana,
+            return_value="doesn't like banana"
+        )
+
+    def test_stopped_patch_collectable(self):
+        mock_wearing_pyjama = self.patch(
+            target=Robin,
+            method='wearing_pyjama',
+            return_value="doesn't like pyjama"
+        )
+        mock_metadata = weakref.ref(Patcher.mocked_metadata()[-1])
+        mock_wearing_pyjama.stop()
+        del mock_wearing_pyjama
+        gc.collect()
+        assert mock_metadata() is None
+        assert len(Patcher._mocked_metadata) == 2
+        assert [md.target_path for md in Patcher.mocked_metadata()] == [
+            'test_cases.my_heroes.Batman.eating_banana'
+        ]
+
+
+def test_finished_mocks_collected(pytester):
+    pytester.makepyfile(test_finished=FINISHED)
+    pytester.runpytest('-p', 'no:cacheprovider').assert_outcomes(passed=2)
+
+
+def test_leak_check_fails_on_survivors(mocker):
+    mocker_backup = Patcher._mocker
+    Patcher._mocker = mocker
+    try:
+        survivor = mocker.MagicMock()
+        record = _PatchRecord(TMockMetadata(target_path='my.survivor', _mock=survivor))
+        with pytest.raises(MockerBuilderException, match="my.survivor"):
+            Patcher._check_leaks([record])
+        del survivor
+        Patcher._check_leaks([record])
+    finally:
+        Patcher._mocker = mocker_backup